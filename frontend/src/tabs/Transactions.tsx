@@ -294,7 +294,8 @@ export default function Transactions() {
           </select>
         </label>
         <span className="muted">
-          {txnsQ.data?.count ?? 0}{txnsQ.data?.has_more ? ` of ${txnsQ.data.total_count}` : ""} rows
+          {txnsQ.data?.count ?? 0}
+          {txnsQ.data?.has_more ? (txnsQ.data.total_count != null ? ` of ${txnsQ.data.total_count}` : "+") : ""} rows
         </span>
         {txnsQ.data?.has_more && (
           <span className="tag accent">limited to first {txnsQ.data.count.toLocaleString()} rows</span>
@@ -0,0 +1,125 @@
+"""Time transfer pairing on a synthetic ledger of matched transfers.
+
+Run with:
+
+    uv run python scripts/bench_link_transfers.py --transfers 50000
+
+A temporary ledger receives ``--transfers`` outgoing/incoming pairs spread
+over ten years across four accounts: same-listing security transfers, CAD/USD
+journals between paired listings, and cash transfers.  Every incoming leg lands
+within the match window of its outgoing leg, so the report also shows how many
+pairs were matched or left ambiguous.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from ledger.db import sqlite as sqlite_db
+from ledger.ingest.reconcile import link_transfers
+
+_INSERT = """
+    INSERT INTO transactions(
+        account_id, trade_date, txn_type, instrument_id, quantity,
+        position_delta, net_amount, cash_delta, currency
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _seed(db_path: Path, transfers: int, symbols: int, seed: int) -> None:
+    rng = random.Random(seed)
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        institution_id = sqlite_db.upsert_institution(conn, "BEN", "Benchmark")
+        accounts = {
+            currency: [
+                sqlite_db.upsert_account(
+                    conn,
+                    institution_id=institution_id,
+                    account_number=f"{currency}-{index}",
+                    base_currency=currency,
+                )
+                for index in range(2)
+            ]
+            for currency in ("CAD", "USD")
+        }
+        listings = []
+        for index in range(symbols):
+            cad_id = sqlite_db.upsert_instrument(
+                conn, asset_type="equity", symbol=f"S{index:04d}", currency="CAD"
+            )
+            usd_id = sqlite_db.upsert_instrument(
+                conn, asset_type="equity", symbol=f"S{index:04d}.U", currency="USD"
+            )
+            conn.execute(
+                """
+                INSERT INTO instrument_journal_pairs(from_instrument_id, to_instrument_id)
+                VALUES (?, ?)
+                """,
+                (cad_id, usd_id),
+            )
+            listings.append({"CAD": cad_id, "USD": usd_id})
+
+        start = date(2015, 1, 1)
+        rows = []
+        for _ in range(transfers):
+            out_date = start + timedelta(days=rng.randrange(3650))
+            in_date = (out_date + timedelta(days=rng.randrange(3))).isoformat()
+            out_date_text = out_date.isoformat()
+            quantity = float(rng.randrange(1, 1000))
+            kind = rng.random()
+            currency = rng.choice(("CAD", "USD"))
+            out_account, in_account = rng.sample(accounts[currency], 2)
+            listing = rng.choice(listings)
+            if kind < 0.5:
+                instrument_id = listing[currency]
+                rows.append((out_account, out_date_text, "transfer_out", instrument_id,
+                             quantity, -quantity, None, None, currency))
+                rows.append((in_account, in_date, "transfer_in", instrument_id,
+                             quantity, quantity, None, None, currency))
+            elif kind < 0.8:
+                other = "USD" if currency == "CAD" else "CAD"
+                in_account = rng.choice(accounts[other])
+                rows.append((out_account, out_date_text, "journal", listing[currency],
+                             -quantity, -quantity, None, None, currency))
+                rows.append((in_account, in_date, "journal", listing[other],
+                             quantity, quantity, None, None, other))
+            else:
+                amount = round(rng.uniform(10, 50000), 2)
+                rows.append((out_account, out_date_text, "transfer_out", None,
+                             None, None, -amount, -amount, currency))
+                rows.append((in_account, in_date, "transfer_in", None,
+                             None, None, amount, amount, currency))
+        conn.executemany(_INSERT, rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transfers", type=int, default=50_000)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--window", type=int, default=7, help="date_window_days")
+    parser.add_argument("--seed", type=int, default=20240101)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "ledger.sqlite"
+        started = time.perf_counter()
+        _seed(db_path, args.transfers, args.symbols, args.seed)
+        seeded = time.perf_counter() - started
+        started = time.perf_counter()
+        summary = link_transfers(db_path, date_window_days=args.window)
+        elapsed = time.perf_counter() - started
+    print(f"seeded {args.transfers} transfers in {seeded:.2f}s")
+    print(
+        f"link_transfers: {elapsed:.2f}s matched={summary['matched']}"
+        f" ambiguous={summary['ambiguous']} skipped={summary['skipped_missing_key']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
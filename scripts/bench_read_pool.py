@@ -0,0 +1,84 @@
+"""Measure API read latency with and without pooled SQLite read connections.
+
+Run with:
+
+    uv run python scripts/bench_read_pool.py --database data/ledger.sqlite --requests 200
+
+The database is copied into a temporary data directory first, so holdings
+cache writes made while serving requests never touch the original.  Each
+endpoint is warmed once, then requested ``--requests`` times per mode; the
+table reports p50/p95 milliseconds per request.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+ENDPOINTS = (
+    "/transactions?limit=100",
+    "/transactions/accounts",
+    "/transactions/symbols",
+    "/transactions/latest-date",
+    "/statements?limit=50",
+    "/performance/total",
+)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _measure(client, endpoint: str, requests: int) -> list[float]:
+    client.get(endpoint).raise_for_status()
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        client.get(endpoint).raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", type=Path, default=ROOT / "data" / "ledger.sqlite")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    if not args.database.exists():
+        print(f"database not found: {args.database}", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy2(args.database, Path(tmp) / "ledger.sqlite")
+        # Point ledger.config at the copy *before* importing the app.
+        os.environ["LEDGER_DATA_DIR"] = tmp
+        from fastapi.testclient import TestClient
+
+        from ledger.api.app import app
+        from ledger.db import sqlite as sqlite_db
+
+        sqlite_db.init_db(sqlite_db.SQLITE_PATH)
+        print(f"{'endpoint':<28} {'fresh p50':>10} {'fresh p95':>10} {'pooled p50':>11} {'pooled p95':>11}")
+        with TestClient(app) as client:
+            for endpoint in ENDPOINTS:
+                results = {}
+                for pooled in (False, True):
+                    sqlite_db.READ_POOL_ENABLED = pooled
+                    results[pooled] = _measure(client, endpoint, args.requests)
+                print(
+                    f"{endpoint:<28}"
+                    f" {statistics.median(results[False]):>10.2f} {_percentile(results[False], 0.95):>10.2f}"
+                    f" {statistics.median(results[True]):>11.2f} {_percentile(results[True], 0.95):>11.2f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ from __future__ import annotations
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ..db import duckdb_store
 from .routes import config as config_route
 from .routes import monthly, performance, research, statements, transactions, viz
 
@@ -27,4 +28,4 @@ app.include_router(statements.router)
 
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok"}
+    return {"status": "ok", "market_reader": duckdb_store.reader_stats()}
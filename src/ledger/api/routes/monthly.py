@@ -5,11 +5,11 @@ from datetime import date
 from pathlib import Path
 from typing import Annotated
 
-import duckdb
 from fastapi import APIRouter, Query
 
 from ...config import DUCKDB_PATH
-from ...holdings import holdings_at, latest_holdings_date
+from ...holdings import holdings_at, holdings_at_many, latest_holdings_date
+from ...market.asof import fx_grid
 
 router = APIRouter(prefix="/monthly", tags=["monthly"])
 
@@ -29,43 +29,6 @@ def _holdings_at(
     return holdings_at(as_of, account_ids, path=path)
 
 
-def _fx_rate(base: str, quote: str, as_of: str) -> tuple[float | None, str | None]:
-    if base == quote:
-        return 1.0, as_of
-    try:
-        con = duckdb.connect(str(DUCKDB_PATH), read_only=True)
-        try:
-            row = con.execute(
-                """
-                SELECT rate, rate_date
-                  FROM fx_rates
-                 WHERE base = ? AND quote = ? AND rate_date <= ?
-                 ORDER BY rate_date DESC
-                 LIMIT 1
-                """,
-                [base, quote, as_of],
-            ).fetchone()
-            if row:
-                return float(row[0]), str(row[1])
-            inverse = con.execute(
-                """
-                SELECT rate, rate_date
-                  FROM fx_rates
-                 WHERE base = ? AND quote = ? AND rate_date <= ?
-                 ORDER BY rate_date DESC
-                 LIMIT 1
-                """,
-                [quote, base, as_of],
-            ).fetchone()
-            if inverse and inverse[0]:
-                return 1.0 / float(inverse[0]), str(inverse[1])
-        finally:
-            con.close()
-    except Exception:
-        return None, None
-    return None, None
-
-
 def _snapshot_totals(rows: list[dict], as_of: str) -> dict:
     native: dict[str, float] = {}
     for row in rows:
@@ -73,8 +36,9 @@ def _snapshot_totals(rows: list[dict], as_of: str) -> dict:
         if not currency:
             continue
         native[currency] = native.get(currency, 0.0) + float(row.get("market_value") or 0.0)
-    usd_to_cad, cad_fx_date = _fx_rate("USD", "CAD", as_of)
-    cad_to_usd, usd_fx_date = _fx_rate("CAD", "USD", as_of)
+    rates = fx_grid([("USD", "CAD"), ("CAD", "USD")], [as_of], market_path=DUCKDB_PATH)
+    usd_to_cad, cad_fx_date = rates.get("USD/CAD", as_of) or (None, None)
+    cad_to_usd, usd_fx_date = rates.get("CAD/USD", as_of) or (None, None)
     combined: dict[str, float | str | None] = {}
     if usd_to_cad is not None:
         combined["CAD"] = native.get("CAD", 0.0) + native.get("USD", 0.0) * usd_to_cad
@@ -112,13 +76,14 @@ def diff(
 ) -> dict:
     accts = _csv_ints(account_id)
     a_text, b_text = a.isoformat(), b.isoformat()
+    holdings = holdings_at_many([a_text, b_text], accts)
     rows_a = {
         (row["account_id"], row["instrument_key"], row["currency"]): row
-        for row in _holdings_at(a_text, accts)
+        for row in holdings[a_text]
     }
     rows_b = {
         (row["account_id"], row["instrument_key"], row["currency"]): row
-        for row in _holdings_at(b_text, accts)
+        for row in holdings[b_text]
     }
     keys = set(rows_a) | set(rows_b)
     diffs = []
@@ -7,7 +7,7 @@ from pathlib import Path
 from fastapi import APIRouter, Query
 
 from ...db import sqlite as sqlite_db
-from ...holdings import holding_dates, holdings_at
+from ...holdings import holding_dates, holdings_series
 
 router = APIRouter(prefix="/performance", tags=["performance"])
 FORWARD_FILL_MAX_DAYS = 90
@@ -44,7 +44,7 @@ def _matching_account_ids(
         clauses.append(f"a.account_id IN ({','.join('?' * len(accounts))})")
         params.extend(accounts)
     db_path = path if path is not None else sqlite_db.SQLITE_PATH
-    with sqlite_db.session(db_path) as conn:
+    with sqlite_db.read_session(db_path) as conn:
         rows = conn.execute(
             """
             SELECT a.account_id
@@ -145,9 +145,9 @@ def _total_rows(
     symbols = {value.upper() for value in _csv_list(symbol)}
     values: dict[tuple[str, str], float] = {}
     currencies: set[str] = set()
-    for as_of in dates:
+    for as_of, holdings in holdings_series(dates, account_ids, path=path):
         rows = _filter_rows(
-            holdings_at(as_of, account_ids, path=path),
+            holdings,
             as_of=as_of,
             symbols=symbols,
             asset_type=asset_type,
@@ -189,8 +189,8 @@ def _cash_rows(
     if constrained and not account_ids:
         return []
     rows: list[dict] = []
-    for as_of in holding_dates(account_ids, path=path):
-        for holding in holdings_at(as_of, account_ids, path=path):
+    for as_of, holdings in holdings_series(holding_dates(account_ids, path=path), account_ids, path=path):
+        for holding in holdings:
             if holding["asset_type"] != "cash" or not holding["is_reported"]:
                 continue
             rows.append(
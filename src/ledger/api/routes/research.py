@@ -1,24 +1,26 @@
 """GET /research — per-ticker price + my trade markers + financials."""
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from datetime import date
 
 import duckdb
 from fastapi import APIRouter, Query
 
 from ...config import DUCKDB_PATH
+from ...db import duckdb_store
 from ...db import sqlite as sqlite_db
 from ...ticker_changes import TickerSegment, ticker_segments
 
 router = APIRouter(prefix="/research", tags=["research"])
 
 
-def _duck() -> duckdb.DuckDBPyConnection:
-    return duckdb.connect(str(DUCKDB_PATH), read_only=True)
+def _duck() -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+    return duckdb_store.read_cursor(DUCKDB_PATH)
 
 
 def _segments(symbol: str) -> list[TickerSegment]:
-    with sqlite_db.session() as conn:
+    with sqlite_db.read_session() as conn:
         rows = ticker_segments(conn, symbol.upper())
     return rows
 
@@ -45,7 +47,7 @@ def _market_symbols(segments: list[TickerSegment]) -> dict[int, str]:
     if not ids:
         return {}
     placeholders = ",".join("?" * len(ids))
-    with sqlite_db.session() as conn:
+    with sqlite_db.read_session() as conn:
         rows = conn.execute(
             f"""
             SELECT instrument_id, provider_symbol
@@ -89,11 +91,8 @@ def prices(symbol: str = Query(...), start: date | None = None,
         params.append(end.isoformat())
     sql = ("SELECT trade_date, symbol AS source_symbol, open, high, low, close, adj_close, volume "
            "FROM daily_prices WHERE " + " AND ".join(where) + " ORDER BY trade_date")
-    con = _duck()
-    try:
+    with _duck() as con:
         df = con.execute(sql, params).df()
-    finally:
-        con.close()
     if df.empty:
         return {**_metadata(sym, segments), "freq": freq, "rows": []}
 
@@ -118,7 +117,7 @@ def pandas_to_datetime(s):  # tiny indirection so import is lazy
 @router.get("/trades")
 def trades(symbol: str = Query(...)) -> dict:
     """Return MY transactions for a symbol — to overlay as markers."""
-    with sqlite_db.session() as conn:
+    with sqlite_db.read_session() as conn:
         segments = ticker_segments(conn, symbol.upper())
         ids = [segment.instrument_id for segment in segments]
         if not ids:
@@ -155,14 +154,11 @@ def financials(symbol: str = Query(...), period: str = Query("quarterly",
         )
     ) or [symbol.upper()]
     placeholders = ",".join("?" * len(symbols))
-    con = _duck()
-    try:
+    with _duck() as con:
         df = con.execute(
             f"SELECT * FROM {table} WHERE symbol IN ({placeholders}) ORDER BY period_end, symbol",
             symbols,
         ).df()
-    finally:
-        con.close()
     if df.empty:
         return {**_metadata(symbol.upper(), segments), "period": period, "rows": []}
     rank = {value: index for index, value in enumerate(symbols)}
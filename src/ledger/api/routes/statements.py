@@ -229,7 +229,7 @@ def _list_statement_rows(conn: sqlite3.Connection, limit: int) -> list[dict]:
 
 @router.get("")
 def list_statements(limit: int = Query(200, ge=1, le=2000)) -> dict:
-    with sqlite_db.session() as conn:
+    with sqlite_db.read_session() as conn:
         rows = _list_statement_rows(conn, limit)
     return {"rows": rows}
 
@@ -264,7 +264,7 @@ def _persisted_boxes(
     page_map: dict[int, dict] = {}
     line_map: dict[int, dict] = {}
     linked_evidence: set[int] = set()
-    with sqlite_db.session(path if path is not None else sqlite_db.SQLITE_PATH) as conn:
+    with sqlite_db.read_session(path if path is not None else sqlite_db.SQLITE_PATH) as conn:
         geometry_tables = {
             "source_pages",
             "source_lines",
@@ -482,7 +482,7 @@ def _load_statement_rows(statement_id: int, *, path: Path | str | None = None):
     tab matches the rows shown on its right side.
     """
     db_path = path if path is not None else sqlite_db.SQLITE_PATH
-    with sqlite_db.session(db_path) as conn:
+    with sqlite_db.read_session(db_path) as conn:
         s = conn.execute(
             "SELECT statement_id, account_id, period_start, period_end, "
             "       source_file_id FROM statements WHERE statement_id = ?",
@@ -876,7 +876,7 @@ def statement_pdf(statement_id: int):
     comes from the DB, but we still confirm the resolved path is contained
     under the statements dir / repo root before serving it.
     """
-    with sqlite_db.session() as conn:
+    with sqlite_db.read_session() as conn:
         row = conn.execute(
             "SELECT sf.relpath FROM statements s "
             " JOIN source_files sf ON sf.source_file_id = s.source_file_id "
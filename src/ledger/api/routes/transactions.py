@@ -3,13 +3,30 @@
 Filters accept either a single value or a comma-separated list. All filters
 AND together. ``min_abs_amount`` keeps rows whose ``ABS(net_amount)`` is at
 least that value.
+
+Rows are ordered newest first on ``(trade_date, row_id)``.  Each page returns
+``next_cursor``; passing it back as ``cursor`` continues strictly after the
+last row.  The cursor predicate filters the ``UNION ALL`` of transactions and
+initial positions before its top-``LIMIT`` sort, so a deep page sorts only the
+rows past the cursor instead of every row an offset would skip.  It is not a
+single index range scan: both union branches are still read.  ``total_count``
+is ``null`` unless ``include_total`` is set.
+
+``GET /transactions/export`` streams the same filtered rows as NDJSON or CSV
+straight from one SQLite cursor; ``ledger export transactions`` reuses it.
 """
 from __future__ import annotations
 
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
 from datetime import date
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from ...db import sqlite as sqlite_db
 from ...statement_selection import canonical_statement_clause
@@ -23,35 +40,40 @@ def _csv_list(v: str | None) -> list[str]:
     return [x.strip() for x in v.split(",") if x.strip()]
 
 
-@router.get("")
-def list_transactions(
-    start: Annotated[date | None, Query(description="ISO date inclusive")] = None,
-    end: Annotated[date | None, Query(description="ISO date inclusive")] = None,
-    institution: str | None = Query(None, description="comma-separated codes"),
-    account_id: str | None = Query(None, description="comma-separated ids"),
-    symbol: str | None = Query(None, description="comma-separated tickers"),
-    txn_type: str | None = Query(None, description="comma-separated types"),
-    min_abs_amount: float | None = Query(
-        None, description="keep |net_amount| >= this value"
-    ),
-    limit: int = 5000,
-) -> dict:
-    limit = min(max(limit, 1), 50_000)
+def _encode_cursor(row: dict) -> str:
+    return f"{row['trade_date']}|{row['row_id']}"
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    trade_date, _, row_id = cursor.partition("|")
+    try:
+        date.fromisoformat(trade_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="malformed transactions cursor") from None
+    if not row_id:
+        raise HTTPException(status_code=400, detail="malformed transactions cursor")
+    return trade_date, row_id
+
+
+def _ledger_rows_query(
+    *,
+    start: date | None,
+    end: date | None,
+    institution: str | None,
+    account_id: str | None,
+    symbol: str | None,
+    txn_type: str | None,
+    min_abs_amount: float | None,
+) -> tuple[str, str, list]:
+    """Return the ``ledger_rows`` CTE, its ``AND ...`` filter text, and params."""
     canonical_sql = canonical_statement_clause("t.statement_id")
-    rows_sql = f"""
+    ledger_rows_sql = f"""
         WITH ledger_rows AS (
             SELECT 'transaction' AS row_kind,
                    'transaction:' || t.transaction_id AS row_id,
                    t.transaction_id, NULL AS initial_id, t.statement_id,
                    t.evidence_id, geometry.status AS geometry_status,
-                   (SELECT GROUP_CONCAT(DISTINCT page.page_number)
-                      FROM source_evidence_lines evidence_line
-                      JOIN source_lines source_line
-                        ON source_line.source_line_id = evidence_line.source_line_id
-                      JOIN source_pages page
-                        ON page.source_page_id = source_line.source_page_id
-                     WHERE evidence_line.evidence_id = t.evidence_id)
-                     AS geometry_pages,
+                   geometry.page_numbers AS geometry_pages,
                    t.trade_date, t.settle_date, t.txn_type,
                    t.quantity, t.price, t.gross_amount, t.commission,
                    t.other_fees, t.net_amount, t.currency, t.description,
@@ -101,7 +123,6 @@ def list_transactions(
               JOIN institutions i ON i.institution_id = a.institution_id
               JOIN instruments inst ON inst.instrument_id = ip.instrument_id
         )
-        SELECT * FROM ledger_rows WHERE 1=1
     """
     filters: list[str] = []
     params: list = []
@@ -135,45 +156,234 @@ def list_transactions(
         filters.append(" AND ABS(COALESCE(net_amount, 0)) >= ?")
         params.append(min_abs_amount)
 
-    with sqlite_db.session(sqlite_db.SQLITE_PATH) as conn:
-        all_rows = [
+    return ledger_rows_sql, "".join(filters), params
+
+
+def _with_source_ref(row: dict) -> dict:
+    geometry_pages = sorted({
+        int(page)
+        for page in str(row.pop("geometry_pages", "") or "").split(",")
+        if page.isdigit()
+    })
+    status = row.pop("geometry_status", None)
+    evidence_id = row.pop("evidence_id", None)
+    row["source_ref"] = (
+        {
+            "statement_id": row["statement_id"],
+            "kind": "transaction",
+            "id": row["transaction_id"],
+            "geometry_status": status,
+            "page_numbers": geometry_pages,
+            "linkable": status in {"exact", "unique_tokens"}
+            and bool(geometry_pages),
+        }
+        if row["statement_id"] is not None
+        and row["transaction_id"] is not None
+        and evidence_id is not None
+        else None
+    )
+    return row
+
+
+@router.get("")
+def list_transactions(
+    start: Annotated[date | None, Query(description="ISO date inclusive")] = None,
+    end: Annotated[date | None, Query(description="ISO date inclusive")] = None,
+    institution: str | None = Query(None, description="comma-separated codes"),
+    account_id: str | None = Query(None, description="comma-separated ids"),
+    symbol: str | None = Query(None, description="comma-separated tickers"),
+    txn_type: str | None = Query(None, description="comma-separated types"),
+    min_abs_amount: float | None = Query(
+        None, description="keep |net_amount| >= this value"
+    ),
+    limit: int = 5000,
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page")
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="also run COUNT(*) for total_count")
+    ] = True,
+) -> dict:
+    limit = min(max(limit, 1), 50_000)
+    ledger_rows_sql, where_sql, params = _ledger_rows_query(
+        start=start,
+        end=end,
+        institution=institution,
+        account_id=account_id,
+        symbol=symbol,
+        txn_type=txn_type,
+        min_abs_amount=min_abs_amount,
+    )
+    page_sql, page_params = where_sql, list(params)
+    if cursor:
+        after_date, after_row_id = _decode_cursor(cursor)
+        page_sql += " AND (trade_date < ? OR (trade_date = ? AND row_id < ?))"
+        page_params.extend([after_date, after_date, after_row_id])
+
+    with sqlite_db.read_session(sqlite_db.SQLITE_PATH) as conn:
+        rows = [
             dict(row)
             for row in conn.execute(
-                rows_sql + "".join(filters) + " ORDER BY trade_date DESC, row_id DESC",
-                params,
-            ).fetchall()
+                ledger_rows_sql
+                + " SELECT * FROM ledger_rows WHERE 1=1"
+                + page_sql
+                + " ORDER BY trade_date DESC, row_id DESC LIMIT ?",
+                [*page_params, limit + 1],
+            )
         ]
-    total_count = len(all_rows)
-    rows = all_rows[:limit]
-    for row in rows:
-        geometry_pages = sorted({
-            int(page)
-            for page in str(row.pop("geometry_pages", "") or "").split(",")
-            if page.isdigit()
-        })
-        status = row.pop("geometry_status", None)
-        evidence_id = row.pop("evidence_id", None)
-        row["source_ref"] = (
-            {
-                "statement_id": row["statement_id"],
-                "kind": "transaction",
-                "id": row["transaction_id"],
-                "geometry_status": status,
-                "page_numbers": geometry_pages,
-                "linkable": status in {"exact", "unique_tokens"}
-                and bool(geometry_pages),
-            }
-            if row["statement_id"] is not None
-            and row["transaction_id"] is not None
-            and evidence_id is not None
+        total_count = (
+            conn.execute(
+                ledger_rows_sql + " SELECT COUNT(*) FROM ledger_rows WHERE 1=1" + where_sql,
+                params,
+            ).fetchone()[0]
+            if include_total
             else None
         )
-    return {"rows": rows, "count": len(rows), "total_count": total_count, "has_more": total_count > len(rows)}
+    has_more = len(rows) > limit
+    del rows[limit:]
+    next_cursor = _encode_cursor(rows[-1]) if has_more else None
+    for row in rows:
+        _with_source_ref(row)
+    return {
+        "rows": rows,
+        "count": len(rows),
+        "total_count": total_count,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
+
+
+# Rows per chunk handed to the response body; bounds memory regardless of ledger size.
+EXPORT_BATCH_ROWS = 500
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+_SOURCE_COLUMNS = {"evidence_id", "geometry_status", "geometry_pages"}
+
+
+def open_transaction_export(
+    *,
+    path: Path | str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    institution: str | None = None,
+    account_id: str | None = None,
+    symbol: str | None = None,
+    txn_type: str | None = None,
+    min_abs_amount: float | None = None,
+) -> tuple[list[str], Iterator[dict]]:
+    """Return the flat export columns and a lazy iterator over every filtered row.
+
+    Rows come newest first from one read-only cursor, shaped like
+    ``list_transactions`` rows.  The connection closes when the iterator is
+    exhausted or closed.
+
+    The newest-first order needs a sort over the whole filtered ``UNION ALL``
+    before the first row streams.  The export connection therefore keeps
+    SQLite's temp files on disk: the sorter holds at most ``cache_size`` in
+    memory and spills the rest.  Memory stays bounded, but the first row still
+    waits for that sort, and the spill needs temp disk proportional to the
+    filtered rows.
+    """
+    ledger_rows_sql, where_sql, params = _ledger_rows_query(
+        start=start,
+        end=end,
+        institution=institution,
+        account_id=account_id,
+        symbol=symbol,
+        txn_type=txn_type,
+        min_abs_amount=min_abs_amount,
+    )
+    conn = sqlite_db.connect_readonly(
+        path if path is not None else sqlite_db.SQLITE_PATH,
+        check_same_thread=False,
+    )
+    try:
+        # READ_PRAGMAS sort in memory; let this whole-ledger sort spill to disk.
+        conn.execute("PRAGMA temp_store = FILE")
+        cursor = conn.execute(
+            ledger_rows_sql
+            + " SELECT * FROM ledger_rows WHERE 1=1"
+            + where_sql
+            + " ORDER BY trade_date DESC, row_id DESC",
+            params,
+        )
+    except Exception:
+        conn.close()
+        raise
+    columns = [column[0] for column in cursor.description if column[0] not in _SOURCE_COLUMNS]
+
+    def rows() -> Iterator[dict]:
+        try:
+            for row in cursor:
+                yield _with_source_ref(dict(row))
+        finally:
+            conn.close()
+
+    return columns, rows()
+
+
+def export_chunks(
+    columns: list[str],
+    rows: Iterable[dict],
+    export_format: Literal["ndjson", "csv"],
+) -> Iterator[str]:
+    """Encode rows as NDJSON lines or CSV (header first), a batch per chunk.
+
+    CSV carries the flat columns only; NDJSON rows keep ``source_ref``.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if export_format == "csv":
+        writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        if export_format == "csv":
+            writer.writerow([row[column] for column in columns])
+        else:
+            buffer.write(json.dumps(row, separators=(",", ":")))
+            buffer.write("\n")
+        pending += 1
+        if pending >= EXPORT_BATCH_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/export")
+def export_transactions(
+    format: Annotated[Literal["ndjson", "csv"], Query(description="ndjson or csv")] = "ndjson",
+    start: Annotated[date | None, Query(description="ISO date inclusive")] = None,
+    end: Annotated[date | None, Query(description="ISO date inclusive")] = None,
+    institution: Annotated[str | None, Query(description="comma-separated codes")] = None,
+    account_id: Annotated[str | None, Query(description="comma-separated ids")] = None,
+    symbol: Annotated[str | None, Query(description="comma-separated tickers")] = None,
+    txn_type: Annotated[str | None, Query(description="comma-separated types")] = None,
+    min_abs_amount: Annotated[
+        float | None, Query(description="keep |net_amount| >= this value")
+    ] = None,
+) -> StreamingResponse:
+    """Stream every filtered ledger row without building the result in memory."""
+    columns, rows = open_transaction_export(
+        start=start,
+        end=end,
+        institution=institution,
+        account_id=account_id,
+        symbol=symbol,
+        txn_type=txn_type,
+        min_abs_amount=min_abs_amount,
+    )
+    return StreamingResponse(
+        export_chunks(columns, rows, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format}"'},
+    )
 
 
 @router.get("/accounts")
 def accounts() -> dict:
-    with sqlite_db.session(sqlite_db.SQLITE_PATH) as conn:
+    with sqlite_db.read_session(sqlite_db.SQLITE_PATH) as conn:
         rows = [dict(r) for r in conn.execute(
             "SELECT a.account_id, a.account_number, a.account_type, a.nickname, "
             "       a.base_currency, i.code AS institution_code, i.display_name AS institution_name "
@@ -185,7 +395,7 @@ def accounts() -> dict:
 
 @router.get("/symbols")
 def symbols() -> dict:
-    with sqlite_db.session(sqlite_db.SQLITE_PATH) as conn:
+    with sqlite_db.read_session(sqlite_db.SQLITE_PATH) as conn:
         rows = [dict(r) for r in conn.execute(
             "SELECT DISTINCT COALESCE(i.option_root, i.symbol) AS symbol, "
             "       i.asset_type, i.currency FROM instruments i "
@@ -204,7 +414,7 @@ def symbols() -> dict:
 @router.get("/txn-types")
 def txn_types() -> dict:
     """Distinct transaction types actually present in the DB."""
-    with sqlite_db.session(sqlite_db.SQLITE_PATH) as conn:
+    with sqlite_db.read_session(sqlite_db.SQLITE_PATH) as conn:
         rows = [r[0] for r in conn.execute(
             "SELECT txn_type FROM ("
             "SELECT DISTINCT txn_type FROM transactions "
@@ -216,7 +426,7 @@ def txn_types() -> dict:
 
 @router.get("/latest-date")
 def latest_date() -> dict:
-    with sqlite_db.session(sqlite_db.SQLITE_PATH) as conn:
+    with sqlite_db.read_session(sqlite_db.SQLITE_PATH) as conn:
         row = conn.execute(
             "SELECT MAX(as_of_date) FROM position_snapshots"
         ).fetchone()
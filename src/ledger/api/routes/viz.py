@@ -1,39 +1,37 @@
 """GET /viz — sector rotation, treemap, correlation matrix data feeds."""
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Annotated
 
 import duckdb
 from fastapi import APIRouter, Query
-from tenacity import retry, stop_after_attempt, wait_fixed
 
 from ...config import DUCKDB_PATH
+from ...db import duckdb_store
 from ...holdings import holdings_at, latest_holdings_date
 
 router = APIRouter(prefix="/viz", tags=["viz"])
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(0.25))
-def _duck() -> duckdb.DuckDBPyConnection:
-    return duckdb.connect(str(DUCKDB_PATH), read_only=True)
+def _duck() -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+    return duckdb_store.read_cursor(DUCKDB_PATH)
 
 
 def _symbol_profiles(symbols: list[str]) -> dict[str, dict[str, str | None]]:
     if not symbols:
         return {}
-    con = _duck()
-    try:
-        ph = ",".join(["?"] * len(symbols))
-        rows = con.execute(
-            f"SELECT symbol, sector, industry FROM symbol_profiles WHERE symbol IN ({ph})",
-            symbols,
-        ).fetchall()
-    except Exception:
-        return {}
-    finally:
-        con.close()
+    with _duck() as con:
+        try:
+            ph = ",".join(["?"] * len(symbols))
+            rows = con.execute(
+                f"SELECT symbol, sector, industry FROM symbol_profiles WHERE symbol IN ({ph})",
+                symbols,
+            ).fetchall()
+        except Exception:
+            return {}
     return {r[0]: {"sector": r[1], "industry": r[2]} for r in rows}
 
 
@@ -91,37 +89,35 @@ def _symbol_performance(symbols: list[str], as_of: str, period: str) -> dict[str
         return {}
     start = _period_start(as_of, period)
     out: dict[str, float | None] = {}
-    con = _duck()
-    try:
-        for symbol in symbols:
-            end_row = con.execute(
-                """
-                SELECT adj_close FROM daily_prices
-                 WHERE symbol = ? AND trade_date <= ?
-                   AND adj_close IS NOT NULL
-                 ORDER BY trade_date DESC
-                 LIMIT 1
-                """,
-                [symbol, as_of],
-            ).fetchone()
-            start_row = con.execute(
-                """
-                SELECT adj_close FROM daily_prices
-                 WHERE symbol = ? AND trade_date <= ?
-                   AND adj_close IS NOT NULL
-                 ORDER BY trade_date DESC
-                 LIMIT 1
-                """,
-                [symbol, start],
-            ).fetchone()
-            if not end_row or not start_row or not start_row[0]:
-                out[symbol] = None
-            else:
-                out[symbol] = (float(end_row[0]) / float(start_row[0]) - 1.0) * 100.0
-    except Exception:
-        return {symbol: None for symbol in symbols}
-    finally:
-        con.close()
+    with _duck() as con:
+        try:
+            for symbol in symbols:
+                end_row = con.execute(
+                    """
+                    SELECT adj_close FROM daily_prices
+                     WHERE symbol = ? AND trade_date <= ?
+                       AND adj_close IS NOT NULL
+                     ORDER BY trade_date DESC
+                     LIMIT 1
+                    """,
+                    [symbol, as_of],
+                ).fetchone()
+                start_row = con.execute(
+                    """
+                    SELECT adj_close FROM daily_prices
+                     WHERE symbol = ? AND trade_date <= ?
+                       AND adj_close IS NOT NULL
+                     ORDER BY trade_date DESC
+                     LIMIT 1
+                    """,
+                    [symbol, start],
+                ).fetchone()
+                if not end_row or not start_row or not start_row[0]:
+                    out[symbol] = None
+                else:
+                    out[symbol] = (float(end_row[0]) / float(start_row[0]) - 1.0) * 100.0
+        except Exception:
+            return {symbol: None for symbol in symbols}
     return out
 
 
@@ -178,16 +174,13 @@ def correlation(
     symbols = _held_symbols_at(end_text, accts)
     if not symbols:
         return {"symbols": [], "matrix": []}
-    con = _duck()
-    try:
+    with _duck() as con:
         placeholders = ",".join(["?"] * len(symbols))
         df = con.execute(
             f"SELECT symbol, trade_date, adj_close FROM daily_prices "
             f"WHERE symbol IN ({placeholders}) AND trade_date BETWEEN ? AND ?",
             [*symbols, start_text, end_text],
         ).df()
-    finally:
-        con.close()
     if df.empty:
         return {"symbols": symbols, "matrix": []}
     p = df.pivot(index="trade_date", columns="symbol", values="adj_close").pct_change()
@@ -210,8 +203,7 @@ def rrg(
     end_text = end.isoformat() if end is not None else None
     as_of = _resolve_as_of(end_text)
     symbols = _held_symbols_at(as_of, accts) if as_of else []
-    con = _duck()
-    try:
+    with _duck() as con:
         priced = {r[0] for r in con.execute(
             "SELECT DISTINCT symbol FROM daily_prices"
         ).fetchall()}
@@ -235,8 +227,6 @@ def rrg(
             sql += " AND trade_date <= ?"
             params.append(end_text)
         df = con.execute(sql, params).df()
-    finally:
-        con.close()
     if df.empty:
         return {"frames": []}
     profiles = _symbol_profiles(symbols)
@@ -168,6 +168,7 @@ def audit_extraction_command(
         output=report_path,
         institution=institution,
         limit=limit,
+        text_cache_dir=config.DATA_DIR / config.PDF_TEXT_CACHE_DIRNAME,
     )
     click.echo(
         f"Audited {summary['files']} files: {summary['parsed_files']} valid, "
@@ -391,9 +392,95 @@ def ingest() -> None:
 @click.option("--institution", default=None, help="Restrict to one folder name.")
 @click.option("--limit", type=int, default=None, help="Stop after N PDFs.")
 @click.option("--force", is_flag=True, help="Re-parse PDFs even when sha256 is unchanged.")
-def ingest_run(institution: str | None, limit: int | None, force: bool) -> None:
+@click.option("--jobs", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Worker processes for extraction, parsing, and a full reconcile; "
+                   "writes stay serial.")
+@click.option("--verify-hashes", is_flag=True,
+              help="Rehash every PDF instead of trusting unchanged size/mtime/inode.")
+@click.option("--full", "full_reconcile", is_flag=True,
+              help="Reconcile the whole ledger, not only the scopes this run changed.")
+def ingest_run(
+    institution: str | None,
+    limit: int | None,
+    force: bool,
+    jobs: int,
+    verify_hashes: bool,
+    full_reconcile: bool,
+) -> None:
     from .ingest.pipeline import run_ingest
-    run_ingest(institution=institution, limit=limit, force=force)
+    run_ingest(
+        institution=institution,
+        limit=limit,
+        force=force,
+        jobs=jobs,
+        verify_hashes=verify_hashes,
+        full_reconcile=full_reconcile,
+    )
+
+
+@ingest.command("plan")
+@click.option("--institution", default=None, help="Restrict to one folder name.")
+@click.option("--limit", type=int, default=None, help="Stop after N PDFs.")
+@click.option("--force", is_flag=True, help="Plan as if --force were passed to ingest run.")
+@click.option("--verify-hashes", is_flag=True,
+              help="Rehash every PDF instead of trusting unchanged size/mtime/inode.")
+@click.option("--all", "show_all", is_flag=True, help="Also list sources that would be skipped.")
+def ingest_plan(
+    institution: str | None, limit: int | None, force: bool, verify_hashes: bool, show_all: bool
+) -> None:
+    """Dry run: list the PDFs ``ingest run`` would parse and why."""
+    from .ingest.pipeline import plan_ingest
+
+    out = plan_ingest(
+        institution=institution, limit=limit, force=force, verify_hashes=verify_hashes
+    )
+    reasons: dict[str, int] = {}
+    for source in out["sources"]:
+        reason = source["reason"]
+        if reason is not None:
+            reasons[reason] = reasons.get(reason, 0) + 1
+            click.echo(f"parse  {source['relpath']}  ({reason})")
+        elif show_all:
+            click.echo(f"skip   {source['relpath']}")
+    click.echo(
+        f"{out['to_parse']} of {out['scanned']} PDFs would be parsed"
+        + "".join(f"; {reason}: {count}" for reason, count in sorted(reasons.items()))
+        + (" (limit reached)." if out["limited"] else ".")
+    )
+
+
+@ingest.command("profile")
+@click.option("--limit", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Number of slowest files to list.")
+def ingest_profile(limit: int) -> None:
+    """Show the slowest sources and stages from recorded ingest timings."""
+    from .ingest.pipeline import ingest_profile as profile
+
+    out = profile(limit=limit)
+    if not out["profiled"]:
+        click.echo("No timed ingestion runs recorded; run `ledger ingest run` first.")
+        return
+
+    def slowest(stages: dict[str, dict[str, float]]) -> str:
+        return ", ".join(
+            f"{stage} {spent['wall_ms']:.1f}"
+            for stage, spent in sorted(stages.items(), key=lambda item: -item[1]["wall_ms"])
+        )
+
+    click.echo(f"Slowest {len(out['files'])} of {out['profiled']} sources (wall ms):")
+    for item in out["files"]:
+        click.echo(
+            f"  {item['wall_ms']:>10.1f}  cpu {item['cpu_ms']:>10.1f}  "
+            f"{item['parser_name']}@{item['parser_version']}  {item['relpath']}  "
+            f"[{item['status']}: {slowest(item['stages'])}]"
+        )
+    click.echo("Per parser version (wall ms):")
+    for group in out["parsers"]:
+        click.echo(
+            f"  {group['parser_name']}@{group['parser_version']}: {group['files']} file(s), "
+            f"{group['wall_ms']:.1f} wall / {group['cpu_ms']:.1f} cpu; "
+            f"{slowest(group['stages'])}"
+        )
 
 
 @ingest.command("enrich-layout")
@@ -517,11 +604,13 @@ def ingest_resolve_instruments(verify_yahoo: bool) -> None:
 
 
 @ingest.command("reconcile")
-def ingest_reconcile() -> None:
+@click.option("--jobs", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Worker processes building results per account; writes stay serial.")
+def ingest_reconcile(jobs: int) -> None:
     """Rebuild transfer links, movement attribution, and reconciliation results."""
     from .ingest.reconcile import reconcile_after_ingest
 
-    out = reconcile_after_ingest()
+    out = reconcile_after_ingest(jobs=jobs)
     instrument_names = out["instrument_names"]
     transfers = out["transfers"]
     positions = out["positions"]
@@ -658,6 +747,54 @@ def market_refresh_all(lookback_years: int) -> None:
     refresh_fx(lookback_years=lookback_years)
 
 
+# ----------------------------------------------------------------------- export
+@main.group("export")
+def export_group() -> None:
+    """Stream ledger rows for scripted pulls."""
+
+
+@export_group.command("transactions")
+@click.option("--format", "export_format", type=click.Choice(["ndjson", "csv"]),
+              default="ndjson", show_default=True)
+@click.option("--output", type=click.Path(path_type=Path, dir_okay=False), default=None,
+              help="Write to this file instead of stdout.")
+@click.option("--start", type=click.DateTime(formats=["%Y-%m-%d"]), default=None,
+              help="ISO date inclusive.")
+@click.option("--end", type=click.DateTime(formats=["%Y-%m-%d"]), default=None,
+              help="ISO date inclusive.")
+@click.option("--institution", default=None, help="Comma-separated institution codes.")
+@click.option("--account-id", default=None, help="Comma-separated account IDs.")
+@click.option("--symbol", default=None, help="Comma-separated tickers.")
+@click.option("--txn-type", default=None, help="Comma-separated transaction types.")
+@click.option("--min-abs-amount", type=float, default=None, help="Keep |net_amount| >= this value.")
+def export_transactions(
+    export_format: str,
+    output: Path | None,
+    start,
+    end,
+    institution: str | None,
+    account_id: str | None,
+    symbol: str | None,
+    txn_type: str | None,
+    min_abs_amount: float | None,
+) -> None:
+    """Export transactions and opening positions, newest first, like GET /transactions/export."""
+    from .api.routes.transactions import export_chunks, open_transaction_export
+
+    columns, rows = open_transaction_export(
+        start=start.date() if start else None,
+        end=end.date() if end else None,
+        institution=institution,
+        account_id=account_id,
+        symbol=symbol,
+        txn_type=txn_type,
+        min_abs_amount=min_abs_amount,
+    )
+    with click.open_file(str(output) if output else "-", "w", encoding="utf-8") as out:
+        for chunk in export_chunks(columns, rows, export_format):
+            out.write(chunk)
+
+
 # ------------------------------------------------------------------------ serve
 @main.command("serve")
 @click.option("--host", default="127.0.0.1")
@@ -27,6 +27,8 @@ else:
 
 LOG_DIR = ROOT / "logs"
 TEXT_DUMP_DIR = DATA_DIR / "text_dumps"
+# Content-addressed extraction cache; ingest keeps it beside its target database.
+PDF_TEXT_CACHE_DIRNAME = "pdf_text_cache"
 
 SQLITE_PATH = DATA_DIR / "ledger.sqlite"
 DUCKDB_PATH = DATA_DIR / "market.duckdb"
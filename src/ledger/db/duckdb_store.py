@@ -1,9 +1,14 @@
-"""DuckDB schema for market and fundamentals data."""
+"""DuckDB schema for market and fundamentals data, plus the shared API reader."""
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import duckdb
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_fixed
 
 from ..config import DUCKDB_PATH
 
@@ -127,7 +132,29 @@ CREATE TABLE IF NOT EXISTS scrape_log (
 """
 
 
+def _is_lock_conflict(exc: BaseException) -> bool:
+    """Match DuckDB's file-lock conflicts, whichever ``duckdb.Error`` carries them.
+
+    Another process's lock surfaces as ``IOException`` ("Could not set lock");
+    a same-process connection with other settings as ``ConnectionException``
+    ("different configuration").  Any other error is raised at once.
+    """
+    if not isinstance(exc, duckdb.Error):
+        return False
+    message = str(exc)
+    return "Could not set lock" in message or "different configuration" in message
+
+
+@retry(
+    retry=retry_if_exception(_is_lock_conflict),
+    stop=stop_after_attempt(8),
+    wait=wait_fixed(1.0),
+    reraise=True,
+)
 def connect(path: Path | str = DUCKDB_PATH) -> duckdb.DuckDBPyConnection:
+    # DuckDB refuses a writable connection beside a read-only one in the same
+    # process; another process's shared reader is released once idle, so wait.
+    close_readers(path)
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     return duckdb.connect(str(path))
 
@@ -138,3 +165,131 @@ def init_db(path: Path | str = DUCKDB_PATH) -> None:
         con.execute(DDL)
     finally:
         con.close()
+
+
+# Seconds an unused shared reader stays open.  Releasing it lets another
+# process (``ledger market refresh``) take DuckDB's exclusive write lock.
+READER_IDLE_SECONDS = 5.0
+
+
+@dataclass
+class _SharedReader:
+    conn: duckdb.DuckDBPyConnection
+    identity: tuple[int, int]
+    leases: int = 0
+    retired: bool = False
+    idle_timer: threading.Timer | None = field(default=None, repr=False)
+
+
+_readers: dict[Path, _SharedReader] = {}
+_readers_lock = threading.Lock()
+_reader_stats = {"opens": 0, "reuses": 0, "reopens": 0, "idle_closes": 0}
+
+
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+@retry(
+    retry=retry_if_exception(_is_lock_conflict),
+    stop=stop_after_attempt(3),
+    wait=wait_fixed(0.25),
+    reraise=True,
+)
+def _open_reader(path: Path) -> duckdb.DuckDBPyConnection:
+    return duckdb.connect(str(path), read_only=True)
+
+
+def _lease_reader(path: Path) -> _SharedReader:
+    with _readers_lock:
+        identity = _file_identity(path)
+        reader = _readers.get(path)
+        if reader is not None and reader.identity == identity:
+            _reader_stats["reuses"] += 1
+        else:
+            if reader is not None:
+                # The store was replaced on disk; in-flight cursors keep the old one.
+                _retire_reader(path, reader)
+                _reader_stats["reopens"] += 1
+            if identity is None:
+                raise duckdb.IOException(f"market store not found: {path}")
+            reader = _SharedReader(_open_reader(path), identity)
+            _readers[path] = reader
+            _reader_stats["opens"] += 1
+        reader.leases += 1
+        if reader.idle_timer is not None:
+            reader.idle_timer.cancel()
+            reader.idle_timer = None
+        return reader
+
+
+def _retire_reader(path: Path, reader: _SharedReader) -> None:
+    if _readers.get(path) is reader:
+        del _readers[path]
+    reader.retired = True
+    if reader.idle_timer is not None:
+        reader.idle_timer.cancel()
+        reader.idle_timer = None
+    if reader.leases == 0:
+        reader.conn.close()
+
+
+def _release_reader(path: Path, reader: _SharedReader) -> None:
+    with _readers_lock:
+        reader.leases -= 1
+        if reader.leases:
+            return
+        if reader.retired:
+            reader.conn.close()
+            return
+        timer = threading.Timer(READER_IDLE_SECONDS, _close_idle_reader, (path, reader))
+        timer.daemon = True
+        reader.idle_timer = timer
+        timer.start()
+
+
+def _close_idle_reader(path: Path, reader: _SharedReader) -> None:
+    with _readers_lock:
+        if reader.leases or reader.retired or reader.idle_timer is None:
+            return
+        reader.idle_timer = None
+        _retire_reader(path, reader)
+        _reader_stats["idle_closes"] += 1
+
+
+@contextmanager
+def read_cursor(path: Path | str | None = None) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Yield a cursor on the process-wide read-only connection to ``path``.
+
+    Concurrent callers share one connection and its loaded catalog; each gets
+    its own cursor.  The connection is reopened when the file is replaced and
+    closed after :data:`READER_IDLE_SECONDS` without a lease.
+    """
+    resolved = Path(path if path is not None else DUCKDB_PATH).resolve()
+    reader = _lease_reader(resolved)
+    try:
+        cursor = reader.conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    finally:
+        _release_reader(resolved, reader)
+
+
+def reader_stats() -> dict[str, int]:
+    """Return process-wide shared-reader counters and the open connection count."""
+    with _readers_lock:
+        return {**_reader_stats, "open": len(_readers)}
+
+
+def close_readers(path: Path | str | None = None) -> None:
+    """Close shared readers for ``path`` (or all); leased ones close on release."""
+    with _readers_lock:
+        for reader_path, reader in list(_readers.items()):
+            if path is None or reader_path == Path(path).resolve():
+                _retire_reader(reader_path, reader)
@@ -235,6 +235,21 @@ CREATE TABLE IF NOT EXISTS source_files (
                                       ON DELETE SET NULL
 );
 
+-- Stat fingerprint of each source PDF when it was last hashed. Ingest reuses
+-- sha256 while (size_bytes, mtime_ns, inode) is unchanged, so an incremental
+-- run does not reread the statement tree. Rows are disposable hints: a miss
+-- just rehashes, and `ledger ingest run --verify-hashes` ignores them.
+CREATE TABLE IF NOT EXISTS source_fingerprints (
+    relpath          TEXT PRIMARY KEY,
+    size_bytes       INTEGER NOT NULL,
+    mtime_ns         INTEGER NOT NULL,
+    inode            INTEGER NOT NULL,
+    sha256           TEXT NOT NULL CHECK
+                       (length(sha256) = 64 AND sha256 = lower(sha256)
+                        AND sha256 NOT GLOB '*[^0-9a-f]*'),
+    recorded_at      TEXT NOT NULL
+) WITHOUT ROWID;
+
 -- Every extraction attempt is retained independently. Only a validated run
 -- may be selected by source_files.active_ingestion_run_id.
 CREATE TABLE IF NOT EXISTS ingestion_runs (
@@ -262,7 +277,11 @@ CREATE TABLE IF NOT EXISTS ingestion_runs (
                        (length(content_hash) = 64 AND content_hash = lower(content_hash)
                         AND content_hash NOT GLOB '*[^0-9a-f]*')),
     activated_at     TEXT CHECK (activated_at IS NULL OR
-                       (length(activated_at) = 20 AND activated_at GLOB '????-??-??T??:??:??Z'))
+                       (length(activated_at) = 20 AND activated_at GLOB '????-??-??T??:??:??Z')),
+    -- {stage: {"wall_ms": ..., "cpu_ms": ...}} for hash, extract, select,
+    -- parse, validate, resolve and write; a stage the attempt never reached
+    -- is absent. Diagnostic only: never part of the cache key or content hash.
+    timings_json     TEXT CHECK (timings_json IS NULL OR json_valid(timings_json))
 );
 
 CREATE INDEX IF NOT EXISTS idx_ingestion_runs_source
@@ -287,6 +306,66 @@ CREATE TABLE IF NOT EXISTS statements (
 CREATE INDEX IF NOT EXISTS idx_statements_account_period ON statements(account_id, period_end);
 CREATE INDEX IF NOT EXISTS idx_statements_run ON statements(ingestion_run_id);
 
+-- Materialized canonical revision per account/period/type: the most recently
+-- persisted statement. Triggers keep it exact inside the writer's own
+-- transaction or savepoint, so activation and discard roll back together.
+CREATE TABLE IF NOT EXISTS canonical_statements (
+    account_id       INTEGER NOT NULL,
+    period_start     TEXT NOT NULL,
+    period_end       TEXT NOT NULL,
+    statement_type   TEXT NOT NULL,
+    statement_id     INTEGER NOT NULL UNIQUE
+                       REFERENCES statements(statement_id) ON DELETE CASCADE,
+    PRIMARY KEY(account_id, period_start, period_end, statement_type)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS canonical_statements_insert
+AFTER INSERT ON statements
+BEGIN
+    INSERT INTO canonical_statements(
+        account_id, period_start, period_end, statement_type, statement_id
+    ) VALUES (
+        NEW.account_id, NEW.period_start, NEW.period_end, NEW.statement_type, NEW.statement_id
+    )
+    ON CONFLICT(account_id, period_start, period_end, statement_type) DO UPDATE
+       SET statement_id = excluded.statement_id
+     WHERE excluded.statement_id > canonical_statements.statement_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS canonical_statements_delete
+AFTER DELETE ON statements
+BEGIN
+    DELETE FROM canonical_statements WHERE statement_id = OLD.statement_id;
+    INSERT OR IGNORE INTO canonical_statements(
+        account_id, period_start, period_end, statement_type, statement_id
+    )
+    SELECT account_id, period_start, period_end, statement_type, MAX(statement_id)
+      FROM statements
+     WHERE account_id = OLD.account_id AND period_start = OLD.period_start
+       AND period_end = OLD.period_end AND statement_type = OLD.statement_type
+     GROUP BY account_id, period_start, period_end, statement_type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS canonical_statements_update
+AFTER UPDATE OF account_id, period_start, period_end, statement_type ON statements
+BEGIN
+    DELETE FROM canonical_statements
+     WHERE (account_id = OLD.account_id AND period_start = OLD.period_start
+            AND period_end = OLD.period_end AND statement_type = OLD.statement_type)
+        OR (account_id = NEW.account_id AND period_start = NEW.period_start
+            AND period_end = NEW.period_end AND statement_type = NEW.statement_type);
+    INSERT INTO canonical_statements(
+        account_id, period_start, period_end, statement_type, statement_id
+    )
+    SELECT account_id, period_start, period_end, statement_type, MAX(statement_id)
+      FROM statements
+     WHERE (account_id = OLD.account_id AND period_start = OLD.period_start
+            AND period_end = OLD.period_end AND statement_type = OLD.statement_type)
+        OR (account_id = NEW.account_id AND period_start = NEW.period_start
+            AND period_end = NEW.period_end AND statement_type = NEW.statement_type)
+     GROUP BY account_id, period_start, period_end, statement_type;
+END;
+
 -- Semantic ownership of physical source pages. This is parser output rather
 -- than replaceable PDF geometry, and can represent non-contiguous/shared pages.
 CREATE TABLE IF NOT EXISTS statement_pages (
@@ -364,6 +443,9 @@ CREATE TABLE IF NOT EXISTS source_evidence_geometry (
     match_method     TEXT,
     confidence       REAL CHECK (confidence IS NULL OR
                        (confidence >= 0 AND confidence <= 1)),
+    -- Sorted distinct physical pages of the linked lines, comma-separated, so
+    -- readers never join evidence lines back to pages per returned row.
+    page_numbers     TEXT NOT NULL DEFAULT '',
     updated_at       TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ','now'))
                        CHECK (length(updated_at) = 20
                               AND updated_at GLOB '????-??-??T??:??:??Z')
@@ -732,6 +814,22 @@ CREATE TABLE IF NOT EXISTS reconciliation_components (
     PRIMARY KEY(reconciliation_id, transaction_id)
 );
 
+-- ---------------------------------------------------------------------------
+-- DERIVED CACHES
+-- ---------------------------------------------------------------------------
+
+-- Memoized holdings replay output. Rows are disposable: triggers installed by
+-- init_db clear the whole table whenever a replay input changes, and market
+-- prices are applied on read so a DuckDB refresh never makes a row stale.
+CREATE TABLE IF NOT EXISTS holdings_cache (
+    as_of_date       TEXT NOT NULL CHECK (length(as_of_date) = 10 AND as_of_date GLOB '????-??-??'),
+    account_scope    TEXT NOT NULL,
+    engine_version   INTEGER NOT NULL,
+    rows_json        TEXT NOT NULL,
+    created_at       TEXT NOT NULL,
+    PRIMARY KEY(as_of_date, account_scope)
+) WITHOUT ROWID;
+
 -- ---------------------------------------------------------------------------
 -- META
 -- ---------------------------------------------------------------------------
@@ -742,3 +840,6 @@ CREATE TABLE IF NOT EXISTS schema_meta (
 );
 
 INSERT OR REPLACE INTO schema_meta(key, value) VALUES ('schema_version', '11');
+-- Bumped by triggers whenever a resolver-cache input changes; see
+-- identity_resolution.resolver_cache_version.
+INSERT OR IGNORE INTO schema_meta(key, value) VALUES ('resolver_inputs_generation', '0');
@@ -4,6 +4,8 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -20,11 +22,57 @@ _SCHEMA = Path(__file__).with_name("schema.sql").read_text(encoding="utf-8")
 SCHEMA_VERSION = 11
 
 
+# WAL lets API readers keep their snapshot while an ingest commits; NORMAL
+# sync is still crash-safe in WAL mode and skips an fsync per transaction.
+WRITE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA foreign_keys = ON",
+)
+READ_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+# Set to False to give every read_session() a fresh connection (benchmarks, debugging).
+READ_POOL_ENABLED = True
+# Distinct database files a single thread keeps a pooled reader open for.
+READ_POOL_SIZE = 4
+_read_pool = threading.local()
+
+
 def connect(path: Path | str = SQLITE_PATH) -> sqlite3.Connection:
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in WRITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def connect_readonly(
+    path: Path | str = SQLITE_PATH,
+    *,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """Open a read-only connection tuned for API queries.
+
+    Pass ``check_same_thread=False`` only for a connection that is used by one
+    thread at a time, such as a cursor drained by a streaming response.
+    """
+    conn = sqlite3.connect(
+        f"{Path(path).resolve().as_uri()}?mode=ro",
+        uri=True,
+        check_same_thread=check_same_thread,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
@@ -947,11 +995,61 @@ def _migrate_existing_schema(conn: sqlite3.Connection) -> None:
     _add_column(conn, "reconciliation_results", "reason_code TEXT")
     _add_column(conn, "snapshot_sets", "opening_total REAL")
     _add_column(conn, "snapshot_sets", "reported_change REAL")
+    _add_column(
+        conn,
+        "ingestion_runs",
+        "timings_json TEXT CHECK (timings_json IS NULL OR json_valid(timings_json))",
+    )
+    _migrate_evidence_page_numbers(conn)
     _migrate_reconciliation_check_v11(conn)
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_instruments_security ON instruments(security_id)"
     )
+    _backfill_canonical_statements(conn)
     _install_domain_triggers(conn)
+    _install_holdings_cache_triggers(conn)
+    _install_resolver_generation_triggers(conn)
+
+
+def _migrate_evidence_page_numbers(conn: sqlite3.Connection) -> None:
+    """Denormalize each evidence row's linked pages once for pre-existing geometry."""
+    if "page_numbers" in _table_columns(conn, "source_evidence_geometry"):
+        return
+    _add_column(conn, "source_evidence_geometry", "page_numbers TEXT NOT NULL DEFAULT ''")
+    conn.execute(
+        """
+        UPDATE source_evidence_geometry
+           SET page_numbers = COALESCE((
+               SELECT GROUP_CONCAT(page_number, ',')
+                 FROM (
+                     SELECT DISTINCT page.page_number
+                       FROM source_evidence_lines evidence_line
+                       JOIN source_lines source_line
+                         ON source_line.source_line_id = evidence_line.source_line_id
+                       JOIN source_pages page
+                         ON page.source_page_id = source_line.source_page_id
+                      WHERE evidence_line.evidence_id = source_evidence_geometry.evidence_id
+                      ORDER BY page.page_number
+                 )
+           ), '')
+        """
+    )
+
+
+def _backfill_canonical_statements(conn: sqlite3.Connection) -> None:
+    """Materialize the canonical set once for ledgers that predate its triggers."""
+    if conn.execute("SELECT 1 FROM canonical_statements LIMIT 1").fetchone() is not None:
+        return
+    conn.execute(
+        """
+        INSERT INTO canonical_statements(
+            account_id, period_start, period_end, statement_type, statement_id
+        )
+        SELECT account_id, period_start, period_end, statement_type, MAX(statement_id)
+          FROM statements
+         GROUP BY account_id, period_start, period_end, statement_type
+        """
+    )
 
 
 def _migrate_reconciliation_check_v11(conn: sqlite3.Connection) -> None:
@@ -1160,6 +1258,132 @@ def _install_domain_triggers(conn: sqlite3.Connection) -> None:
             )
 
 
+# Every table the holdings replay reads. Activation, discard, initials
+# inference, reconciliation rebuilds, and manual edits all write through one
+# of these, so a change anywhere clears the memoized holdings.
+HOLDINGS_CACHE_INPUTS = (
+    "accounts",
+    "institutions",
+    "instruments",
+    "instrument_market_symbols",
+    "instrument_ticker_changes",
+    "instrument_ticker_change_sources",
+    "statements",
+    "canonical_statements",
+    "snapshot_sets",
+    "position_snapshots",
+    "cash_balances",
+    "initial_positions",
+    "initial_cash",
+    "transactions",
+    "reconciliation_results",
+    "source_evidence_geometry",
+)
+
+
+def _install_holdings_cache_triggers(conn: sqlite3.Connection) -> None:
+    """Clear ``holdings_cache`` in the same transaction as any input write.
+
+    A rolled-back activation therefore also restores the cached rows, and a
+    reader can never observe cached holdings newer or older than the ledger.
+    """
+    for table in HOLDINGS_CACHE_INPUTS:
+        if not _table_exists(conn, table):
+            continue
+        for operation in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS clear_holdings_cache_{table}_{operation.lower()}
+                AFTER {operation} ON {table}
+                BEGIN
+                    DELETE FROM holdings_cache;
+                END
+                """
+            )
+
+
+RESOLVER_GENERATION_KEY = "resolver_inputs_generation"
+
+# Rows hashed by identity_resolution.resolver_cache_version, as
+# (table, event, WHEN condition).  Filters mirror that function's queries so
+# routine ingest writes (new pending candidates, last_seen_at touches) do not
+# invalidate the memoized fingerprint.
+_RESOLVER_GENERATION_EVENTS = (
+    ("instrument_aliases", "INSERT", None),
+    ("instrument_aliases", "UPDATE", None),
+    ("instrument_aliases", "DELETE", None),
+    ("instrument_identifier_lookups", "INSERT", "NEW.status = 'resolved'"),
+    (
+        "instrument_identifier_lookups",
+        "UPDATE OF institution_code, normalized_name, currency, asset_type, status, "
+        "resolved_symbol, resolved_exchange, resolved_name",
+        "'resolved' IN (OLD.status, NEW.status)",
+    ),
+    ("instrument_identifier_lookups", "DELETE", "OLD.status = 'resolved'"),
+    ("instrument_resolution_candidates", "INSERT", "NEW.status = 'resolved'"),
+    (
+        "instrument_resolution_candidates",
+        "UPDATE OF institution_id, normalized_text, asset_type, currency, status, "
+        "resolved_instrument_id",
+        "'resolved' IN (OLD.status, NEW.status)",
+    ),
+    ("instrument_resolution_candidates", "DELETE", "OLD.status = 'resolved'"),
+    ("instrument_market_symbols", "INSERT", "NEW.status <> 'retired'"),
+    (
+        "instrument_market_symbols",
+        "UPDATE OF instrument_id, provider, provider_symbol, status",
+        "OLD.status <> 'retired' OR NEW.status <> 'retired'",
+    ),
+    ("instrument_market_symbols", "DELETE", "OLD.status <> 'retired'"),
+    ("instruments", "UPDATE OF instrument_key", None),
+    ("instruments", "DELETE", None),
+    ("institutions", "UPDATE OF code", None),
+    ("institutions", "DELETE", None),
+)
+
+
+def _install_resolver_generation_triggers(conn: sqlite3.Connection) -> None:
+    """Count writes to resolver-cache inputs in ``schema_meta``.
+
+    The counter only tells ``resolver_cache_version`` when its memo may be
+    stale; the version itself stays a content fingerprint.  Migrations above
+    may have rewritten inputs, or rebuilt a table and dropped its trigger,
+    while a trigger was missing, so the counter is bumped once whenever this
+    call creates any trigger.  A routine ``init_db`` leaves it alone.
+    """
+    created = False
+    for table, event, condition in _RESOLVER_GENERATION_EVENTS:
+        if not _table_exists(conn, table):
+            continue
+        name = f"bump_resolver_generation_{table}_{event.split()[0].lower()}"
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+            (name,),
+        ).fetchone() is not None:
+            continue
+        conn.execute(
+            f"""
+            CREATE TRIGGER {name}
+            AFTER {event} ON {table}
+            {f"WHEN {condition}" if condition else ""}
+            BEGIN
+                UPDATE schema_meta SET value = CAST(value AS INTEGER) + 1
+                 WHERE key = '{RESOLVER_GENERATION_KEY}';
+            END
+            """
+        )
+        created = True
+    conn.execute(
+        "INSERT OR IGNORE INTO schema_meta(key, value) VALUES (?, '0')",
+        (RESOLVER_GENERATION_KEY,),
+    )
+    if created:
+        conn.execute(
+            "UPDATE schema_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = ?",
+            (RESOLVER_GENERATION_KEY,),
+        )
+
+
 @contextmanager
 def session(path: Path | str = SQLITE_PATH):
     conn = connect(path)
@@ -1173,6 +1397,67 @@ def session(path: Path | str = SQLITE_PATH):
         conn.close()
 
 
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _pooled_reader(path: Path | str) -> sqlite3.Connection:
+    resolved = Path(path).resolve()
+    pool: OrderedDict[Path, tuple[sqlite3.Connection, tuple[int, int] | None]] | None
+    pool = getattr(_read_pool, "connections", None)
+    if pool is None:
+        pool = _read_pool.connections = OrderedDict()
+    identity = _file_identity(resolved)
+    pooled = pool.pop(resolved, None)
+    if pooled is not None and (identity is None or pooled[1] != identity):
+        # The file was swapped or removed underneath us (shadow cutover, restore); reopen.
+        pooled[0].close()
+        pooled = None
+    if pooled is None:
+        pooled = (connect_readonly(resolved), identity)
+    pool[resolved] = pooled
+    while len(pool) > READ_POOL_SIZE:
+        _, (evicted, _) = pool.popitem(last=False)
+        evicted.close()
+    return pooled[0]
+
+
+@contextmanager
+def read_session(path: Path | str = SQLITE_PATH):
+    """Yield this thread's pooled read-only connection to ``path``.
+
+    Connections are opened once per thread and database file and reused
+    across requests; each session ends any transaction the caller opened so
+    the next one reads a fresh snapshot.  Writes fail with
+    ``sqlite3.OperationalError``; use :func:`session` for those.
+    """
+    if not READ_POOL_ENABLED:
+        conn = connect_readonly(path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+    conn = _pooled_reader(path)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+
+
+def close_read_pool() -> None:
+    """Close every pooled reader the calling thread holds."""
+    pool = getattr(_read_pool, "connections", None)
+    while pool:
+        _, (conn, _) = pool.popitem()
+        conn.close()
+
+
 def active_ingestion_run_id(conn: sqlite3.Connection, source_file_id: int) -> int:
     row = conn.execute(
         "SELECT active_ingestion_run_id FROM source_files WHERE source_file_id = ?",
@@ -1185,6 +1470,12 @@ def active_ingestion_run_id(conn: sqlite3.Connection, source_file_id: int) -> in
     return int(row["active_ingestion_run_id"])
 
 
+def _timings_json(timings: dict[str, dict[str, float]] | None) -> str | None:
+    if timings is None:
+        return None
+    return json.dumps(timings, sort_keys=True, separators=(",", ":"))
+
+
 def begin_ingestion_run(
     conn: sqlite3.Connection,
     *,
@@ -1196,6 +1487,7 @@ def begin_ingestion_run(
     status: str = "validated",
     error_summary: str | None = None,
     resolver_version: str | None = None,
+    timings: dict[str, dict[str, float]] | None = None,
 ) -> int:
     """Create an auditable ingestion attempt without changing active output.
 
@@ -1222,8 +1514,8 @@ def begin_ingestion_run(
             INSERT INTO ingestion_runs(
                 source_file_id, source_sha256, parser_name, parser_version,
                 contract_version, schema_version, resolver_version, status,
-                error_summary, started_at, finished_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                error_summary, started_at, finished_at, timings_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             RETURNING ingestion_run_id
             """,
             (
@@ -1238,6 +1530,7 @@ def begin_ingestion_run(
                 error_summary,
                 now,
                 now if terminal else None,
+                _timings_json(timings),
             ),
         ).fetchone()[0]
     )
@@ -1250,6 +1543,7 @@ def activate_ingestion_run(
     ingestion_run_id: int,
     content_counts: dict[str, int],
     content_hash: str,
+    timings: dict[str, dict[str, float]] | None = None,
 ) -> int | None:
     """Select a fully written validated run as a source's active extraction.
 
@@ -1288,7 +1582,8 @@ def activate_ingestion_run(
         """
         UPDATE ingestion_runs
            SET status = 'active', finished_at = ?, activated_at = ?,
-               content_counts_json = ?, content_hash = ?
+               content_counts_json = ?, content_hash = ?,
+               timings_json = COALESCE(?, timings_json)
          WHERE ingestion_run_id = ?
         """,
         (
@@ -1296,6 +1591,7 @@ def activate_ingestion_run(
             now,
             json.dumps(content_counts, sort_keys=True, separators=(",", ":")),
             content_hash,
+            _timings_json(timings),
             ingestion_run_id,
         ),
     )
@@ -1356,6 +1652,7 @@ def record_ingestion_run(
     status: str,
     error_summary: str | None = None,
     resolver_version: str | None = None,
+    timings: dict[str, dict[str, float]] | None = None,
 ) -> int:
     """Compatibility helper for legacy/direct writers.
 
@@ -1393,14 +1690,34 @@ def record_ingestion_run(
         status=status,
         error_summary=error_summary,
         resolver_version=resolver_version,
+        timings=timings,
     )
 
 
-def upsert_source_evidence(
-    conn: sqlite3.Connection,
+_UPSERT_SOURCE_EVIDENCE = """
+    INSERT INTO source_evidence(
+        evidence_key, source_file_id, ingestion_run_id, row_kind,
+        occurrence, page_number, line_number, raw_text, bbox_json,
+        words_json, parser_rule, parser_version
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_file_id, row_kind, occurrence, ingestion_run_id)
+    DO UPDATE SET
+        evidence_key = excluded.evidence_key,
+        page_number = excluded.page_number,
+        line_number = excluded.line_number,
+        raw_text = excluded.raw_text,
+        bbox_json = excluded.bbox_json,
+        words_json = excluded.words_json,
+        parser_rule = excluded.parser_rule,
+        parser_version = excluded.parser_version
+"""
+
+
+def _source_evidence_params(
+    source: sqlite3.Row,
     *,
     source_file_id: int,
-    ingestion_run_id: int,
+    ingestion_run_id: int | None,
     row_kind: str,
     occurrence: int,
     raw_text: str | None,
@@ -1410,60 +1727,123 @@ def upsert_source_evidence(
     line_number: int | None = None,
     bbox: tuple[float, float, float, float] | None = None,
     words: list[dict[str, object]] | None = None,
-) -> int:
+) -> tuple:
+    key = canonical_evidence_key(
+        source_identity=_source_identity(source),
+        row_kind=row_kind,
+        occurrence=occurrence,
+        raw_text=raw_text,
+        page_number=page_number,
+        line_number=line_number,
+        parser_rule=parser_rule,
+    )
+    return (
+        key,
+        source_file_id,
+        ingestion_run_id,
+        row_kind,
+        occurrence,
+        page_number,
+        line_number,
+        raw_text,
+        json.dumps(bbox) if bbox is not None else None,
+        json.dumps(words, sort_keys=True) if words is not None else None,
+        parser_rule,
+        parser_version,
+    )
+
+
+def _evidence_source(conn: sqlite3.Connection, source_file_id: int) -> sqlite3.Row:
     source = conn.execute(
         "SELECT relpath, sha256 FROM source_files WHERE source_file_id = ?",
         (source_file_id,),
     ).fetchone()
     if source is None:
         raise sqlite3.IntegrityError(f"missing source file {source_file_id}")
-    key = canonical_evidence_key(
-        source_identity=_source_identity(source),
+    return source
+
+
+def upsert_source_evidence(
+    conn: sqlite3.Connection,
+    *,
+    source_file_id: int,
+    ingestion_run_id: int,
+    row_kind: str,
+    occurrence: int,
+    raw_text: str | None,
+    parser_version: str | None,
+    parser_rule: str | None = None,
+    page_number: int | None = None,
+    line_number: int | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    words: list[dict[str, object]] | None = None,
+) -> int:
+    params = _source_evidence_params(
+        _evidence_source(conn, source_file_id),
+        source_file_id=source_file_id,
+        ingestion_run_id=ingestion_run_id,
         row_kind=row_kind,
         occurrence=occurrence,
         raw_text=raw_text,
+        parser_version=parser_version,
+        parser_rule=parser_rule,
         page_number=page_number,
         line_number=line_number,
-        parser_rule=parser_rule,
+        bbox=bbox,
+        words=words,
     )
     return int(
         conn.execute(
-            """
-            INSERT INTO source_evidence(
-                evidence_key, source_file_id, ingestion_run_id, row_kind,
-                occurrence, page_number, line_number, raw_text, bbox_json,
-                words_json, parser_rule, parser_version
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(source_file_id, row_kind, occurrence, ingestion_run_id)
-            DO UPDATE SET
-                evidence_key = excluded.evidence_key,
-                page_number = excluded.page_number,
-                line_number = excluded.line_number,
-                raw_text = excluded.raw_text,
-                bbox_json = excluded.bbox_json,
-                words_json = excluded.words_json,
-                parser_rule = excluded.parser_rule,
-                parser_version = excluded.parser_version
-            RETURNING evidence_id
-            """,
-            (
-                key,
-                source_file_id,
-                ingestion_run_id,
-                row_kind,
-                occurrence,
-                page_number,
-                line_number,
-                raw_text,
-                json.dumps(bbox) if bbox is not None else None,
-                json.dumps(words, sort_keys=True) if words is not None else None,
-                parser_rule,
-                parser_version,
-            ),
+            _UPSERT_SOURCE_EVIDENCE + " RETURNING evidence_id", params
         ).fetchone()[0]
     )
 
 
+def upsert_source_evidence_rows(
+    conn: sqlite3.Connection,
+    *,
+    source_file_id: int,
+    ingestion_run_id: int | None,
+    rows: list[dict[str, object]],
+) -> list[int]:
+    """Upsert many evidence rows for one source run and return their IDs in order.
+
+    Each row holds the per-row keyword arguments of ``upsert_source_evidence``.
+    Rows are written with one ``executemany`` in the given order, so IDs are
+    assigned exactly as sequential upserts would assign them, and are then read
+    back through the unique index on the batch's evidence keys.
+    """
+    if not rows:
+        return []
+    source = _evidence_source(conn, source_file_id)
+    params = [
+        _source_evidence_params(
+            source,
+            source_file_id=source_file_id,
+            ingestion_run_id=ingestion_run_id,
+            **row,
+        )
+        for row in rows
+    ]
+    conn.executemany(_UPSERT_SOURCE_EVIDENCE, params)
+    keys = list(dict.fromkeys(param[0] for param in params))
+    ids: dict[str, int] = {}
+    # Read back only this batch, by its unique keys, in bind-limit-sized chunks.
+    for start in range(0, len(keys), 900):
+        chunk = keys[start : start + 900]
+        ids.update(
+            (row["evidence_key"], int(row["evidence_id"]))
+            for row in conn.execute(
+                f"""
+                SELECT evidence_key, evidence_id FROM source_evidence
+                 WHERE evidence_key IN ({','.join('?' * len(chunk))})
+                """,
+                chunk,
+            )
+        )
+    return [ids[param[0]] for param in params]
+
+
 def upsert_snapshot_set(
     conn: sqlite3.Connection,
     *,
@@ -1864,3 +2244,17 @@ def upsert_instrument(
     if security_id is not None:
         _sync_catalog_journal_pairs(conn, security_id)
     return instrument_id
+
+
+def upsert_instruments(
+    conn: sqlite3.Connection,
+    specs: list[dict[str, object]],
+) -> list[int]:
+    """Apply ``upsert_instrument`` to each spec in order and return the IDs.
+
+    Repeated specs are upserted again rather than skipped: every conflicting
+    upsert consumes an AUTOINCREMENT value, and instrument IDs are embedded in
+    reconciliation keys, so skipping would renumber later instruments and
+    change the ledger's content hash.
+    """
+    return [upsert_instrument(conn, **spec) for spec in specs]
@@ -7,15 +7,19 @@ signal, never permission to clear or replace an earlier anchor.
 from __future__ import annotations
 
 import copy
+import functools
+import json
 import sqlite3
+import uuid
+from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import duckdb
-
-from .config import DUCKDB_PATH
 from .db import sqlite as sqlite_db
+from .domains import utc_now_text
+from .market.asof import price_grid
 from .quantity import (
     LEGACY_UNDERIVABLE_POSITION_TYPES,
     NON_CASH_TXN_TYPES,
@@ -26,6 +30,14 @@ from .quantity import (
 from .statement_selection import canonical_statement_clause
 
 EPSILON = 1e-9
+# Bump whenever replay output changes so older ``holdings_cache`` rows are ignored.
+HOLDINGS_CACHE_VERSION = 1
+# Newest replayed rows kept in ``holdings_cache``; older ones are evicted on store.
+HOLDINGS_CACHE_MAX_ROWS = 4096
+# Seconds a best-effort cache write waits for the ledger lock before giving up.
+HOLDINGS_CACHE_WRITE_TIMEOUT = 0.1
+# Marker row every input-write trigger clears along with the cached rows.
+_CACHE_GENERATION_KEY = ("0000-00-00", "#generation")
 
 
 @dataclass(frozen=True)
@@ -127,18 +139,33 @@ def _transaction_source_ref(row: dict) -> dict | None:
     }
 
 
+def _observe_scope(
+    latest: dict[tuple[int, str, str], dict],
+    row: dict,
+    *,
+    complete_only: bool,
+) -> None:
+    if complete_only and row["completeness"] != "complete":
+        return
+    key = _scope_identity(row)
+    prior = latest.get(key)
+    if prior is None or _scope_rank(row) > _scope_rank(prior):
+        latest[key] = row
+
+
 def _latest_scopes(rows: list[dict], *, complete_only: bool) -> dict[tuple[int, str, str], dict]:
     latest: dict[tuple[int, str, str], dict] = {}
     for row in rows:
-        if complete_only and row["completeness"] != "complete":
-            continue
-        key = _scope_identity(row)
-        prior = latest.get(key)
-        if prior is None or _scope_rank(row) > _scope_rank(prior):
-            latest[key] = row
+        _observe_scope(latest, row, complete_only=complete_only)
     return latest
 
 
+def _observe_initial(latest: dict, key: tuple, row: dict) -> None:
+    prior = latest.get(key)
+    if prior is None or str(row["as_of_date"]) > str(prior["as_of_date"]):
+        latest[key] = row
+
+
 def _anchor_from_row(row: dict) -> _ScopeAnchor:
     return _ScopeAnchor(
         snapshot_set_id=int(row["snapshot_set_id"]),
@@ -203,13 +230,7 @@ def _fetch_position_rows(conn: sqlite3.Connection, snapshot_set_ids: list[int])
                COALESCE(market.provider_symbol, i.symbol) AS pricing_symbol,
                i.asset_type, i.option_expiry, i.option_strike, i.option_type,
                geometry.status AS geometry_status,
-               (SELECT GROUP_CONCAT(DISTINCT page.page_number)
-                  FROM source_evidence_lines evidence_line
-                  JOIN source_lines source_line
-                    ON source_line.source_line_id = evidence_line.source_line_id
-                  JOIN source_pages page
-                    ON page.source_page_id = source_line.source_page_id
-                 WHERE evidence_line.evidence_id = ps.evidence_id) AS geometry_pages
+               geometry.page_numbers AS geometry_pages
           FROM position_snapshots ps
           JOIN instruments i ON i.instrument_id = ps.instrument_id
           LEFT JOIN instrument_market_symbols market
@@ -219,6 +240,7 @@ def _fetch_position_rows(conn: sqlite3.Connection, snapshot_set_ids: list[int])
           LEFT JOIN source_evidence_geometry geometry
             ON geometry.evidence_id = ps.evidence_id
          WHERE ps.snapshot_set_id IN ({placeholders})
+         ORDER BY ps.snapshot_set_id, ps.snapshot_id
         """,
         snapshot_set_ids,
     ).fetchall()
@@ -234,13 +256,7 @@ def _fetch_cash_rows(conn: sqlite3.Connection, snapshot_set_ids: list[int]) -> l
         SELECT cash.cash_balance_id, cash.snapshot_set_id, cash.account_id,
                cash.currency, cash.opening_balance, cash.closing_balance,
                geometry.status AS geometry_status,
-               (SELECT GROUP_CONCAT(DISTINCT page.page_number)
-                  FROM source_evidence_lines evidence_line
-                  JOIN source_lines source_line
-                    ON source_line.source_line_id = evidence_line.source_line_id
-                  JOIN source_pages page
-                    ON page.source_page_id = source_line.source_page_id
-                 WHERE evidence_line.evidence_id = cash.evidence_id) AS geometry_pages
+               geometry.page_numbers AS geometry_pages
           FROM cash_balances cash
           LEFT JOIN source_evidence_geometry geometry
             ON geometry.evidence_id = cash.evidence_id
@@ -256,7 +272,7 @@ def _fetch_initial_positions(
     *,
     as_of: str,
     account_ids: list[int],
-) -> dict[tuple[int, str, str], dict]:
+) -> list[dict]:
     account_sql, account_params = _account_clause("ip.account_id", account_ids)
     rows = conn.execute(
         f"""
@@ -275,14 +291,7 @@ def _fetch_initial_positions(
         """,
         (as_of, *account_params),
     ).fetchall()
-    latest: dict[tuple[int, str, str], dict] = {}
-    for raw_row in rows:
-        row = dict(raw_row)
-        key = (int(row["account_id"]), str(row["currency"]), str(row["instrument_key"]))
-        prior = latest.get(key)
-        if prior is None or str(row["as_of_date"]) > str(prior["as_of_date"]):
-            latest[key] = row
-    return latest
+    return [dict(row) for row in rows]
 
 
 def _fetch_initial_cash(
@@ -290,7 +299,7 @@ def _fetch_initial_cash(
     *,
     as_of: str,
     account_ids: list[int],
-) -> dict[tuple[int, str], dict]:
+) -> list[dict]:
     account_sql, account_params = _account_clause("ic.account_id", account_ids)
     rows = conn.execute(
         f"""
@@ -300,14 +309,7 @@ def _fetch_initial_cash(
         """,
         (as_of, *account_params),
     ).fetchall()
-    latest: dict[tuple[int, str], dict] = {}
-    for raw_row in rows:
-        row = dict(raw_row)
-        key = (int(row["account_id"]), str(row["currency"]))
-        prior = latest.get(key)
-        if prior is None or str(row["as_of_date"]) > str(prior["as_of_date"]):
-            latest[key] = row
-    return latest
+    return [dict(row) for row in rows]
 
 
 def _fetch_transactions(
@@ -340,13 +342,7 @@ def _fetch_transactions(
                 successor.option_strike AS successor_option_strike,
                 successor.option_type AS successor_option_type,
                 geometry.status AS geometry_status,
-                (SELECT GROUP_CONCAT(DISTINCT page.page_number)
-                   FROM source_evidence_lines evidence_line
-                   JOIN source_lines source_line
-                     ON source_line.source_line_id = evidence_line.source_line_id
-                   JOIN source_pages page
-                     ON page.source_page_id = source_line.source_page_id
-                  WHERE evidence_line.evidence_id = t.evidence_id) AS geometry_pages
+                geometry.page_numbers AS geometry_pages
           FROM transactions t
           LEFT JOIN instruments i ON i.instrument_id = t.instrument_id
           LEFT JOIN source_evidence_geometry geometry
@@ -577,41 +573,29 @@ def _result_quality(
     }
 
 
+def _market_symbols(records: list[dict]) -> set[str]:
+    return {
+        str(record["_pricing_symbol"])
+        for record in records
+        if not record["is_reported"]
+        and record["asset_type"] not in {"cash", "option"}
+    }
+
+
 def _load_market_prices(
-    symbols: set[str],
+    symbols_by_date: dict[str, set[str]],
     *,
-    as_of: str,
     market_path: Path | str | None,
-) -> dict[str, tuple[float, str]]:
-    if not symbols:
-        return {}
-    path = market_path if market_path is not None else DUCKDB_PATH
-    try:
-        con = duckdb.connect(str(path), read_only=True)
-        try:
-            placeholders = ",".join("?" * len(symbols))
-            rows = con.execute(
-                f"""
-                SELECT symbol, price, trade_date
-                  FROM (
-                    SELECT symbol, COALESCE(close, adj_close) AS price, trade_date,
-                           ROW_NUMBER() OVER (
-                               PARTITION BY symbol ORDER BY trade_date DESC
-                           ) AS rn
-                      FROM daily_prices
-                     WHERE symbol IN ({placeholders})
-                       AND trade_date <= ?
-                       AND COALESCE(close, adj_close) IS NOT NULL
-                  )
-                 WHERE rn = 1
-                """,
-                [*sorted(symbols), as_of],
-            ).fetchall()
-        finally:
-            con.close()
-    except Exception:
-        return {}
-    return {str(symbol): (float(price), str(trade_date)) for symbol, price, trade_date in rows}
+) -> dict[str, dict[str, tuple[float, str]]]:
+    """Return the latest close on or before each date from one as-of grid."""
+    symbols = set().union(*symbols_by_date.values()) if symbols_by_date else set()
+    wanted = [as_of for as_of, date_symbols in symbols_by_date.items() if date_symbols]
+    grid = price_grid(symbols, wanted, market_path=market_path)
+    prices: dict[str, dict[str, tuple[float, str]]] = {}
+    for as_of, date_symbols in symbols_by_date.items():
+        found = {symbol: grid.get(symbol, as_of) for symbol in date_symbols}
+        prices[as_of] = {symbol: price for symbol, price in found.items() if price is not None}
+    return prices
 
 
 def _combine_security_states(states: list[_SecurityState]) -> _SecurityState:
@@ -841,15 +825,8 @@ def _apply_security_prices(
     records: list[dict],
     *,
     as_of: str,
-    market_path: Path | str | None,
+    prices: dict[str, tuple[float, str]],
 ) -> None:
-    market_symbols = {
-        str(record["_pricing_symbol"])
-        for record in records
-        if not record["is_reported"]
-        and record["asset_type"] not in {"cash", "option"}
-    }
-    prices = _load_market_prices(market_symbols, as_of=as_of, market_path=market_path)
     for record in records:
         if record["asset_type"] == "cash" or record["is_reported"]:
             continue
@@ -911,119 +888,274 @@ def _finalize_records(records: list[dict]) -> list[dict]:
     )
 
 
-def holdings_at(
-    as_of: str,
-    account_ids: list[int] | None = None,
-    *,
-    path: Path | str | None = None,
-    market_path: Path | str | None = None,
-) -> list[dict]:
-    """Return one native-currency holding row per account/instrument/currency.
+@dataclass(frozen=True)
+class _Movement:
+    """One transaction effect, eligible from ``start`` until before ``end``."""
 
-    The function is read-only.  It makes a complete scoped snapshot the anchor,
-    applies only later normalized movements, and returns quality/provenance
-    metadata rather than manufacturing an adjustment for uncertainty.
+    index: int
+    kind: str
+    start: str
+    end: str | None
+    row: dict
+    source_ref: dict | None
+
+    def eligible(self, as_of: str) -> bool:
+        return self.start <= as_of and (self.end is None or as_of < self.end)
+
+
+@dataclass
+class _Checkpoints:
+    """Checkpoint inputs visible on one date."""
+
+    position_anchors: dict[tuple[int, str, str], _ScopeAnchor]
+    cash_anchors: dict[tuple[int, str, str], _ScopeAnchor]
+    latest_position_scope: dict[tuple[int, str, str], dict]
+    latest_cash_scope: dict[tuple[int, str, str], dict]
+    initial_positions: dict[tuple[int, str, str], dict]
+    initial_cash: dict[tuple[int, str], dict]
+
+
+@dataclass
+class _LedgerHistory:
+    """Everything a holdings replay reads, fetched once up to the last date."""
+
+    accounts: dict[int, dict]
+    timeline: list[tuple[str, _Checkpoints]]
+    transactions: list[dict]
+    ticker_lineages: dict[int, tuple[str, tuple[str, ...]]]
+    position_rows: dict[int, list[dict]]
+    cash_rows: dict[int, dict]
+    position_results: dict[tuple[int, int], dict]
+    cash_results: dict[int, dict]
+
+
+def _transaction_movements(
+    transactions: list[dict],
+) -> tuple[dict[int, list[_Movement]], dict[int, list[_Movement]]]:
+    """Split transactions into per-account security and cash movements.
+
+    A point-in-time replay includes a row once either its trade or cash date
+    has passed.  A ticker-change row replaces every other effect from its trade
+    date onward, so its fall-through effects only apply before that date.
     """
-    selected_accounts = list(account_ids or [])
-    db_path = path if path is not None else sqlite_db.SQLITE_PATH
-    with sqlite_db.session(db_path) as conn:
-        accounts = _fetch_accounts(conn, selected_accounts)
-        if not accounts:
-            return []
-        allowed_accounts = sorted(accounts)
-        position_scope_rows = _fetch_scope_rows(
+    position: dict[int, list[_Movement]] = defaultdict(list)
+    cash: dict[int, list[_Movement]] = defaultdict(list)
+    for index, row in enumerate(transactions):
+        account_id = int(row["account_id"])
+        source_ref = _transaction_source_ref(row)
+        trade_date = str(row["trade_date"])
+        effective_date = str(row["cash_effective_date"] or row["trade_date"])
+        included = min(trade_date, effective_date)
+        fallthrough_end: str | None = None
+        if row["successor_instrument_id"] is not None:
+            position[account_id].append(
+                _Movement(index, "successor", trade_date, None, row, source_ref)
+            )
+            fallthrough_end = trade_date
+        elif row["instrument_id"] is not None:
+            position[account_id].append(
+                _Movement(index, "security", trade_date, None, row, source_ref)
+            )
+        if row["instrument_id"] is None and row["txn_type"] in POSITION_AFFECTING_TYPES:
+            position[account_id].append(
+                _Movement(index, "unresolved", included, fallthrough_end, row, source_ref)
+            )
+        if row["txn_type"] not in NON_CASH_TXN_TYPES:
+            cash[account_id].append(
+                _Movement(index, "cash", effective_date, fallthrough_end, row, source_ref)
+            )
+    return position, cash
+
+
+def _checkpoint_timeline(
+    dates: list[str],
+    *,
+    position_scope_rows: list[dict],
+    cash_scope_rows: list[dict],
+    initial_position_rows: list[dict],
+    initial_cash_rows: list[dict],
+) -> list[tuple[str, _Checkpoints]]:
+    """Sweep checkpoint rows forward once, recording what each date can see."""
+    def by_date(row: dict) -> str:
+        return str(row["as_of_date"])
+
+    position_scopes = sorted(position_scope_rows, key=by_date)
+    cash_scopes = sorted(cash_scope_rows, key=by_date)
+    initial_positions = sorted(initial_position_rows, key=by_date)
+    initial_cash = sorted(initial_cash_rows, key=by_date)
+    cursor = {"position": 0, "cash": 0, "initial_position": 0, "initial_cash": 0}
+    complete_positions: dict[tuple[int, str, str], dict] = {}
+    complete_cash: dict[tuple[int, str, str], dict] = {}
+    observed_positions: dict[tuple[int, str, str], dict] = {}
+    observed_cash: dict[tuple[int, str, str], dict] = {}
+    latest_initial_positions: dict[tuple[int, str, str], dict] = {}
+    latest_initial_cash: dict[tuple[int, str], dict] = {}
+    anchors: dict[int, _ScopeAnchor] = {}
+
+    def anchor(row: dict) -> _ScopeAnchor:
+        snapshot_set_id = int(row["snapshot_set_id"])
+        if snapshot_set_id not in anchors:
+            anchors[snapshot_set_id] = _anchor_from_row(row)
+        return anchors[snapshot_set_id]
+
+    def take(name: str, rows: list[dict], as_of: str) -> list[dict]:
+        start = cursor[name]
+        end = start
+        while end < len(rows) and str(rows[end]["as_of_date"]) <= as_of:
+            end += 1
+        cursor[name] = end
+        return rows[start:end]
+
+    timeline: list[tuple[str, _Checkpoints]] = []
+    for as_of in dates:
+        for row in take("position", position_scopes, as_of):
+            _observe_scope(complete_positions, row, complete_only=True)
+            _observe_scope(observed_positions, row, complete_only=False)
+        for row in take("cash", cash_scopes, as_of):
+            _observe_scope(complete_cash, row, complete_only=True)
+            _observe_scope(observed_cash, row, complete_only=False)
+        for row in take("initial_position", initial_positions, as_of):
+            _observe_initial(
+                latest_initial_positions,
+                (int(row["account_id"]), str(row["currency"]), str(row["instrument_key"])),
+                row,
+            )
+        for row in take("initial_cash", initial_cash, as_of):
+            _observe_initial(
+                latest_initial_cash,
+                (int(row["account_id"]), str(row["currency"])),
+                row,
+            )
+        timeline.append((
+            as_of,
+            _Checkpoints(
+                position_anchors={
+                    key: anchor(row) for key, row in complete_positions.items()
+                },
+                cash_anchors={key: anchor(row) for key, row in complete_cash.items()},
+                latest_position_scope=dict(observed_positions),
+                latest_cash_scope=dict(observed_cash),
+                initial_positions=dict(latest_initial_positions),
+                initial_cash=dict(latest_initial_cash),
+            ),
+        ))
+    return timeline
+
+
+def _fetch_history(
+    conn: sqlite3.Connection,
+    dates: list[str],
+    account_ids: list[int],
+) -> _LedgerHistory | None:
+    accounts = _fetch_accounts(conn, account_ids)
+    if not accounts:
+        return None
+    allowed_accounts = sorted(accounts)
+    last = dates[-1]
+    timeline = _checkpoint_timeline(
+        dates,
+        position_scope_rows=_fetch_scope_rows(
             conn,
             section_type="positions",
-            as_of=as_of,
+            as_of=last,
             account_ids=allowed_accounts,
-        )
-        cash_scope_rows = _fetch_scope_rows(
+        ),
+        cash_scope_rows=_fetch_scope_rows(
             conn,
             section_type="cash",
-            as_of=as_of,
+            as_of=last,
             account_ids=allowed_accounts,
-        )
-        position_scope_data = _latest_scopes(position_scope_rows, complete_only=True)
-        cash_scope_data = _latest_scopes(cash_scope_rows, complete_only=True)
-        latest_position_scope = _latest_scopes(position_scope_rows, complete_only=False)
-        latest_cash_scope = _latest_scopes(cash_scope_rows, complete_only=False)
-        position_anchors = {
-            key: _anchor_from_row(row) for key, row in position_scope_data.items()
-        }
-        cash_anchors = {key: _anchor_from_row(row) for key, row in cash_scope_data.items()}
-        position_rows = _fetch_position_rows(
-            conn,
-            [anchor.snapshot_set_id for anchor in position_anchors.values()],
-        )
-        cash_rows = _fetch_cash_rows(
-            conn,
-            [anchor.snapshot_set_id for anchor in cash_anchors.values()],
-        )
-        initial_positions = _fetch_initial_positions(
+        ),
+        initial_position_rows=_fetch_initial_positions(
             conn,
-            as_of=as_of,
+            as_of=last,
             account_ids=allowed_accounts,
-        )
-        initial_cash = _fetch_initial_cash(
-            conn,
-            as_of=as_of,
-            account_ids=allowed_accounts,
-        )
-        transactions = _fetch_transactions(
+        ),
+        initial_cash_rows=_fetch_initial_cash(
             conn,
-            as_of=as_of,
+            as_of=last,
             account_ids=allowed_accounts,
-        )
-        ticker_lineages = _fetch_ticker_lineages(conn)
-        position_results, cash_results = _fetch_reconciliation_results(
-            conn,
-            position_set_ids=[anchor.snapshot_set_id for anchor in position_anchors.values()],
-            cash_set_ids=[anchor.snapshot_set_id for anchor in cash_anchors.values()],
-        )
+        ),
+    )
+    position_set_ids = sorted({
+        anchor.snapshot_set_id
+        for _, checkpoints in timeline
+        for anchor in checkpoints.position_anchors.values()
+    })
+    cash_set_ids = sorted({
+        anchor.snapshot_set_id
+        for _, checkpoints in timeline
+        for anchor in checkpoints.cash_anchors.values()
+    })
+    position_rows: dict[int, list[dict]] = defaultdict(list)
+    for row in _fetch_position_rows(conn, position_set_ids):
+        position_rows[int(row["snapshot_set_id"])].append(row)
+    position_results, cash_results = _fetch_reconciliation_results(
+        conn,
+        position_set_ids=position_set_ids,
+        cash_set_ids=cash_set_ids,
+    )
+    return _LedgerHistory(
+        accounts=accounts,
+        timeline=timeline,
+        transactions=_fetch_transactions(conn, as_of=last, account_ids=allowed_accounts),
+        ticker_lineages=_fetch_ticker_lineages(conn),
+        position_rows=position_rows,
+        cash_rows={
+            int(row["snapshot_set_id"]): row
+            for row in _fetch_cash_rows(conn, cash_set_ids)
+        },
+        position_results=position_results,
+        cash_results=cash_results,
+    )
+
 
+def _seed_position_states(
+    account_id: int,
+    checkpoints: tuple[dict, dict],
+    *,
+    position_rows: dict[int, list[dict]],
+    ticker_lineages: dict[int, tuple[str, tuple[str, ...]]],
+) -> dict[tuple[int, str, str, str], _SecurityState]:
+    position_anchors, initial_positions = checkpoints
     position_states: dict[tuple[int, str, str, str], _SecurityState] = {}
-    for row in position_rows:
-        scope_key = next(
-            key
-            for key, anchor in position_anchors.items()
-            if anchor.snapshot_set_id == int(row["snapshot_set_id"])
-        )
-        anchor = position_anchors[scope_key]
-        state_key = (
-            int(row["account_id"]),
-            str(row["currency"]),
-            anchor.scope_key,
-            str(row["instrument_key"]),
-        )
-        position_states[state_key] = _SecurityState(
-            account_id=int(row["account_id"]),
-            currency=str(row["currency"]),
-            scope_key=anchor.scope_key,
-            instrument_id=int(row["instrument_id"]),
-            instrument_key=str(row["instrument_key"]),
-            symbol=str(row["symbol"]),
-            pricing_symbol=str(row["pricing_symbol"]),
-            asset_type=str(row["asset_type"]),
-            option_expiry=row["option_expiry"],
-            option_strike=row["option_strike"],
-            option_type=row["option_type"],
-            quantity=float(row["quantity"]),
-            source_snapshot_id=int(row["snapshot_id"]),
-            source_geometry_status=row["geometry_status"],
-            source_page_numbers=_geometry_pages(row),
-            anchor=anchor,
-            anchor_quantity=float(row["quantity"]),
-            avg_cost=row["avg_cost"],
-            book_value=row["book_value"],
-            market_price=row["market_price"],
-            market_value=row["market_value"],
-            unrealized_pnl=row["unrealized_pnl"],
-            lineage_key=ticker_lineages.get(int(row["instrument_id"]), (None, ()))[0],
-            ticker_symbols=ticker_lineages.get(int(row["instrument_id"]), ("", ()))[1],
-            anchor_instrument_id=int(row["instrument_id"]),
-        )
+    for anchor in sorted(position_anchors.values(), key=lambda item: item.snapshot_set_id):
+        for row in position_rows.get(anchor.snapshot_set_id, []):
+            state_key = (
+                int(row["account_id"]),
+                str(row["currency"]),
+                anchor.scope_key,
+                str(row["instrument_key"]),
+            )
+            position_states[state_key] = _SecurityState(
+                account_id=int(row["account_id"]),
+                currency=str(row["currency"]),
+                scope_key=anchor.scope_key,
+                instrument_id=int(row["instrument_id"]),
+                instrument_key=str(row["instrument_key"]),
+                symbol=str(row["symbol"]),
+                pricing_symbol=str(row["pricing_symbol"]),
+                asset_type=str(row["asset_type"]),
+                option_expiry=row["option_expiry"],
+                option_strike=row["option_strike"],
+                option_type=row["option_type"],
+                quantity=float(row["quantity"]),
+                source_snapshot_id=int(row["snapshot_id"]),
+                source_geometry_status=row["geometry_status"],
+                source_page_numbers=_geometry_pages(row),
+                anchor=anchor,
+                anchor_quantity=float(row["quantity"]),
+                avg_cost=row["avg_cost"],
+                book_value=row["book_value"],
+                market_price=row["market_price"],
+                market_value=row["market_value"],
+                unrealized_pnl=row["unrealized_pnl"],
+                lineage_key=ticker_lineages.get(int(row["instrument_id"]), (None, ()))[0],
+                ticker_symbols=ticker_lineages.get(int(row["instrument_id"]), ("", ()))[1],
+                anchor_instrument_id=int(row["instrument_id"]),
+            )
 
-    for (account_id, currency, instrument_key), row in initial_positions.items():
+    for (_, currency, instrument_key), row in initial_positions.items():
         state_key = (account_id, currency, "default", instrument_key)
         if (account_id, currency, "default") in position_anchors:
             continue
@@ -1050,11 +1182,19 @@ def holdings_at(
                 anchor_instrument_id=int(row["instrument_id"]),
             ),
         )
+    return position_states
 
+
+def _seed_cash_states(
+    account_id: int,
+    checkpoints: tuple[dict, dict],
+    *,
+    cash_rows: dict[int, dict],
+) -> dict[tuple[int, str, str], _CashState]:
+    cash_anchors, initial_cash = checkpoints
     cash_states: dict[tuple[int, str, str], _CashState] = {}
-    cash_rows_by_set = {int(row["snapshot_set_id"]): row for row in cash_rows}
     for scope_key, anchor in cash_anchors.items():
-        row = cash_rows_by_set.get(anchor.snapshot_set_id)
+        row = cash_rows.get(anchor.snapshot_set_id)
         if row is None:
             continue
         cash_states[scope_key] = _CashState(
@@ -1067,7 +1207,7 @@ def holdings_at(
             source_page_numbers=_geometry_pages(row),
             anchor=anchor,
         )
-    for (account_id, currency), row in initial_cash.items():
+    for (_, currency), row in initial_cash.items():
         state_key = (account_id, currency, "default")
         if state_key in cash_anchors:
             continue
@@ -1081,248 +1221,665 @@ def holdings_at(
                 initial_date=str(row["as_of_date"]),
             ),
         )
+    return cash_states
 
-    for row in transactions:
-        account_id = int(row["account_id"])
-        transaction_source_ref = _transaction_source_ref(row)
-        if row["successor_instrument_id"] is not None and row["trade_date"] <= as_of:
-            currency = str(row["instrument_currency"] or row["currency"])
-            instrument_key = str(row["instrument_key"])
-            scope_keys = _scope_candidates_for_security(
-                position_states,
-                position_anchors,
+
+def _apply_successor(
+    position_states: dict[tuple[int, str, str, str], _SecurityState],
+    position_anchors: dict[tuple[int, str, str], _ScopeAnchor],
+    ticker_lineages: dict[int, tuple[str, tuple[str, ...]]],
+    row: dict,
+    transaction_source_ref: dict | None,
+) -> None:
+    account_id = int(row["account_id"])
+    currency = str(row["instrument_currency"] or row["currency"])
+    instrument_key = str(row["instrument_key"])
+    scope_keys = _scope_candidates_for_security(
+        position_states,
+        position_anchors,
+        account_id=account_id,
+        currency=currency,
+        instrument_key=instrument_key,
+    )
+    for scope_key in scope_keys:
+        old_key = (account_id, currency, scope_key, instrument_key)
+        old_state = position_states.get(old_key)
+        if old_state is None:
+            continue
+        floor = _state_floor(old_state)
+        if floor is not None and str(row["trade_date"]) <= floor:
+            continue
+        moved = old_state.quantity
+        old_state.quantity = 0.0
+        old_state.position_movement = True
+        successor_key = str(row["successor_instrument_key"])
+        new_key = (account_id, currency, scope_key, successor_key)
+        new_state = position_states.get(new_key)
+        if new_state is None:
+            successor_id = int(row["successor_instrument_id"])
+            lineage = ticker_lineages.get(successor_id, (old_state.lineage_key, old_state.ticker_symbols))
+            new_state = _SecurityState(
                 account_id=account_id,
                 currency=currency,
-                instrument_key=instrument_key,
+                scope_key=scope_key,
+                instrument_id=successor_id,
+                instrument_key=successor_key,
+                symbol=str(row["successor_symbol"]),
+                pricing_symbol=str(row["successor_pricing_symbol"]),
+                asset_type=str(row["successor_asset_type"]),
+                option_expiry=row["successor_option_expiry"],
+                option_strike=row["successor_option_strike"],
+                option_type=row["successor_option_type"],
+                quantity=0.0,
+                source_snapshot_id=old_state.source_snapshot_id,
+                source_geometry_status=old_state.source_geometry_status,
+                source_page_numbers=old_state.source_page_numbers,
+                anchor=old_state.anchor,
+                initial_date=old_state.initial_date,
+                anchor_quantity=old_state.anchor_quantity,
+                avg_cost=(
+                    old_state.avg_cost / float(row["ticker_change_ratio"])
+                    if old_state.avg_cost is not None
+                    else None
+                ),
+                book_value=old_state.book_value,
+                lineage_key=lineage[0],
+                ticker_symbols=lineage[1],
+                anchor_instrument_id=(
+                    old_state.anchor_instrument_id or old_state.instrument_id
+                ),
+                movement_source_refs=list(old_state.movement_source_refs),
             )
-            for scope_key in scope_keys:
-                old_key = (account_id, currency, scope_key, instrument_key)
-                old_state = position_states.get(old_key)
-                if old_state is None:
-                    continue
-                floor = _state_floor(old_state)
-                if floor is not None and str(row["trade_date"]) <= floor:
-                    continue
-                moved = old_state.quantity
-                old_state.quantity = 0.0
-                old_state.position_movement = True
-                successor_key = str(row["successor_instrument_key"])
-                new_key = (account_id, currency, scope_key, successor_key)
-                new_state = position_states.get(new_key)
-                if new_state is None:
-                    successor_id = int(row["successor_instrument_id"])
-                    lineage = ticker_lineages.get(successor_id, (old_state.lineage_key, old_state.ticker_symbols))
-                    new_state = _SecurityState(
-                        account_id=account_id,
-                        currency=currency,
-                        scope_key=scope_key,
-                        instrument_id=successor_id,
-                        instrument_key=successor_key,
-                        symbol=str(row["successor_symbol"]),
-                        pricing_symbol=str(row["successor_pricing_symbol"]),
-                        asset_type=str(row["successor_asset_type"]),
-                        option_expiry=row["successor_option_expiry"],
-                        option_strike=row["successor_option_strike"],
-                        option_type=row["successor_option_type"],
-                        quantity=0.0,
-                        source_snapshot_id=old_state.source_snapshot_id,
-                        source_geometry_status=old_state.source_geometry_status,
-                        source_page_numbers=old_state.source_page_numbers,
-                        anchor=old_state.anchor,
-                        initial_date=old_state.initial_date,
-                        anchor_quantity=old_state.anchor_quantity,
-                        avg_cost=(
-                            old_state.avg_cost / float(row["ticker_change_ratio"])
-                            if old_state.avg_cost is not None
-                            else None
-                        ),
-                        book_value=old_state.book_value,
-                        lineage_key=lineage[0],
-                        ticker_symbols=lineage[1],
-                        anchor_instrument_id=(
-                            old_state.anchor_instrument_id or old_state.instrument_id
-                        ),
-                        movement_source_refs=list(old_state.movement_source_refs),
-                    )
-                    position_states[new_key] = new_state
-                new_state.quantity += moved * float(row["ticker_change_ratio"])
-                new_state.position_movement = True
-                if transaction_source_ref is not None:
-                    new_state.movement_source_refs.append(transaction_source_ref)
-            # The source transaction is represented by the old -> new move;
-            # do not also treat generic name_change as a missing delta.
-            continue
-        if row["instrument_id"] is not None and row["trade_date"] <= as_of:
-            currency = str(row["instrument_currency"] or row["currency"])
-            instrument_key = str(row["instrument_key"])
-            scope_keys = _scope_candidates_for_security(
-                position_states,
-                position_anchors,
+            position_states[new_key] = new_state
+        new_state.quantity += moved * float(row["ticker_change_ratio"])
+        new_state.position_movement = True
+        if transaction_source_ref is not None:
+            new_state.movement_source_refs.append(transaction_source_ref)
+
+
+def _apply_security_movement(
+    position_states: dict[tuple[int, str, str, str], _SecurityState],
+    position_anchors: dict[tuple[int, str, str], _ScopeAnchor],
+    initial_positions: dict[tuple[int, str, str], dict],
+    ticker_lineages: dict[int, tuple[str, tuple[str, ...]]],
+    row: dict,
+    transaction_source_ref: dict | None,
+) -> None:
+    account_id = int(row["account_id"])
+    currency = str(row["instrument_currency"] or row["currency"])
+    instrument_key = str(row["instrument_key"])
+    scope_keys = _scope_candidates_for_security(
+        position_states,
+        position_anchors,
+        account_id=account_id,
+        currency=currency,
+        instrument_key=instrument_key,
+    )
+    if not scope_keys:
+        for state in position_states.values():
+            if state.account_id == account_id and state.currency == currency:
+                state.warnings.add("ambiguous_position_scope_transaction")
+                state.incomplete = True
+        return
+    for scope_key in scope_keys:
+        state_key = (account_id, currency, scope_key, instrument_key)
+        state = position_states.get(state_key)
+        if state is None:
+            anchor = position_anchors.get((account_id, currency, scope_key))
+            if anchor is not None and str(row["trade_date"]) <= anchor.as_of_date:
+                continue
+            initial = (
+                None
+                if anchor is not None
+                else initial_positions.get((account_id, currency, instrument_key))
+            )
+            state = _SecurityState(
                 account_id=account_id,
                 currency=currency,
+                scope_key=scope_key,
+                instrument_id=int(row["instrument_id"]),
                 instrument_key=instrument_key,
+                symbol=str(row["symbol"]),
+                pricing_symbol=str(row["pricing_symbol"]),
+                asset_type=str(row["asset_type"]),
+                option_expiry=row["option_expiry"],
+                option_strike=row["option_strike"],
+                option_type=row["option_type"],
+                quantity=float(initial["quantity"]) if initial else 0.0,
+                anchor=anchor,
+                initial_date=str(initial["as_of_date"]) if initial else None,
+                anchor_quantity=float(initial["quantity"]) if initial else 0.0,
+                avg_cost=initial["avg_cost"] if initial else None,
+                lineage_key=ticker_lineages.get(
+                    int(row["instrument_id"]), (None, ())
+                )[0],
+                ticker_symbols=ticker_lineages.get(
+                    int(row["instrument_id"]), ("", ())
+                )[1],
+                anchor_instrument_id=int(row["instrument_id"]),
             )
-            if not scope_keys:
-                for state in position_states.values():
-                    if state.account_id == account_id and state.currency == currency:
-                        state.warnings.add("ambiguous_position_scope_transaction")
-                        state.incomplete = True
-            else:
-                for scope_key in scope_keys:
-                    state_key = (account_id, currency, scope_key, instrument_key)
-                    state = position_states.get(state_key)
-                    if state is None:
-                        anchor = position_anchors.get((account_id, currency, scope_key))
-                        if anchor is not None and str(row["trade_date"]) <= anchor.as_of_date:
-                            continue
-                        initial = (
-                            None
-                            if anchor is not None
-                            else initial_positions.get((account_id, currency, instrument_key))
-                        )
-                        state = _SecurityState(
-                            account_id=account_id,
-                            currency=currency,
-                            scope_key=scope_key,
-                            instrument_id=int(row["instrument_id"]),
-                            instrument_key=instrument_key,
-                            symbol=str(row["symbol"]),
-                            pricing_symbol=str(row["pricing_symbol"]),
-                            asset_type=str(row["asset_type"]),
-                            option_expiry=row["option_expiry"],
-                            option_strike=row["option_strike"],
-                            option_type=row["option_type"],
-                            quantity=float(initial["quantity"]) if initial else 0.0,
-                            anchor=anchor,
-                            initial_date=str(initial["as_of_date"]) if initial else None,
-                            anchor_quantity=float(initial["quantity"]) if initial else 0.0,
-                            avg_cost=initial["avg_cost"] if initial else None,
-                            lineage_key=ticker_lineages.get(
-                                int(row["instrument_id"]), (None, ())
-                            )[0],
-                            ticker_symbols=ticker_lineages.get(
-                                int(row["instrument_id"]), ("", ())
-                            )[1],
-                            anchor_instrument_id=int(row["instrument_id"]),
-                        )
-                        position_states[state_key] = state
-                    floor = _state_floor(state)
-                    if floor is not None and str(row["trade_date"]) <= floor:
-                        continue
-                    effect = contextual_position_delta(
-                        str(row["txn_type"]),
-                        row["quantity"],
-                        state.quantity,
-                        _stored_position_effect(row),
-                    )
-                    if effect is None:
-                        state.warnings.add("missing_position_delta")
-                        state.incomplete = True
-                        continue
-                    if abs(effect) > EPSILON:
-                        state.quantity += effect
-                        state.position_movement = True
-                        state.cost_basis_stale = True
-                        if transaction_source_ref is not None:
-                            state.movement_source_refs.append(transaction_source_ref)
-
-        if row["instrument_id"] is None and row["txn_type"] in POSITION_AFFECTING_TYPES:
-            transaction_currency = str(row["currency"])
-            for state in position_states.values():
-                floor = _state_floor(state)
-                if (
-                    state.account_id == account_id
-                    and state.currency == transaction_currency
-                    and (floor is None or str(row["trade_date"]) > floor)
-                ):
-                    state.warnings.add("unresolved_position_transaction")
-                    state.incomplete = True
-
-        effective_date = str(row["cash_effective_date"] or row["trade_date"])
-        if effective_date > as_of or row["txn_type"] in NON_CASH_TXN_TYPES:
+            position_states[state_key] = state
+        floor = _state_floor(state)
+        if floor is not None and str(row["trade_date"]) <= floor:
             continue
-        currency = str(row["currency"])
-        scope_keys = _scope_candidates_for_cash(
-            cash_states,
-            cash_anchors,
-            account_id=account_id,
-            currency=currency,
+        effect = contextual_position_delta(
+            str(row["txn_type"]),
+            row["quantity"],
+            state.quantity,
+            _stored_position_effect(row),
         )
-        if not scope_keys:
-            for state in cash_states.values():
-                if state.account_id == account_id and state.currency == currency:
-                    state.warnings.add("ambiguous_cash_scope_transaction")
-                    state.incomplete = True
+        if effect is None:
+            state.warnings.add("missing_position_delta")
+            state.incomplete = True
             continue
-        value = row["cash_delta"] if row["cash_delta"] is not None else row["net_amount"]
-        for scope_key in scope_keys:
-            state_key = (account_id, currency, scope_key)
-            state = cash_states.get(state_key)
-            if state is None:
-                anchor = cash_anchors.get(state_key)
-                if anchor is not None and effective_date <= anchor.as_of_date:
-                    continue
-                initial = None if anchor is not None else initial_cash.get((account_id, currency))
-                state = _CashState(
-                    account_id=account_id,
-                    currency=currency,
-                    scope_key=scope_key,
-                    balance=float(initial["balance"]) if initial else 0.0,
-                    anchor=anchor,
-                    initial_date=str(initial["as_of_date"]) if initial else None,
-                )
-                cash_states[state_key] = state
-            floor = _state_floor(state)
-            if floor is not None and effective_date <= floor:
-                continue
-            if value is None:
-                state.warnings.add("missing_cash_delta")
+        if abs(effect) > EPSILON:
+            state.quantity += effect
+            state.position_movement = True
+            state.cost_basis_stale = True
+            if transaction_source_ref is not None:
+                state.movement_source_refs.append(transaction_source_ref)
+
+
+def _apply_unresolved_position(
+    position_states: dict[tuple[int, str, str, str], _SecurityState],
+    row: dict,
+) -> None:
+    account_id = int(row["account_id"])
+    transaction_currency = str(row["currency"])
+    for state in position_states.values():
+        floor = _state_floor(state)
+        if (
+            state.account_id == account_id
+            and state.currency == transaction_currency
+            and (floor is None or str(row["trade_date"]) > floor)
+        ):
+            state.warnings.add("unresolved_position_transaction")
+            state.incomplete = True
+
+
+def _apply_cash_movement(
+    cash_states: dict[tuple[int, str, str], _CashState],
+    cash_anchors: dict[tuple[int, str, str], _ScopeAnchor],
+    initial_cash: dict[tuple[int, str], dict],
+    row: dict,
+    transaction_source_ref: dict | None,
+) -> None:
+    account_id = int(row["account_id"])
+    effective_date = str(row["cash_effective_date"] or row["trade_date"])
+    currency = str(row["currency"])
+    scope_keys = _scope_candidates_for_cash(
+        cash_states,
+        cash_anchors,
+        account_id=account_id,
+        currency=currency,
+    )
+    if not scope_keys:
+        for state in cash_states.values():
+            if state.account_id == account_id and state.currency == currency:
+                state.warnings.add("ambiguous_cash_scope_transaction")
                 state.incomplete = True
+        return
+    value = row["cash_delta"] if row["cash_delta"] is not None else row["net_amount"]
+    for scope_key in scope_keys:
+        state_key = (account_id, currency, scope_key)
+        state = cash_states.get(state_key)
+        if state is None:
+            anchor = cash_anchors.get(state_key)
+            if anchor is not None and effective_date <= anchor.as_of_date:
                 continue
-            delta = float(value)
-            if abs(delta) > EPSILON:
-                state.balance += delta
-                state.cash_movement = True
-                if transaction_source_ref is not None:
-                    state.movement_source_refs.append(transaction_source_ref)
+            initial = None if anchor is not None else initial_cash.get((account_id, currency))
+            state = _CashState(
+                account_id=account_id,
+                currency=currency,
+                scope_key=scope_key,
+                balance=float(initial["balance"]) if initial else 0.0,
+                anchor=anchor,
+                initial_date=str(initial["as_of_date"]) if initial else None,
+            )
+            cash_states[state_key] = state
+        floor = _state_floor(state)
+        if floor is not None and effective_date <= floor:
+            continue
+        if value is None:
+            state.warnings.add("missing_cash_delta")
+            state.incomplete = True
+            continue
+        delta = float(value)
+        if abs(delta) > EPSILON:
+            state.balance += delta
+            state.cash_movement = True
+            if transaction_source_ref is not None:
+                state.movement_source_refs.append(transaction_source_ref)
+
+
+def _apply_position_movement(
+    ticker_lineages: dict[int, tuple[str, tuple[str, ...]]],
+    position_states: dict[tuple[int, str, str, str], _SecurityState],
+    checkpoints: tuple[dict, dict],
+    movement: _Movement,
+) -> None:
+    position_anchors, initial_positions = checkpoints
+    if movement.kind == "successor":
+        # The source transaction is represented by the old -> new move;
+        # do not also treat generic name_change as a missing delta.
+        _apply_successor(
+            position_states,
+            position_anchors,
+            ticker_lineages,
+            movement.row,
+            movement.source_ref,
+        )
+    elif movement.kind == "security":
+        _apply_security_movement(
+            position_states,
+            position_anchors,
+            initial_positions,
+            ticker_lineages,
+            movement.row,
+            movement.source_ref,
+        )
+    else:
+        _apply_unresolved_position(position_states, movement.row)
+
+
+def _apply_cash_replay_movement(
+    cash_states: dict[tuple[int, str, str], _CashState],
+    checkpoints: tuple[dict, dict],
+    movement: _Movement,
+) -> None:
+    cash_anchors, initial_cash = checkpoints
+    _apply_cash_movement(cash_states, cash_anchors, initial_cash, movement.row, movement.source_ref)
 
-    for state in position_states.values():
-        _warn_for_incomplete_scope(state, latest_position_scope, section="position")
-    for state in cash_states.values():
-        _warn_for_incomplete_scope(state, latest_cash_scope, section="cash")
 
+class _AccountReplay:
+    """Carry one account's security or cash states forward through time.
+
+    While the account's checkpoints are unchanged and every newly eligible
+    movement sorts after those already applied, states advance in place.  A
+    new anchor, a closed movement window, or an out-of-order cash date rebuilds
+    the states from the checkpoint so each date matches a from-scratch replay.
+    """
+
+    def __init__(
+        self,
+        movements: list[_Movement],
+        *,
+        seed: Callable[[tuple], dict],
+        apply: Callable[[dict, tuple, _Movement], None],
+    ) -> None:
+        self._movements = movements
+        self._by_start = sorted(movements, key=lambda movement: (movement.start, movement.index))
+        self._starts = [movement.start for movement in self._by_start]
+        self._seed = seed
+        self._apply = apply
+        self._checkpoints: tuple | None = None
+        self._cursor = 0
+        self._last_index = -1
+        self._expires: str | None = None
+        self.states: dict = {}
+
+    def advance(self, as_of: str, checkpoints: tuple) -> dict:
+        end = bisect_right(self._starts, as_of)
+        fresh = sorted(
+            (
+                movement
+                for movement in self._by_start[self._cursor:end]
+                if movement.eligible(as_of)
+            ),
+            key=lambda movement: movement.index,
+        )
+        self._cursor = end
+        if (
+            checkpoints != self._checkpoints
+            or (self._expires is not None and self._expires <= as_of)
+            or (fresh and fresh[0].index < self._last_index)
+        ):
+            self._checkpoints = checkpoints
+            self.states = self._seed(checkpoints)
+            self._last_index = -1
+            self._expires = None
+            fresh = [movement for movement in self._movements if movement.eligible(as_of)]
+        for movement in fresh:
+            self._apply(self.states, checkpoints, movement)
+            self._last_index = movement.index
+            if movement.end is not None and (
+                self._expires is None or movement.end < self._expires
+            ):
+                self._expires = movement.end
+        return self.states
+
+
+def _account_checkpoints(
+    checkpoints: _Checkpoints,
+) -> dict[int, tuple[tuple[dict, dict], tuple[dict, dict]]]:
+    """Partition one date's checkpoints into per-account replay inputs."""
+    owned: dict[int, tuple[tuple[dict, dict], tuple[dict, dict]]] = defaultdict(
+        lambda: (({}, {}), ({}, {}))
+    )
+    for key, anchor in checkpoints.position_anchors.items():
+        owned[key[0]][0][0][key] = anchor
+    for key, row in checkpoints.initial_positions.items():
+        owned[key[0]][0][1][key] = row
+    for key, anchor in checkpoints.cash_anchors.items():
+        owned[key[0]][1][0][key] = anchor
+    for key, row in checkpoints.initial_cash.items():
+        owned[key[0]][1][1][key] = row
+    return owned
+
+
+def _detached(state: _SecurityState | _CashState) -> _SecurityState | _CashState:
+    """Copy a live replay state so one date's records never see later movements."""
+    detached = copy.copy(state)
+    detached.warnings = set(state.warnings)
+    detached.movement_source_refs = list(state.movement_source_refs)
+    return detached
+
+
+def _holding_records(
+    position_states: list[_SecurityState],
+    cash_states: list[_CashState],
+    *,
+    as_of: str,
+    checkpoints: _Checkpoints,
+    history: _LedgerHistory,
+) -> list[dict]:
     grouped_positions: dict[tuple[int, str, str], list[_SecurityState]] = defaultdict(list)
-    for state in position_states.values():
-        if abs(state.quantity) > EPSILON:
-            grouped_positions[(
-                state.account_id,
-                state.lineage_key or state.instrument_key,
-                state.currency,
-            )].append(state)
+    for state in position_states:
+        if abs(state.quantity) <= EPSILON:
+            continue
+        state = _detached(state)
+        _warn_for_incomplete_scope(state, checkpoints.latest_position_scope, section="position")
+        grouped_positions[(
+            state.account_id,
+            state.lineage_key or state.instrument_key,
+            state.currency,
+        )].append(state)
     records = [
         _security_record(
             _combine_security_states(states),
             as_of=as_of,
-            account=accounts[key[0]],
-            reconciliation_results=position_results,
+            account=history.accounts[key[0]],
+            reconciliation_results=history.position_results,
         )
         for key, states in grouped_positions.items()
     ]
     grouped_cash: dict[tuple[int, str], list[_CashState]] = defaultdict(list)
-    for state in cash_states.values():
-        if abs(state.balance) > EPSILON:
-            grouped_cash[(state.account_id, state.currency)].append(state)
+    for state in cash_states:
+        if abs(state.balance) <= EPSILON:
+            continue
+        state = _detached(state)
+        _warn_for_incomplete_scope(state, checkpoints.latest_cash_scope, section="cash")
+        grouped_cash[(state.account_id, state.currency)].append(state)
     records.extend(
         _cash_record(
             _combine_cash_states(states),
             as_of=as_of,
-            account=accounts[key[0]],
-            reconciliation_results=cash_results,
+            account=history.accounts[key[0]],
+            reconciliation_results=history.cash_results,
         )
         for key, states in grouped_cash.items()
     )
-    _apply_security_prices(records, as_of=as_of, market_path=market_path)
-    return _finalize_records(records)
+    return records
+
+
+def _cache_scope(account_ids: list[int]) -> str:
+    return ",".join(str(account_id) for account_id in sorted(set(account_ids))) or "*"
+
+
+def _read_cached_records(
+    conn: sqlite3.Connection,
+    dates: list[str],
+    scope: str,
+) -> dict[str, list[dict]]:
+    try:
+        rows = conn.execute(
+            """
+            SELECT as_of_date, rows_json
+              FROM holdings_cache
+             WHERE account_scope = ? AND engine_version = ?
+               AND as_of_date BETWEEN ? AND ?
+            """,
+            (scope, HOLDINGS_CACHE_VERSION, dates[0], dates[-1]),
+        ).fetchall()
+    except sqlite3.Error:
+        # A ledger that predates the cache table simply replays every date.
+        return {}
+    wanted = set(dates)
+    cached: dict[str, list[dict]] = {}
+    for row in rows:
+        if row["as_of_date"] not in wanted:
+            continue
+        records = json.loads(row["rows_json"])
+        for record in records:
+            record["quality_warnings"] = set(record["quality_warnings"])
+        cached[row["as_of_date"]] = records
+    return cached
+
+
+def _cache_generation(conn: sqlite3.Connection) -> str | None:
+    try:
+        row = conn.execute(
+            """
+            SELECT rows_json FROM holdings_cache
+             WHERE as_of_date = ? AND account_scope = ?
+            """,
+            _CACHE_GENERATION_KEY,
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return None if row is None else row[0]
+
+
+def _store_cached_records(
+    db_path: Path | str,
+    computed: dict[str, list[dict]],
+    scope: str,
+    generation: str | None,
+) -> None:
+    """Memoize unpriced replay records; a failed write only costs a later replay.
+
+    ``generation`` is the marker row seen by the snapshot the records were
+    replayed from.  Input writes clear the whole table, marker included, so the
+    rows are stored only while that marker is still present.  Otherwise a fresh
+    marker is planted and the next miss stores its rows.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=rw"
+    try:
+        conn = sqlite3.connect(
+            uri, uri=True, timeout=HOLDINGS_CACHE_WRITE_TIMEOUT, isolation_level=None
+        )
+    except sqlite3.Error:
+        return
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        current = _cache_generation(conn)
+        if current is None:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO holdings_cache(
+                    as_of_date, account_scope, engine_version, rows_json, created_at
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                (*_CACHE_GENERATION_KEY, HOLDINGS_CACHE_VERSION, uuid.uuid4().hex, utc_now_text()),
+            )
+        elif current == generation:
+            created_at = utc_now_text()
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO holdings_cache(
+                    as_of_date, account_scope, engine_version, rows_json, created_at
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        as_of,
+                        scope,
+                        HOLDINGS_CACHE_VERSION,
+                        json.dumps(records, default=sorted, separators=(",", ":")),
+                        created_at,
+                    )
+                    for as_of, records in computed.items()
+                ],
+            )
+            conn.execute(
+                """
+                DELETE FROM holdings_cache
+                 WHERE account_scope <> ?
+                   AND (engine_version <> ? OR (as_of_date, account_scope) IN (
+                        SELECT as_of_date, account_scope
+                          FROM holdings_cache
+                         WHERE account_scope <> ?
+                         ORDER BY created_at DESC, as_of_date DESC
+                         LIMIT -1 OFFSET ?
+                   ))
+                """,
+                (
+                    _CACHE_GENERATION_KEY[1],
+                    HOLDINGS_CACHE_VERSION,
+                    _CACHE_GENERATION_KEY[1],
+                    HOLDINGS_CACHE_MAX_ROWS,
+                ),
+            )
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        # Locked, read-only, or pre-cache ledgers keep serving replayed rows;
+        # the ledger itself is never touched here.
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+    finally:
+        conn.close()
+
+
+def _replay_records(
+    conn: sqlite3.Connection,
+    dates: list[str],
+    account_ids: list[int],
+) -> Iterator[tuple[str, list[dict]]]:
+    history = _fetch_history(conn, dates, account_ids)
+    if history is None:
+        for as_of in dates:
+            yield as_of, []
+        return
+
+    position_movements, cash_movements = _transaction_movements(history.transactions)
+    position_replays: dict[int, _AccountReplay] = {}
+    cash_replays: dict[int, _AccountReplay] = {}
+    for account_id in sorted(history.accounts):
+        position_replays[account_id] = _AccountReplay(
+            position_movements.get(account_id, []),
+            seed=functools.partial(
+                _seed_position_states,
+                account_id,
+                position_rows=history.position_rows,
+                ticker_lineages=history.ticker_lineages,
+            ),
+            apply=functools.partial(_apply_position_movement, history.ticker_lineages),
+        )
+        cash_replays[account_id] = _AccountReplay(
+            cash_movements.get(account_id, []),
+            seed=functools.partial(_seed_cash_states, account_id, cash_rows=history.cash_rows),
+            apply=_apply_cash_replay_movement,
+        )
+
+    for as_of, checkpoints in history.timeline:
+        position_states: list[_SecurityState] = []
+        cash_states: list[_CashState] = []
+        inputs = _account_checkpoints(checkpoints)
+        for account_id in sorted(history.accounts):
+            position_inputs, cash_inputs = inputs[account_id]
+            position_states.extend(
+                position_replays[account_id].advance(as_of, position_inputs).values()
+            )
+            cash_states.extend(cash_replays[account_id].advance(as_of, cash_inputs).values())
+        yield as_of, _holding_records(
+            position_states,
+            cash_states,
+            as_of=as_of,
+            checkpoints=checkpoints,
+            history=history,
+        )
+
+
+def holdings_series(
+    dates: Iterable[str],
+    account_ids: list[int] | None = None,
+    *,
+    path: Path | str | None = None,
+    market_path: Path | str | None = None,
+) -> Iterator[tuple[str, list[dict]]]:
+    """Yield ``(as_of, rows)`` for each distinct date in ascending order.
+
+    Dates already in ``holdings_cache`` for this account scope cost one indexed
+    read on the pooled read-only connection.  The remaining anchors, initials,
+    and transactions are read once up to the last missing date and swept
+    forward account by account in that same read snapshot, so requests never
+    take the ledger's write lock.  Replayed dates are then stored best-effort
+    through a short-lived connection.  Market prices are applied on every read
+    from one as-of grid covering the whole series.  Each row list is exactly
+    what :func:`holdings_at` returns for that date.
+    """
+    ordered = sorted(set(dates))
+    if not ordered:
+        return
+    selected_accounts = list(account_ids or [])
+    scope = _cache_scope(selected_accounts)
+    db_path = path if path is not None else sqlite_db.SQLITE_PATH
+    computed: dict[str, list[dict]] = {}
+    with sqlite_db.read_session(db_path) as conn:
+        # One read transaction, so cached and replayed dates share a snapshot.
+        conn.execute("BEGIN")
+        records_by_date = _read_cached_records(conn, ordered, scope)
+        missing = [as_of for as_of in ordered if as_of not in records_by_date]
+        if missing:
+            generation = _cache_generation(conn)
+            computed = dict(_replay_records(conn, missing, selected_accounts))
+            records_by_date.update(computed)
+    if computed:
+        _store_cached_records(db_path, computed, scope, generation)
+
+    prices = _load_market_prices(
+        {as_of: _market_symbols(records) for as_of, records in records_by_date.items()},
+        market_path=market_path,
+    )
+    for as_of in ordered:
+        records = records_by_date.pop(as_of)
+        _apply_security_prices(records, as_of=as_of, prices=prices[as_of])
+        yield as_of, _finalize_records(records)
+
+
+def holdings_at_many(
+    dates: Iterable[str],
+    account_ids: list[int] | None = None,
+    *,
+    path: Path | str | None = None,
+    market_path: Path | str | None = None,
+) -> dict[str, list[dict]]:
+    """Return :func:`holdings_at` rows for several dates from one shared fetch.
+
+    Comparison endpoints use this so two or more dates cost one ledger read,
+    one replay sweep, and one market connection instead of one of each per date.
+    """
+    return dict(holdings_series(dates, account_ids, path=path, market_path=market_path))
+
+
+def holdings_at(
+    as_of: str,
+    account_ids: list[int] | None = None,
+    *,
+    path: Path | str | None = None,
+    market_path: Path | str | None = None,
+) -> list[dict]:
+    """Return one native-currency holding row per account/instrument/currency.
+
+    The function never changes ledger facts; its unpriced replay output is
+    memoized in ``holdings_cache`` until an input table changes.  It makes a
+    complete scoped snapshot the anchor, applies only later normalized
+    movements, and returns quality/provenance metadata rather than
+    manufacturing an adjustment for uncertainty.
+    """
+    for _, rows in holdings_series([as_of], account_ids, path=path, market_path=market_path):
+        return rows
+    return []
 
 
 def holding_dates(
@@ -1334,7 +1891,7 @@ def holding_dates(
     """Return dates on which a complete cash or position checkpoint exists."""
     selected_accounts = list(account_ids or [])
     db_path = path if path is not None else sqlite_db.SQLITE_PATH
-    with sqlite_db.session(db_path) as conn:
+    with sqlite_db.read_session(db_path) as conn:
         account_sql, account_params = _account_clause("ss.account_id", selected_accounts)
         date_sql = " AND ss.as_of_date <= ?" if as_of else ""
         params: list = [*account_params]
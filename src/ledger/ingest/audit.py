@@ -59,13 +59,14 @@ def _text_dump(path: Path, root: Path) -> PdfText:
     )
 
 
-def _load_source(path: Path, root: Path) -> PdfText:
+def _load_source(path: Path, root: Path, text_cache_dir: Path | None = None) -> PdfText:
     if path.suffix.lower() == ".txt":
         return _text_dump(path, root)
     return extract_pdf(
         path,
         repo_root=root.parent,
         include_layout=path.parent.name == "RBC Invest Direct",
+        cache_dir=text_cache_dir,
     )
 
 
@@ -345,8 +346,12 @@ def audit_extraction(
     output: Path,
     institution: str | None = None,
     limit: int | None = None,
+    text_cache_dir: Path | None = None,
 ) -> dict:
-    """Parse a corpus without opening SQLite and write a deterministic JSONL report."""
+    """Parse a corpus without opening SQLite and write a deterministic JSONL report.
+
+    PDFs are read through the ingest text cache when ``text_cache_dir`` is set.
+    """
     root = statements_dir.resolve()
     paths = _discover(root, institution, limit)
     records: list[dict] = []
@@ -355,7 +360,7 @@ def audit_extraction(
         folder = path.parent.name
         log.debug("Auditing %s", path)
         try:
-            pdf = _load_source(path, root)
+            pdf = _load_source(path, root, text_cache_dir)
         except Exception as exc:
             records.append(
                 {
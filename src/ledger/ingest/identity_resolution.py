@@ -152,8 +152,55 @@ def _copy_database_identity(target: ParsedInstrument, row: sqlite3.Row) -> None:
     target.market_symbol = row["provider_symbol"] if "provider_symbol" in keys else None
 
 
+_RESOLVER_MEMO_KEY = "resolver_cache_version"
+
+
+def _resolver_generation(conn: sqlite3.Connection) -> str | None:
+    try:
+        row = conn.execute(
+            "SELECT value FROM schema_meta WHERE key = ?",
+            (sqlite_db.RESOLVER_GENERATION_KEY,),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return None if row is None else str(row[0])
+
+
 def resolver_cache_version(conn: sqlite3.Connection) -> str:
-    """Version the resolver together with user-reviewed identity inputs."""
+    """Version the resolver together with user-reviewed identity inputs.
+
+    The fingerprint is memoized in ``schema_meta`` against the trigger-bumped
+    ``resolver_inputs_generation`` counter, so repeated calls within and across
+    runs skip the four input scans until an input row actually changes.  The
+    memo is written in the caller's transaction and rolls back with it.
+    """
+    generation = _resolver_generation(conn)
+    if generation is None:
+        return _compute_resolver_cache_version(conn)
+    stamp = f"{RESOLVER_VERSION}/{CATALOG_VERSION}/{generation}"
+    memo = conn.execute(
+        "SELECT value FROM schema_meta WHERE key = ?", (_RESOLVER_MEMO_KEY,)
+    ).fetchone()
+    if memo is not None:
+        memo_stamp, _, version = str(memo[0]).partition(" ")
+        if memo_stamp == stamp and version:
+            return version
+    version = _compute_resolver_cache_version(conn)
+    try:
+        conn.execute(
+            """
+            INSERT INTO schema_meta(key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (_RESOLVER_MEMO_KEY, f"{stamp} {version}"),
+        )
+    except sqlite3.OperationalError:
+        # Read-only connections still get the correct, uncached version.
+        pass
+    return version
+
+
+def _compute_resolver_cache_version(conn: sqlite3.Connection) -> str:
     aliases = [
         tuple(row)
         for row in conn.execute(
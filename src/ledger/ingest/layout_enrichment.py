@@ -320,18 +320,22 @@ def _write_source_geometry(
                 line_hint=evidence["line_number"],
                 allowed_pages=(allowed_pages_by_evidence or {}).get(evidence_id),
             )
+        page_numbers = sorted({
+            stored_lines[index].line.page_number for index in match.line_indexes
+        })
         conn.execute(
             """
             INSERT INTO source_evidence_geometry(
                 evidence_id, extractor_version, source_sha256, status,
-                match_method, confidence, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ','now'))
+                match_method, confidence, page_numbers, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ','now'))
             ON CONFLICT(evidence_id) DO UPDATE SET
                 extractor_version = excluded.extractor_version,
                 source_sha256 = excluded.source_sha256,
                 status = excluded.status,
                 match_method = excluded.match_method,
                 confidence = excluded.confidence,
+                page_numbers = excluded.page_numbers,
                 updated_at = excluded.updated_at
             """,
             (
@@ -341,6 +345,7 @@ def _write_source_geometry(
                 match.status,
                 match.method,
                 match.confidence,
+                ",".join(str(page) for page in page_numbers),
             ),
         )
         for ordinal, index in enumerate(match.line_indexes):
@@ -4,7 +4,14 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from dataclasses import asdict
+import multiprocessing
+import time
+import traceback
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from .. import config
@@ -13,19 +20,21 @@ from ..domains import utc_now_text
 from ..identity import canonical_statement_key, evidence_occurrence
 from ..logging_setup import get_logger
 from ..parsers import registry  # noqa: F401  (ensures parsers register)
-from ..parsers.registry import all_parsers, select_parser
+from ..parsers.registry import all_parsers, first_page_skip_reason, select_parser
 from ..parsers.types import (
     PARSER_CONTRACT_VERSION,
+    ParsedInstrument,
     ParsedQuarantine,
     ParsedStatement,
     ParseResult,
     SourceSpan,
 )
-from ..parsers.validation import validate_parse_result
-from ..pdf_text import PdfText, extract_pdf
+from ..parsers.validation import ValidationMemo, validate_parse_result
+from ..pdf_text import PdfText, extract_first_page, extract_pdf
 from ..quantity import normalized_position_delta
 from ..ticker_changes import enrich_ticker_change_transactions, record_ticker_change
 from .identity_resolution import resolve_parse_result, resolver_cache_version
+from .reconcile import ReconcileScope, reconcile_after_ingest, touched_scopes
 
 log = get_logger("ingest")
 
@@ -37,6 +46,33 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
+# Per-stage costs of one attempt: ``{stage: {"wall_ms": ..., "cpu_ms": ...}}``.
+StageTimings = dict[str, dict[str, float]]
+
+
+@contextmanager
+def _stage(timings: StageTimings, name: str) -> Iterator[None]:
+    """Add the wall and CPU time spent in the block to ``timings[name]``.
+
+    CPU time is this process's, which is the source's own cost because a
+    worker prepares one source at a time.
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        spent = timings.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+        spent["wall_ms"] = round(spent["wall_ms"] + (time.perf_counter() - wall) * 1000, 3)
+        spent["cpu_ms"] = round(spent["cpu_ms"] + (time.process_time() - cpu) * 1000, 3)
+
+
+def _timed_sha256(path: Path) -> tuple[str, StageTimings]:
+    timings: StageTimings = {}
+    with _stage(timings, "hash"):
+        sha256 = _sha256_file(path)
+    return sha256, timings
+
+
 def _current_parser_version(parser_name: str | None) -> str | None:
     if parser_name is None:
         return None
@@ -44,68 +80,100 @@ def _current_parser_version(parser_name: str | None) -> str | None:
     return matches[0] if len(matches) == 1 else None
 
 
-def _unchanged_source_file_id(conn, *, relpath: str, sha256: str) -> int | None:
-    """Return a source only when its *active* extraction contract is current.
+@dataclass(frozen=True)
+class _CacheState:
+    """A source's active run, or its latest run when nothing is active."""
+
+    source_file_id: int
+    has_active: bool
+    sha256: str | None
+    status: str | None
+    parser_name: str | None
+    parser_version: str | None
+    contract_version: str | None
+    schema_version: int | None
+    resolver_version: str | None
+
+
+def _cache_states(conn, *, relpath: str | None = None) -> dict[str, _CacheState]:
+    """Load the cache-relevant run of every source (or one relpath) in one query."""
+    rows = conn.execute(
+        f"""
+        SELECT sf.relpath, sf.source_file_id,
+               sf.active_ingestion_run_id IS NOT NULL AS has_active,
+               ir.source_sha256, ir.status, ir.parser_name, ir.parser_version,
+               ir.contract_version, ir.schema_version, ir.resolver_version
+          FROM source_files sf
+          LEFT JOIN (
+              SELECT source_file_id, MAX(ingestion_run_id) AS latest_run_id
+                FROM ingestion_runs
+               GROUP BY source_file_id
+          ) latest ON latest.source_file_id = sf.source_file_id
+          LEFT JOIN ingestion_runs ir
+            ON ir.ingestion_run_id = COALESCE(sf.active_ingestion_run_id, latest.latest_run_id)
+         {"WHERE sf.relpath = ?" if relpath is not None else ""}
+        """,
+        (relpath,) if relpath is not None else (),
+    )
+    return {
+        row["relpath"]: _CacheState(
+            source_file_id=int(row["source_file_id"]),
+            has_active=bool(row["has_active"]),
+            sha256=row["source_sha256"],
+            status=row["status"],
+            parser_name=row["parser_name"],
+            parser_version=row["parser_version"],
+            contract_version=row["contract_version"],
+            schema_version=row["schema_version"],
+            resolver_version=row["resolver_version"],
+        )
+        for row in rows
+    }
+
+
+def _stale_reason(
+    state: _CacheState | None, *, sha256: str, resolver_version: str
+) -> str | None:
+    """Why a source must be parsed again, or ``None`` when its run is current.
 
     A source path alone is not a cache key.  A parser/contract/schema/resolver
     change must cause a reparse without requiring an operator to remember
     ``--force``.
     """
-    resolver_version = resolver_cache_version(conn)
-    active = conn.execute(
-        """
-        SELECT sf.source_file_id, ir.parser_name, ir.parser_version,
-               ir.contract_version, ir.schema_version, ir.resolver_version
-          FROM source_files sf
-          JOIN ingestion_runs ir ON ir.ingestion_run_id = sf.active_ingestion_run_id
-         WHERE sf.relpath = ?
-           AND ir.source_sha256 = ?
-           AND ir.status = 'active'
-        """,
-        (relpath, sha256),
-    ).fetchone()
-    if active is not None:
-        if (
-            _current_parser_version(active["parser_name"]) == active["parser_version"]
-            and active["contract_version"] == PARSER_CONTRACT_VERSION
-            and active["schema_version"] == sqlite_db.SCHEMA_VERSION
-            and active["resolver_version"] == resolver_version
-        ):
-            return int(active["source_file_id"])
-        return None
-
-    # Image-only inputs have no active ledger data.  Cache only an unchanged
-    # terminal skip; failures intentionally retry so an extractor/parser fix
-    # can recover them automatically.
-    skipped = conn.execute(
-        """
-        SELECT sf.source_file_id, ir.contract_version, ir.schema_version,
-               ir.resolver_version
-          FROM source_files sf
-          JOIN ingestion_runs ir ON ir.ingestion_run_id = (
-              SELECT newer.ingestion_run_id
-                FROM ingestion_runs newer
-               WHERE newer.source_file_id = sf.source_file_id
-               ORDER BY newer.ingestion_run_id DESC
-               LIMIT 1
-          )
-         WHERE sf.relpath = ?
-           AND sf.active_ingestion_run_id IS NULL
-           AND ir.source_sha256 = ?
-           AND ir.status = 'skipped'
-           AND ir.parser_name IS NULL
-        """,
-        (relpath, sha256),
-    ).fetchone()
-    if skipped is not None and (
-        skipped["contract_version"] == PARSER_CONTRACT_VERSION
-        and skipped["schema_version"] == sqlite_db.SCHEMA_VERSION
-        and skipped["resolver_version"] == resolver_version
-    ):
-        return int(skipped["source_file_id"])
+    if state is None or state.status is None:
+        return "new source"
+    if state.sha256 != sha256:
+        return "content changed"
+    if state.has_active:
+        if state.status != "active":
+            return f"active run is {state.status}"
+        current_parser = _current_parser_version(state.parser_name)
+        if current_parser != state.parser_version:
+            return (
+                f"parser {state.parser_name} {state.parser_version} -> "
+                f"{current_parser or 'unregistered'}"
+            )
+    elif state.status != "skipped" or state.parser_name is not None:
+        # Image-only inputs have no active ledger data.  Cache only an
+        # unchanged terminal skip; failures intentionally retry so an
+        # extractor/parser fix can recover them automatically.
+        return f"retry {state.status} attempt"
+    if state.contract_version != PARSER_CONTRACT_VERSION:
+        return f"contract {state.contract_version} -> {PARSER_CONTRACT_VERSION}"
+    if state.schema_version != sqlite_db.SCHEMA_VERSION:
+        return f"schema {state.schema_version} -> {sqlite_db.SCHEMA_VERSION}"
+    if state.resolver_version != resolver_version:
+        return "resolver inputs changed"
     return None
 
 
+def _unchanged_source_file_id(conn, *, relpath: str, sha256: str) -> int | None:
+    """Return a source only when its *active* extraction contract is current."""
+    state = _cache_states(conn, relpath=relpath).get(relpath)
+    reason = _stale_reason(state, sha256=sha256, resolver_version=resolver_cache_version(conn))
+    return state.source_file_id if state is not None and reason is None else None
+
+
 def _ensure_source_file(conn, pdf: PdfText) -> int:
     conn.execute(
         """
@@ -162,6 +230,7 @@ def _record_source_file(
     parser_version: str | None,
     parse_status: str,
     error_summary: str | None = None,
+    timings: StageTimings | None = None,
 ) -> int:
     """Record a non-staged attempt, preserving an existing active source.
 
@@ -193,15 +262,13 @@ def _record_source_file(
         status=parse_status,
         error_summary=error_summary,
         resolver_version=resolver_cache_version(conn),
+        timings=timings,
     )
     return source_file_id
 
 
-def _write_evidence(
-    conn,
+def _evidence_row(
     *,
-    source_file_id: int,
-    run_id: int,
     parser_version: str | None,
     statement_key: str,
     row_kind: str,
@@ -209,22 +276,47 @@ def _write_evidence(
     raw_text: str | None,
     source_span: SourceSpan | None,
     default_rule: str,
-) -> int:
+) -> dict[str, object]:
     span = source_span or SourceSpan()
-    return sqlite_db.upsert_source_evidence(
-        conn,
-        source_file_id=source_file_id,
-        ingestion_run_id=run_id,
-        row_kind=row_kind,
-        occurrence=evidence_occurrence(statement_key, row_kind, row_index),
-        raw_text=span.raw_text if span.raw_text is not None else raw_text,
-        parser_version=parser_version,
-        parser_rule=span.parser_rule or default_rule,
-        page_number=span.page_number,
-        line_number=span.line_number,
-        bbox=span.bbox,
-        words=span.words,
-    )
+    return {
+        "row_kind": row_kind,
+        "occurrence": evidence_occurrence(statement_key, row_kind, row_index),
+        "raw_text": span.raw_text if span.raw_text is not None else raw_text,
+        "parser_version": parser_version,
+        "parser_rule": span.parser_rule or default_rule,
+        "page_number": span.page_number,
+        "line_number": span.line_number,
+        "bbox": span.bbox,
+        "words": span.words,
+    }
+
+
+def _instrument_spec(
+    instrument: ParsedInstrument,
+    *,
+    resolution_method: str | None,
+    resolution_confidence: float | None,
+) -> dict[str, object]:
+    return {
+        "asset_type": instrument.asset_type,
+        "symbol": instrument.symbol,
+        "currency": instrument.currency,
+        "exchange": instrument.exchange,
+        "name": instrument.name,
+        "option_root": instrument.option_root,
+        "option_expiry": instrument.option_expiry,
+        "option_strike": instrument.option_strike,
+        "option_type": instrument.option_type,
+        "option_multiplier": instrument.option_multiplier,
+        "resolution_method": resolution_method,
+        "resolution_confidence": resolution_confidence,
+        "issuer_key": instrument.issuer_key,
+        "issuer_name": instrument.issuer_name,
+        "security_key": instrument.security_key,
+        "security_name": instrument.security_name,
+        "journalable": instrument.journalable,
+        "market_symbol": instrument.market_symbol,
+    }
 
 
 def _quarantine_parts(
@@ -334,22 +426,105 @@ def _write_statement(
         (statement_id, source_file_id, acct_id),
     )
 
-    snapshot_sets: dict[tuple[str, str, str], int] = {}
-    for set_index, parsed_set in enumerate(stmt.snapshot_sets):
-        evidence_id = None
-        if parsed_set.source_span is not None:
-            evidence_id = _write_evidence(
-                conn,
-                source_file_id=source_file_id,
-                run_id=run_id,
+    # Evidence rows are collected in the order sequential writes would have
+    # created them, so one batched upsert assigns the same evidence IDs.
+    evidence_rows: list[dict[str, object]] = []
+
+    def evidence(**row) -> int:
+        evidence_rows.append(
+            _evidence_row(
                 parser_version=parser_version,
                 statement_key=persisted_statement_key,
-                row_kind=f"snapshot_set_{parsed_set.section_type}",
-                row_index=set_index,
-                raw_text=None,
-                source_span=parsed_set.source_span,
-                default_rule="parser:snapshot-set",
+                **row,
             )
+        )
+        return len(evidence_rows) - 1
+
+    set_evidence = {
+        set_index: evidence(
+            row_kind=f"snapshot_set_{parsed_set.section_type}",
+            row_index=set_index,
+            raw_text=None,
+            source_span=parsed_set.source_span,
+            default_rule="parser:snapshot-set",
+        )
+        for set_index, parsed_set in enumerate(stmt.snapshot_sets)
+        if parsed_set.source_span is not None
+    }
+    txn_evidence = []
+    for row_index, t in enumerate(stmt.transactions):
+        if t.related_instrument is not None and (
+            t.instrument is None or t.txn_type != "name_change"
+        ):
+            raise ValueError("related instrument requires a resolved name-change source")
+        txn_evidence.append((
+            evidence(
+                row_kind="transaction",
+                row_index=row_index,
+                raw_text=t.raw_line,
+                source_span=t.source_span,
+                default_rule="parser:transaction",
+            ),
+            None if t.resolution_evidence is None else evidence(
+                row_kind="transaction_resolution",
+                row_index=row_index,
+                raw_text=t.raw_line,
+                source_span=t.resolution_evidence,
+                default_rule="resolver:unspecified",
+            ),
+        ))
+    position_evidence = [
+        evidence(
+            row_kind="position",
+            row_index=row_index,
+            raw_text=p.raw_line,
+            source_span=p.source_span,
+            default_rule="parser:position",
+        )
+        for row_index, p in enumerate(stmt.positions)
+    ]
+    cash_evidence = [
+        evidence(
+            row_kind="cash",
+            row_index=row_index,
+            raw_text=c.raw_line,
+            source_span=c.source_span,
+            default_rule="parser:cash",
+        )
+        for row_index, c in enumerate(stmt.cash_balances)
+    ]
+    quarantine_parts = [_quarantine_parts(item) for item in stmt.quarantine]
+    quarantine_evidence = [
+        evidence(
+            row_kind="quarantine",
+            row_index=row_index,
+            raw_text=raw,
+            source_span=span,
+            default_rule="parser:quarantine",
+        )
+        for row_index, (raw, _reason, span) in enumerate(quarantine_parts)
+    ]
+    issue_evidence = {
+        (set_index, issue_index): evidence(
+            row_kind=f"scope_issue_{parsed_set.section_type}",
+            row_index=set_index * 10_000 + issue_index,
+            raw_text=issue.source_span.raw_text,
+            source_span=issue.source_span,
+            default_rule="parser:scope-issue",
+        )
+        for set_index, parsed_set in enumerate(stmt.snapshot_sets)
+        for issue_index, issue in enumerate(parsed_set.issues)
+        if issue.source_span is not None
+    }
+    evidence_ids = sqlite_db.upsert_source_evidence_rows(
+        conn,
+        source_file_id=source_file_id,
+        ingestion_run_id=run_id,
+        rows=evidence_rows,
+    )
+
+    snapshot_sets: dict[tuple[str, str, str], int] = {}
+    for set_index, parsed_set in enumerate(stmt.snapshot_sets):
         key = (parsed_set.currency, parsed_set.section_type, parsed_set.scope_key)
         snapshot_sets[key] = sqlite_db.upsert_snapshot_set(
             conn,
@@ -360,7 +535,11 @@ def _write_statement(
             section_type=parsed_set.section_type,
             scope_key=parsed_set.scope_key,
             completeness=parsed_set.completeness,
-            evidence_id=evidence_id,
+            evidence_id=(
+                evidence_ids[set_evidence[set_index]]
+                if set_index in set_evidence
+                else None
+            ),
             opening_total=parsed_set.opening_total,
             reported_change=parsed_set.reported_change,
             reported_total=parsed_set.reported_total,
@@ -392,277 +571,224 @@ def _write_statement(
             validation_status="warning",
         )
 
-    for row_index, t in enumerate(stmt.transactions):
-        evidence_id = _write_evidence(
-            conn,
-            source_file_id=source_file_id,
-            run_id=run_id,
-            parser_version=parser_version,
-            statement_key=persisted_statement_key,
-            row_kind="transaction",
-            row_index=row_index,
-            raw_text=t.raw_line,
-            source_span=t.source_span,
-            default_rule="parser:transaction",
-        )
-        resolution_evidence_id = None
-        if t.resolution_evidence is not None:
-            resolution_evidence_id = _write_evidence(
-                conn,
-                source_file_id=source_file_id,
-                run_id=run_id,
-                parser_version=parser_version,
-                statement_key=persisted_statement_key,
-                row_kind="transaction_resolution",
-                row_index=row_index,
-                raw_text=t.raw_line,
-                source_span=t.resolution_evidence,
-                default_rule="resolver:unspecified",
-            )
-        instr_id = None
+    # Instruments are resolved in sequential-write order: each transaction's
+    # instrument, then its related instrument, then each position's.
+    instrument_specs: list[dict[str, object]] = []
+    txn_instruments: list[tuple[int | None, int | None]] = []
+    for t in stmt.transactions:
+        instr_index = related_index = None
         if t.instrument is not None:
-            i = t.instrument
-            instr_id = sqlite_db.upsert_instrument(
-                conn,
-                asset_type=i.asset_type, symbol=i.symbol, currency=i.currency,
-                exchange=i.exchange, name=i.name,
-                option_root=i.option_root, option_expiry=i.option_expiry,
-                option_strike=i.option_strike, option_type=i.option_type,
-                option_multiplier=i.option_multiplier,
-                resolution_method=t.resolution_method or i.resolution_method,
+            instr_index = len(instrument_specs)
+            instrument_specs.append(_instrument_spec(
+                t.instrument,
+                resolution_method=t.resolution_method or t.instrument.resolution_method,
                 resolution_confidence=(
                     t.resolution_confidence
                     if t.resolution_confidence is not None
-                    else i.resolution_confidence
+                    else t.instrument.resolution_confidence
                 ),
-                issuer_key=i.issuer_key,
-                issuer_name=i.issuer_name,
-                security_key=i.security_key,
-                security_name=i.security_name,
-                journalable=i.journalable,
-                market_symbol=i.market_symbol,
-            )
-        related_instr_id = None
+            ))
         if t.related_instrument is not None:
-            related = t.related_instrument
-            related_instr_id = sqlite_db.upsert_instrument(
-                conn,
-                asset_type=related.asset_type,
-                symbol=related.symbol,
-                currency=related.currency,
-                exchange=related.exchange,
-                name=related.name,
-                option_root=related.option_root,
-                option_expiry=related.option_expiry,
-                option_strike=related.option_strike,
-                option_type=related.option_type,
-                option_multiplier=related.option_multiplier,
-                resolution_method=related.resolution_method,
-                resolution_confidence=related.resolution_confidence,
-                issuer_key=related.issuer_key,
-                issuer_name=related.issuer_name,
-                security_key=related.security_key,
-                security_name=related.security_name,
-                journalable=related.journalable,
-                market_symbol=related.market_symbol,
-            )
+            related_index = len(instrument_specs)
+            instrument_specs.append(_instrument_spec(
+                t.related_instrument,
+                resolution_method=t.related_instrument.resolution_method,
+                resolution_confidence=t.related_instrument.resolution_confidence,
+            ))
+        txn_instruments.append((instr_index, related_index))
+    position_instruments = []
+    for p in stmt.positions:
+        position_instruments.append(len(instrument_specs))
+        instrument_specs.append(_instrument_spec(
+            p.instrument,
+            resolution_method=p.instrument.resolution_method,
+            resolution_confidence=p.instrument.resolution_confidence,
+        ))
+    instrument_ids = sqlite_db.upsert_instruments(conn, instrument_specs)
+
+    transaction_rows = []
+    for t, (evidence_index, resolution_index), (instr_index, _related) in zip(
+        stmt.transactions, txn_evidence, txn_instruments, strict=True
+    ):
         position_effect = (
             t.position_delta
             if t.position_delta is not None
             else normalized_position_delta(t.txn_type, t.quantity)
         )
         cash_effect = t.cash_delta if t.cash_delta is not None else t.net_amount
-        transaction_id = int(conn.execute(
-            """INSERT INTO transactions
-            (account_id, statement_id, source_file_id, ingestion_run_id,
-             evidence_id, trade_date, settle_date, txn_type, instrument_id,
-             quantity, position_delta, price, gross_amount, commission,
-             other_fees, net_amount, cash_delta, cash_effective_date, currency,
-             tax_country, tax_rate, description, raw_line, parser_confidence,
-             resolution_method, resolution_confidence, resolution_evidence_id)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            RETURNING transaction_id""",
-            (
-                acct_id, statement_id, source_file_id, run_id, evidence_id,
-                t.trade_date, t.settle_date, t.txn_type, instr_id, t.quantity,
-                position_effect, t.price, t.gross_amount, t.commission,
-                t.other_fees, t.net_amount, cash_effect,
-                t.cash_effective_date or t.settle_date or t.trade_date,
-                t.currency, t.tax_country, t.tax_rate, t.description,
-                t.raw_line, t.parser_confidence, t.resolution_method,
-                t.resolution_confidence, resolution_evidence_id,
-            ),
-        ).fetchone()[0])
-        if related_instr_id is not None:
-            if instr_id is None or t.txn_type != "name_change":
-                raise ValueError("related instrument requires a resolved name-change source")
+        transaction_rows.append((
+            acct_id, statement_id, source_file_id, run_id,
+            evidence_ids[evidence_index],
+            t.trade_date, t.settle_date, t.txn_type,
+            None if instr_index is None else instrument_ids[instr_index],
+            t.quantity, position_effect, t.price, t.gross_amount, t.commission,
+            t.other_fees, t.net_amount, cash_effect,
+            t.cash_effective_date or t.settle_date or t.trade_date,
+            t.currency, t.tax_country, t.tax_rate, t.description,
+            t.raw_line, t.parser_confidence, t.resolution_method,
+            t.resolution_confidence,
+            None if resolution_index is None else evidence_ids[resolution_index],
+        ))
+    conn.executemany(
+        """INSERT INTO transactions
+        (account_id, statement_id, source_file_id, ingestion_run_id,
+         evidence_id, trade_date, settle_date, txn_type, instrument_id,
+         quantity, position_delta, price, gross_amount, commission,
+         other_fees, net_amount, cash_delta, cash_effective_date, currency,
+         tax_country, tax_rate, description, raw_line, parser_confidence,
+         resolution_method, resolution_confidence, resolution_evidence_id)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        transaction_rows,
+    )
+    if any(related is not None for _instr, related in txn_instruments):
+        # Child rows were cleared above, so this statement's IDs are exactly
+        # the rows just inserted, in insertion order.
+        transaction_ids = [
+            int(row[0])
+            for row in conn.execute(
+                "SELECT transaction_id FROM transactions "
+                "WHERE statement_id = ? ORDER BY transaction_id",
+                (statement_id,),
+            )
+        ]
+        for t, transaction_id, (evidence_index, _), (instr_index, related_index) in zip(
+            stmt.transactions, transaction_ids, txn_evidence, txn_instruments, strict=True
+        ):
+            if related_index is None:
+                continue
             record_ticker_change(
                 conn,
-                from_instrument_id=instr_id,
-                to_instrument_id=related_instr_id,
+                from_instrument_id=instrument_ids[instr_index],
+                to_instrument_id=instrument_ids[related_index],
                 effective_date=t.trade_date,
                 conversion_ratio=t.corporate_action_ratio or 1.0,
                 transaction_id=transaction_id,
-                evidence_id=evidence_id,
+                evidence_id=evidence_ids[evidence_index],
                 resolution_method=t.resolution_method or "printed_ticker_change",
                 resolution_confidence=t.resolution_confidence or 1.0,
             )
 
-    for row_index, p in enumerate(stmt.positions):
-        evidence_id = _write_evidence(
-            conn,
-            source_file_id=source_file_id,
-            run_id=run_id,
-            parser_version=parser_version,
-            statement_key=persisted_statement_key,
-            row_kind="position",
-            row_index=row_index,
-            raw_text=p.raw_line,
-            source_span=p.source_span,
-            default_rule="parser:position",
-        )
-        i = p.instrument
-        instr_id = sqlite_db.upsert_instrument(
-            conn,
-            asset_type=i.asset_type, symbol=i.symbol, currency=i.currency,
-            exchange=i.exchange, name=i.name,
-            option_root=i.option_root, option_expiry=i.option_expiry,
-            option_strike=i.option_strike, option_type=i.option_type,
-            option_multiplier=i.option_multiplier,
-            resolution_method=i.resolution_method,
-            resolution_confidence=i.resolution_confidence,
-            issuer_key=i.issuer_key,
-            issuer_name=i.issuer_name,
-            security_key=i.security_key,
-            security_name=i.security_name,
-            journalable=i.journalable,
-            market_symbol=i.market_symbol,
-        )
-        conn.execute(
-            """INSERT INTO position_snapshots
-            (statement_id, snapshot_set_id, evidence_id, account_id, as_of_date,
-             instrument_id, quantity, avg_cost, book_value, market_price,
-             market_value, unrealized_pnl, currency, raw_line)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            ON CONFLICT(snapshot_set_id, instrument_id) DO UPDATE SET
-                quantity = CASE
-                    WHEN COALESCE(position_snapshots.raw_line, '') =
-                         COALESCE(excluded.raw_line, '')
-                    THEN position_snapshots.quantity
-                    ELSE position_snapshots.quantity + excluded.quantity
-                END,
-                avg_cost = CASE
-                    WHEN COALESCE(position_snapshots.raw_line, '') =
-                         COALESCE(excluded.raw_line, '')
-                    THEN position_snapshots.avg_cost
-                    ELSE NULL
-                END,
-                book_value = CASE
-                    WHEN COALESCE(position_snapshots.raw_line, '') =
-                         COALESCE(excluded.raw_line, '')
-                    THEN position_snapshots.book_value
-                    WHEN position_snapshots.book_value IS NOT NULL
-                     AND excluded.book_value IS NOT NULL
-                    THEN position_snapshots.book_value + excluded.book_value
-                    ELSE NULL
-                END,
-                market_price = CASE
-                    WHEN position_snapshots.market_price IS NULL
-                    THEN excluded.market_price
-                    WHEN excluded.market_price IS NULL
-                    THEN position_snapshots.market_price
-                    WHEN ABS(position_snapshots.market_price - excluded.market_price) <= 1e-9
-                    THEN position_snapshots.market_price
-                    ELSE NULL
-                END,
-                market_value = CASE
-                    WHEN COALESCE(position_snapshots.raw_line, '') =
-                         COALESCE(excluded.raw_line, '')
-                    THEN position_snapshots.market_value
-                    WHEN position_snapshots.market_value IS NOT NULL
-                     AND excluded.market_value IS NOT NULL
-                    THEN position_snapshots.market_value + excluded.market_value
-                    ELSE NULL
-                END,
-                unrealized_pnl = CASE
-                    WHEN COALESCE(position_snapshots.raw_line, '') =
-                         COALESCE(excluded.raw_line, '')
-                    THEN position_snapshots.unrealized_pnl
-                    WHEN position_snapshots.unrealized_pnl IS NOT NULL
-                     AND excluded.unrealized_pnl IS NOT NULL
-                    THEN position_snapshots.unrealized_pnl + excluded.unrealized_pnl
-                    ELSE NULL
-                END,
-                raw_line = CASE
-                    WHEN COALESCE(position_snapshots.raw_line, '') =
-                         COALESCE(excluded.raw_line, '')
-                    THEN position_snapshots.raw_line
-                    ELSE COALESCE(position_snapshots.raw_line || char(10), '') ||
-                         COALESCE(excluded.raw_line, '')
-                END""",
+    conn.executemany(
+        """INSERT INTO position_snapshots
+        (statement_id, snapshot_set_id, evidence_id, account_id, as_of_date,
+         instrument_id, quantity, avg_cost, book_value, market_price,
+         market_value, unrealized_pnl, currency, raw_line)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        ON CONFLICT(snapshot_set_id, instrument_id) DO UPDATE SET
+            quantity = CASE
+                WHEN COALESCE(position_snapshots.raw_line, '') =
+                     COALESCE(excluded.raw_line, '')
+                THEN position_snapshots.quantity
+                ELSE position_snapshots.quantity + excluded.quantity
+            END,
+            avg_cost = CASE
+                WHEN COALESCE(position_snapshots.raw_line, '') =
+                     COALESCE(excluded.raw_line, '')
+                THEN position_snapshots.avg_cost
+                ELSE NULL
+            END,
+            book_value = CASE
+                WHEN COALESCE(position_snapshots.raw_line, '') =
+                     COALESCE(excluded.raw_line, '')
+                THEN position_snapshots.book_value
+                WHEN position_snapshots.book_value IS NOT NULL
+                 AND excluded.book_value IS NOT NULL
+                THEN position_snapshots.book_value + excluded.book_value
+                ELSE NULL
+            END,
+            market_price = CASE
+                WHEN position_snapshots.market_price IS NULL
+                THEN excluded.market_price
+                WHEN excluded.market_price IS NULL
+                THEN position_snapshots.market_price
+                WHEN ABS(position_snapshots.market_price - excluded.market_price) <= 1e-9
+                THEN position_snapshots.market_price
+                ELSE NULL
+            END,
+            market_value = CASE
+                WHEN COALESCE(position_snapshots.raw_line, '') =
+                     COALESCE(excluded.raw_line, '')
+                THEN position_snapshots.market_value
+                WHEN position_snapshots.market_value IS NOT NULL
+                 AND excluded.market_value IS NOT NULL
+                THEN position_snapshots.market_value + excluded.market_value
+                ELSE NULL
+            END,
+            unrealized_pnl = CASE
+                WHEN COALESCE(position_snapshots.raw_line, '') =
+                     COALESCE(excluded.raw_line, '')
+                THEN position_snapshots.unrealized_pnl
+                WHEN position_snapshots.unrealized_pnl IS NOT NULL
+                 AND excluded.unrealized_pnl IS NOT NULL
+                THEN position_snapshots.unrealized_pnl + excluded.unrealized_pnl
+                ELSE NULL
+            END,
+            raw_line = CASE
+                WHEN COALESCE(position_snapshots.raw_line, '') =
+                     COALESCE(excluded.raw_line, '')
+                THEN position_snapshots.raw_line
+                ELSE COALESCE(position_snapshots.raw_line || char(10), '') ||
+                     COALESCE(excluded.raw_line, '')
+            END""",
+        [
             (
                 statement_id,
                 snapshot_sets[(p.currency, "positions", p.scope_key)],
-                evidence_id, acct_id, stmt.period_end, instr_id, p.quantity,
+                evidence_ids[evidence_index], acct_id, stmt.period_end,
+                instrument_ids[instr_index], p.quantity,
                 p.avg_cost, p.book_value, p.market_price, p.market_value,
                 p.unrealized_pnl, p.currency, p.raw_line,
-            ),
-        )
+            )
+            for p, evidence_index, instr_index in zip(
+                stmt.positions, position_evidence, position_instruments, strict=True
+            )
+        ],
+    )
 
-    for row_index, c in enumerate(stmt.cash_balances):
-        evidence_id = _write_evidence(
-            conn,
-            source_file_id=source_file_id,
-            run_id=run_id,
-            parser_version=parser_version,
-            statement_key=persisted_statement_key,
-            row_kind="cash",
-            row_index=row_index,
-            raw_text=c.raw_line,
-            source_span=c.source_span,
-            default_rule="parser:cash",
-        )
-        conn.execute(
-            """INSERT INTO cash_balances
-            (statement_id, snapshot_set_id, evidence_id, account_id, as_of_date,
-             currency, opening_balance, closing_balance, raw_line)
-            VALUES (?,?,?,?,?,?,?,?,?)
-            ON CONFLICT(snapshot_set_id) DO UPDATE SET
-                evidence_id = excluded.evidence_id,
-                opening_balance = excluded.opening_balance,
-                closing_balance = excluded.closing_balance,
-                raw_line = excluded.raw_line""",
+    conn.executemany(
+        """INSERT INTO cash_balances
+        (statement_id, snapshot_set_id, evidence_id, account_id, as_of_date,
+         currency, opening_balance, closing_balance, raw_line)
+        VALUES (?,?,?,?,?,?,?,?,?)
+        ON CONFLICT(snapshot_set_id) DO UPDATE SET
+            evidence_id = excluded.evidence_id,
+            opening_balance = excluded.opening_balance,
+            closing_balance = excluded.closing_balance,
+            raw_line = excluded.raw_line""",
+        [
             (
                 statement_id,
                 snapshot_sets[(c.currency, "cash", c.scope_key)],
-                evidence_id, acct_id, stmt.period_end, c.currency,
+                evidence_ids[evidence_index], acct_id, stmt.period_end, c.currency,
                 c.opening_balance, c.closing_balance, c.raw_line,
-            ),
-        )
+            )
+            for c, evidence_index in zip(stmt.cash_balances, cash_evidence, strict=True)
+        ],
+    )
 
-    for perf in stmt.annual_performance:
-        conn.execute(
-            """INSERT INTO annual_performance_reports
-            (statement_id, account_id, currency, period_start, period_end, since_date,
-             beginning_market_value, deposits_transfers_in, withdrawals_transfers_out,
-             net_investment_return, ending_market_value, money_weighted_1y,
-             money_weighted_3y, money_weighted_5y, money_weighted_10y,
-             money_weighted_since)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            ON CONFLICT(statement_id, currency) DO UPDATE SET
-                period_start = excluded.period_start,
-                period_end = excluded.period_end,
-                since_date = excluded.since_date,
-                beginning_market_value = excluded.beginning_market_value,
-                deposits_transfers_in = excluded.deposits_transfers_in,
-                withdrawals_transfers_out = excluded.withdrawals_transfers_out,
-                net_investment_return = excluded.net_investment_return,
-                ending_market_value = excluded.ending_market_value,
-                money_weighted_1y = excluded.money_weighted_1y,
-                money_weighted_3y = excluded.money_weighted_3y,
-                money_weighted_5y = excluded.money_weighted_5y,
-                money_weighted_10y = excluded.money_weighted_10y,
-                money_weighted_since = excluded.money_weighted_since""",
+    conn.executemany(
+        """INSERT INTO annual_performance_reports
+        (statement_id, account_id, currency, period_start, period_end, since_date,
+         beginning_market_value, deposits_transfers_in, withdrawals_transfers_out,
+         net_investment_return, ending_market_value, money_weighted_1y,
+         money_weighted_3y, money_weighted_5y, money_weighted_10y,
+         money_weighted_since)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        ON CONFLICT(statement_id, currency) DO UPDATE SET
+            period_start = excluded.period_start,
+            period_end = excluded.period_end,
+            since_date = excluded.since_date,
+            beginning_market_value = excluded.beginning_market_value,
+            deposits_transfers_in = excluded.deposits_transfers_in,
+            withdrawals_transfers_out = excluded.withdrawals_transfers_out,
+            net_investment_return = excluded.net_investment_return,
+            ending_market_value = excluded.ending_market_value,
+            money_weighted_1y = excluded.money_weighted_1y,
+            money_weighted_3y = excluded.money_weighted_3y,
+            money_weighted_5y = excluded.money_weighted_5y,
+            money_weighted_10y = excluded.money_weighted_10y,
+            money_weighted_since = excluded.money_weighted_since""",
+        [
             (
                 statement_id, acct_id, perf.currency, perf.period_start,
                 perf.period_end, perf.since_date, perf.beginning_market_value,
@@ -671,45 +797,48 @@ def _write_statement(
                 perf.money_weighted_1y, perf.money_weighted_3y,
                 perf.money_weighted_5y, perf.money_weighted_10y,
                 perf.money_weighted_since,
-            ),
-        )
+            )
+            for perf in stmt.annual_performance
+        ],
+    )
 
-    persisted_quarantine: dict[int, tuple[int, int]] = {}
-    for row_index, item in enumerate(stmt.quarantine):
-        raw, reason, span = _quarantine_parts(item)
-        evidence_id = _write_evidence(
-            conn,
-            source_file_id=source_file_id,
-            run_id=run_id,
-            parser_version=parser_version,
-            statement_key=persisted_statement_key,
-            row_kind="quarantine",
-            row_index=row_index,
-            raw_text=raw,
-            source_span=span,
-            default_rule="parser:quarantine",
-        )
-        quarantine_id = int(conn.execute(
-            """
-            INSERT INTO quarantine_transactions(
-                source_file_id, ingestion_run_id, statement_id, account_id,
-                evidence_id, occurrence, raw_line, reason
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            RETURNING quarantine_id
-            """,
+    conn.executemany(
+        """
+        INSERT INTO quarantine_transactions(
+            source_file_id, ingestion_run_id, statement_id, account_id,
+            evidence_id, occurrence, raw_line, reason
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
             (
                 source_file_id,
                 run_id,
                 statement_id,
                 acct_id,
-                evidence_id,
+                evidence_ids[evidence_index],
                 evidence_occurrence(persisted_statement_key, "quarantine", row_index),
                 raw,
                 reason,
-            ),
-        ).fetchone()[0])
-        if isinstance(item, ParsedQuarantine):
-            persisted_quarantine[id(item)] = (quarantine_id, evidence_id)
+            )
+            for row_index, ((raw, reason, _span), evidence_index) in enumerate(
+                zip(quarantine_parts, quarantine_evidence, strict=True)
+            )
+        ],
+    )
+    persisted_quarantine: dict[int, tuple[int, int]] = {}
+    if any(parsed_set.issues for parsed_set in stmt.snapshot_sets):
+        quarantine_ids = {
+            int(row["evidence_id"]): int(row["quarantine_id"])
+            for row in conn.execute(
+                "SELECT evidence_id, quarantine_id FROM quarantine_transactions "
+                "WHERE statement_id = ?",
+                (statement_id,),
+            )
+        }
+        for item, evidence_index in zip(stmt.quarantine, quarantine_evidence, strict=True):
+            if isinstance(item, ParsedQuarantine):
+                evidence_id = evidence_ids[evidence_index]
+                persisted_quarantine[id(item)] = (quarantine_ids[evidence_id], evidence_id)
 
     for set_index, parsed_set in enumerate(stmt.snapshot_sets):
         snapshot_set_id = snapshot_sets[
@@ -723,18 +852,7 @@ def _write_statement(
                 if persisted is not None:
                     quarantine_id, evidence_id = persisted
             if issue.source_span is not None:
-                evidence_id = _write_evidence(
-                    conn,
-                    source_file_id=source_file_id,
-                    run_id=run_id,
-                    parser_version=parser_version,
-                    statement_key=persisted_statement_key,
-                    row_kind=f"scope_issue_{parsed_set.section_type}",
-                    row_index=set_index * 10_000 + issue_index,
-                    raw_text=issue.source_span.raw_text,
-                    source_span=issue.source_span,
-                    default_rule="parser:scope-issue",
-                )
+                evidence_id = evidence_ids[issue_evidence[(set_index, issue_index)]]
             sqlite_db.upsert_snapshot_scope_issue(
                 conn,
                 issue_key=(
@@ -836,6 +954,7 @@ def activate_source_result(
     parser_name: str,
     parser_version: str,
     result: ParseResult,
+    timings: StageTimings | None = None,
 ) -> dict[str, object]:
     """Stage, activate, and replace one validated source in one savepoint.
 
@@ -844,14 +963,21 @@ def activate_source_result(
     inside this uncommitted savepoint, immediately before the new rows are
     written.  Readers see either the previous committed extraction or the new
     fully activated extraction; an exception rolls every operation back.
+    ``timings`` carries the preparation stages; validation, resolution, and
+    writes are added to a copy stored on the activated run.  The returned
+    ``reconcile_scopes`` cover both the replaced and the new rows.
     """
     if result.status != "parsed":
         raise ValueError("cannot activate a skipped parser result")
-    enrich_ticker_change_transactions(result)
-    if len(result.statements) == 1 and not result.statements[0].page_numbers:
-        result.statements[0].page_numbers = tuple(range(1, pdf.page_count + 1))
-        result.statements[0].page_assignment_method = "single_statement_source"
-    validation = validate_parse_result(result, page_count=pdf.page_count)
+    timings = {stage: dict(spent) for stage, spent in (timings or {}).items()}
+    with _stage(timings, "validate"):
+        enrich_ticker_change_transactions(result)
+        if len(result.statements) == 1 and not result.statements[0].page_numbers:
+            result.statements[0].page_numbers = tuple(range(1, pdf.page_count + 1))
+            result.statements[0].page_assignment_method = "single_statement_source"
+        validation = validate_parse_result(
+            result, page_count=pdf.page_count, memo=ValidationMemo.of(result)
+        )
     if not validation.is_valid:
         messages = "; ".join(issue.message for issue in validation.errors[:3])
         raise ValueError(f"cannot activate invalid parser result: {messages}")
@@ -882,46 +1008,54 @@ def activate_source_result(
             resolver_version=resolver_version,
             status="validated",
         )
-        resolution_counts = resolve_parse_result(
-            conn,
-            institution_code=institution_code,
-            result=result,
-        )
-        resolved_validation = validate_parse_result(result, page_count=pdf.page_count)
+        with _stage(timings, "resolve"):
+            resolution_counts = resolve_parse_result(
+                conn,
+                institution_code=institution_code,
+                result=result,
+            )
+        with _stage(timings, "validate"):
+            resolved_validation = validate_parse_result(
+                result, page_count=pdf.page_count, memo=ValidationMemo.of(result)
+            )
         if not resolved_validation.is_valid:
             messages = "; ".join(
                 issue.message for issue in resolved_validation.errors[:3]
             )
             raise ValueError(f"identity resolution produced invalid parser result: {messages}")
-        counts = _content_counts(result)
-        content_hash = _content_hash(result)
-
-        prior_run = conn.execute(
-            "SELECT active_ingestion_run_id FROM source_files WHERE source_file_id = ?",
-            (source_file_id,),
-        ).fetchone()["active_ingestion_run_id"]
-        if prior_run is not None:
-            sqlite_db.discard_derived_ingestion_run(conn, int(prior_run))
-
-        # The source metadata is the active-output mirror.  This update happens
-        # only after all in-memory validation/resolution succeeds and remains
-        # inside the same savepoint as child writes.
-        _update_source_metadata(
-            conn,
-            source_file_id=source_file_id,
-            pdf=pdf,
-            parser_name=parser_name,
-            parser_version=parser_version,
-            parse_status="pending",
-        )
-        for statement in result.statements:
-            _write_statement(
+        with _stage(timings, "write"):
+            counts = _content_counts(result)
+            content_hash = _content_hash(result)
+
+            prior_run = conn.execute(
+                "SELECT active_ingestion_run_id FROM source_files WHERE source_file_id = ?",
+                (source_file_id,),
+            ).fetchone()["active_ingestion_run_id"]
+            reconcile_scopes: list[ReconcileScope] = []
+            if prior_run is not None:
+                reconcile_scopes += touched_scopes(conn, [int(prior_run)])
+                sqlite_db.discard_derived_ingestion_run(conn, int(prior_run))
+
+            # The source metadata is the active-output mirror.  This update
+            # happens only after all in-memory validation/resolution succeeds
+            # and remains inside the same savepoint as child writes.
+            _update_source_metadata(
                 conn,
                 source_file_id=source_file_id,
-                institution_code=institution_code,
-                stmt=statement,
-                ingestion_run_id=run_id,
+                pdf=pdf,
+                parser_name=parser_name,
+                parser_version=parser_version,
+                parse_status="pending",
             )
+            for statement in result.statements:
+                _write_statement(
+                    conn,
+                    source_file_id=source_file_id,
+                    institution_code=institution_code,
+                    stmt=statement,
+                    ingestion_run_id=run_id,
+                )
+            reconcile_scopes += touched_scopes(conn, [run_id])
 
         sqlite_db.activate_ingestion_run(
             conn,
@@ -929,6 +1063,7 @@ def activate_source_result(
             ingestion_run_id=run_id,
             content_counts=counts,
             content_hash=content_hash,
+            timings=timings,
         )
         conn.execute(
             "UPDATE source_files SET parse_status = 'ok' WHERE source_file_id = ?",
@@ -946,6 +1081,8 @@ def activate_source_result(
         "content_counts": counts,
         "content_hash": content_hash,
         "resolution_counts": resolution_counts,
+        "timings": timings,
+        "reconcile_scopes": reconcile_scopes,
     }
 
 
@@ -994,7 +1131,7 @@ def export_active_ingestion_logs(
                    ir.source_sha256, ir.parser_name, ir.parser_version,
                    ir.contract_version, ir.schema_version, ir.resolver_version,
                    ir.status, ir.started_at, ir.finished_at, ir.activated_at,
-                   ir.content_counts_json, ir.content_hash
+                   ir.content_counts_json, ir.content_hash, ir.timings_json
               FROM ingestion_runs ir
               JOIN source_files sf ON sf.source_file_id = ir.source_file_id
              ORDER BY sf.relpath, ir.ingestion_run_id
@@ -1042,6 +1179,7 @@ def _record_attempt(
     parser_version: str | None,
     status: str,
     error_summary: str | None = None,
+    timings: StageTimings | None = None,
     path: Path | str | None = None,
 ) -> None:
     """Persist a failed/skipped attempt without touching an active extraction."""
@@ -1054,207 +1192,768 @@ def _record_attempt(
             parser_version=parser_version,
             parse_status=status,
             error_summary=error_summary,
+            timings=timings,
         )
 
 
-def run_ingest(
-    *,
-    institution: str | None = None,
-    limit: int | None = None,
-    force: bool = False,
-    path: Path | str | None = None,
-    statements_dir: Path | None = None,
-    log_dir: Path | None = None,
-    repo_root: Path | None = None,
-    logger: logging.Logger | None = None,
-) -> dict[str, object]:
-    """Ingest one statement tree into the supplied ledger database.
+@dataclass(frozen=True)
+class _SourceTask:
+    """One statement PDF in deterministic ingest order."""
 
-    The optional paths make an isolated shadow rebuild possible without
-    changing process-global configuration or touching the live ledger. Existing
-    CLI callers keep their current profile-derived defaults.
+    folder_name: str
+    institution_code: str
+    path: Path
+    relpath: str
+    source_root: Path
+
+
+@dataclass
+class _PreparedSource:
+    """Extraction, parser selection, parsing, and validation for one PDF.
+
+    Preparation never touches SQLite, so it can run in a worker process; the
+    writer replays ``log_records`` and applies the outcome in path order.
+    ``timings`` holds the stages this attempt reached, hashing included.
     """
-    db_path = path if path is not None else sqlite_db.SQLITE_PATH
-    input_root = statements_dir or config.STATEMENTS_DIR
-    source_root = repo_root or config.ROOT
-    active_log = logger or log
-    sqlite_db.init_db(db_path)
-    seen = 0
-    activated = 0
-    stopped = False
 
+    task: _SourceTask
+    pdf: PdfText
+    status: str
+    parser_name: str | None = None
+    parser_version: str | None = None
+    result: ParseResult | None = None
+    error_summary: str | None = None
+    log_records: list[tuple[int, str]] = field(default_factory=list)
+    timings: StageTimings = field(default_factory=dict)
+
+
+def _source_tasks(
+    input_root: Path,
+    source_root: Path,
+    *,
+    institution: str | None,
+    limit: int | None,
+) -> tuple[list[_SourceTask], bool]:
+    tasks: list[_SourceTask] = []
     for folder in sorted(input_root.iterdir()):
         if not folder.is_dir():
             continue
         if institution and folder.name != institution:
             continue
         inst_code = config.INSTITUTIONS.get(folder.name, folder.name)
-
         for path in sorted(folder.glob("*.pdf")):
-            if limit is not None and seen >= limit:
-                stopped = True
-                break
-            seen += 1
+            if limit is not None and len(tasks) >= limit:
+                return tasks, True
             try:
                 relpath = path.relative_to(source_root).as_posix()
             except ValueError:
                 relpath = path.relative_to(input_root.parent).as_posix()
-            sha = _sha256_file(path)
-            if not force:
-                with sqlite_db.session(db_path) as conn:
-                    cached = _unchanged_source_file_id(conn, relpath=relpath, sha256=sha)
-                if cached is not None:
-                    active_log.info("Skipping current active extraction %s/%s", folder.name, path.name)
-                    continue
-
-            active_log.info("Reading %s/%s", folder.name, path.name)
-            try:
+            tasks.append(_SourceTask(folder.name, inst_code, path, relpath, source_root))
+    return tasks, False
+
+
+def _first_page_decision(task: _SourceTask, head: PdfText) -> _PreparedSource | None:
+    """Fail an unclaimed source or skip one from page 1; ``None`` to parse it."""
+    parser = select_parser(task.folder_name, head)
+    if parser is None:
+        return _PreparedSource(
+            task,
+            head,
+            "failed",
+            error_summary="no registered parser claimed source",
+            log_records=[(logging.WARNING, f"no parser claimed {head.relpath}")],
+        )
+    reason = first_page_skip_reason(parser, head.pages[0], head.relpath)
+    if reason is None:
+        return None
+    return _PreparedSource(
+        task,
+        head,
+        "skipped",
+        parser_name=parser.NAME,
+        parser_version=parser.VERSION,
+        error_summary=reason,
+        log_records=[(logging.INFO, f"Skipped {head.relpath}: {reason}")],
+    )
+
+
+def _prepare_source(
+    task: _SourceTask,
+    sha256: str,
+    text_cache_dir: Path | None = None,
+    timings: StageTimings | None = None,
+) -> _PreparedSource:
+    """Prepare one source, adding its stage timings to a copy of ``timings``."""
+    timings = {stage: dict(spent) for stage, spent in (timings or {}).items()}
+    prepared = _prepare_stages(task, sha256, text_cache_dir, timings)
+    prepared.timings = timings
+    return prepared
+
+
+def _prepare_stages(
+    task: _SourceTask, sha256: str, text_cache_dir: Path | None, timings: StageTimings
+) -> _PreparedSource:
+    path = task.path
+    include_layout = task.folder_name == "RBC Invest Direct"
+    try:
+        with _stage(timings, "extract"):
+            pdf, complete = extract_first_page(
+                path,
+                repo_root=task.source_root,
+                include_layout=include_layout,
+                sha256=sha256,
+                cache_dir=text_cache_dir,
+            )
+        # Page 1 alone settles parser selection and early skips, but only
+        # once it proves the source is not image-only.
+        if not complete and not pdf.is_image_only:
+            with _stage(timings, "select"):
+                decided = _first_page_decision(task, pdf)
+            if decided is not None:
+                return decided
+        if not complete:
+            with _stage(timings, "extract"):
                 pdf = extract_pdf(
                     path,
-                    repo_root=source_root,
-                    include_layout=folder.name == "RBC Invest Direct",
-                )
-            except Exception as exc:
-                # Hashing succeeded above, so this is a true extraction attempt
-                # rather than an unknown input.  Keep the last good run active.
-                pdf = PdfText(
-                    relpath=relpath,
-                    page_count=0,
-                    pages=[],
-                    sha256=sha,
-                    size_bytes=path.stat().st_size,
-                )
-                active_log.exception("extract failed: %s -> %s", path, exc)
-                _record_attempt(
-                    pdf,
-                    parser_name=None,
-                    parser_version=None,
-                    status="failed",
-                    error_summary=f"extract failed: {type(exc).__name__}: {exc}"[:1000],
-                    path=db_path,
+                    repo_root=task.source_root,
+                    include_layout=include_layout,
+                    sha256=sha256,
+                    cache_dir=text_cache_dir,
+                    head=pdf,
                 )
-                continue
+    except Exception as exc:
+        # Hashing succeeded, so this is a true extraction attempt rather than
+        # an unknown input.  Keep the last good run active.
+        pdf = PdfText(
+            relpath=task.relpath,
+            page_count=0,
+            pages=[],
+            sha256=sha256,
+            size_bytes=path.stat().st_size,
+        )
+        return _PreparedSource(
+            task,
+            pdf,
+            "failed",
+            error_summary=f"extract failed: {type(exc).__name__}: {exc}"[:1000],
+            log_records=[
+                (logging.ERROR, f"extract failed: {path} -> {exc}\n{traceback.format_exc()}")
+            ],
+        )
 
-            if pdf.is_image_only:
-                _record_attempt(
-                    pdf,
-                    parser_name=None,
-                    parser_version=None,
-                    status="skipped",
-                    error_summary="image-only source; OCR is not implemented",
-                    path=db_path,
-                )
-                continue
+    if pdf.is_image_only:
+        return _PreparedSource(
+            task, pdf, "skipped", error_summary="image-only source; OCR is not implemented"
+        )
 
-            parser = select_parser(folder.name, pdf)
-            if parser is None:
-                active_log.warning("no parser claimed %s", pdf.relpath)
-                _record_attempt(
-                    pdf,
-                    parser_name=None,
-                    parser_version=None,
-                    status="failed",
-                    error_summary="no registered parser claimed source",
-                    path=db_path,
-                )
-                continue
+    with _stage(timings, "select"):
+        parser = select_parser(task.folder_name, pdf)
+    if parser is None:
+        return _PreparedSource(
+            task,
+            pdf,
+            "failed",
+            error_summary="no registered parser claimed source",
+            log_records=[(logging.WARNING, f"no parser claimed {pdf.relpath}")],
+        )
 
-            try:
-                result: ParseResult = parser.parse(pdf)
-            except Exception as exc:
-                active_log.exception("parser %s crashed on %s: %s", parser.NAME, path, exc)
-                _record_attempt(
-                    pdf,
-                    parser_name=parser.NAME,
-                    parser_version=parser.VERSION,
-                    status="failed",
-                    error_summary=f"parser crash: {type(exc).__name__}: {exc}"[:1000],
-                    path=db_path,
-                )
-                continue
+    prepared = _PreparedSource(
+        task, pdf, "failed", parser_name=parser.NAME, parser_version=parser.VERSION
+    )
+    try:
+        with _stage(timings, "parse"):
+            result: ParseResult = parser.parse(pdf)
+    except Exception as exc:
+        prepared.error_summary = f"parser crash: {type(exc).__name__}: {exc}"[:1000]
+        prepared.log_records.append(
+            (
+                logging.ERROR,
+                f"parser {parser.NAME} crashed on {path}: {exc}\n{traceback.format_exc()}",
+            )
+        )
+        return prepared
 
-            if result.status == "skipped":
-                _record_attempt(
-                    pdf,
-                    parser_name=parser.NAME,
-                    parser_version=parser.VERSION,
-                    status="skipped",
-                    error_summary=result.skip_reason,
-                    path=db_path,
-                )
-                active_log.info("Skipped %s: %s", pdf.relpath, result.skip_reason)
-                continue
+    if result.status == "skipped":
+        prepared.status = "skipped"
+        prepared.error_summary = result.skip_reason
+        prepared.log_records.append(
+            (logging.INFO, f"Skipped {pdf.relpath}: {result.skip_reason}")
+        )
+        return prepared
+
+    with _stage(timings, "validate"):
+        enrich_ticker_change_transactions(result)
+        if len(result.statements) == 1 and not result.statements[0].page_numbers:
+            result.statements[0].page_numbers = tuple(range(1, pdf.page_count + 1))
+            result.statements[0].page_assignment_method = "single_statement_source"
+        validation = validate_parse_result(
+            result, page_count=pdf.page_count, memo=ValidationMemo.of(result)
+        )
+    if not validation.is_valid:
+        summary = "; ".join(
+            f"{issue.code}: {issue.message}" for issue in validation.errors[:3]
+        )
+        prepared.error_summary = summary[:1000]
+        prepared.log_records.append(
+            (
+                logging.ERROR,
+                f"parser output validation failed for {pdf.relpath}: "
+                f"{len(validation.errors)} error(s), {len(validation.warnings)} warning(s)",
+            )
+        )
+        prepared.log_records.extend(
+            (logging.ERROR, f"{issue.code}: {issue.message}") for issue in validation.errors
+        )
+        return prepared
+    if validation.warnings:
+        prepared.log_records.append(
+            (
+                logging.WARNING,
+                f"parser output for {pdf.relpath} has "
+                f"{len(validation.warnings)} contract warning(s)",
+            )
+        )
+    prepared.status = "ready"
+    prepared.result = result
+    return prepared
 
-            enrich_ticker_change_transactions(result)
-            if len(result.statements) == 1 and not result.statements[0].page_numbers:
-                result.statements[0].page_numbers = tuple(range(1, pdf.page_count + 1))
-                result.statements[0].page_assignment_method = "single_statement_source"
-            validation = validate_parse_result(result, page_count=pdf.page_count)
-            if not validation.is_valid:
-                summary = "; ".join(
-                    f"{issue.code}: {issue.message}" for issue in validation.errors[:3]
-                )
-                _record_attempt(
-                    pdf,
-                    parser_name=parser.NAME,
-                    parser_version=parser.VERSION,
-                    status="failed",
-                    error_summary=summary[:1000],
-                    path=db_path,
-                )
-                active_log.error(
-                    "parser output validation failed for %s: %d error(s), %d warning(s)",
-                    pdf.relpath,
-                    len(validation.errors),
-                    len(validation.warnings),
-                )
-                for issue in validation.errors:
-                    active_log.error("%s: %s", issue.code, issue.message)
-                continue
-            if validation.warnings:
-                active_log.warning(
-                    "parser output for %s has %d contract warning(s)",
-                    pdf.relpath,
-                    len(validation.warnings),
-                )
 
-            try:
-                with sqlite_db.session(db_path) as conn:
-                    activation = activate_source_result(
-                        conn,
-                        pdf=pdf,
-                        institution_code=inst_code,
-                        parser_name=parser.NAME,
-                        parser_version=parser.VERSION,
-                        result=result,
+def _apply_prepared(
+    prepared: _PreparedSource,
+    *,
+    db_path: Path | str,
+    logger: logging.Logger,
+    touched: list[ReconcileScope],
+) -> bool:
+    """Record or activate one prepared source; return whether it was activated.
+
+    An activation's reconciliation scopes are appended to ``touched``.
+    """
+    for level, message in prepared.log_records:
+        logger.log(level, "%s", message)
+    pdf = prepared.pdf
+    if prepared.status != "ready":
+        _record_attempt(
+            pdf,
+            parser_name=prepared.parser_name,
+            parser_version=prepared.parser_version,
+            status=prepared.status,
+            error_summary=prepared.error_summary,
+            timings=prepared.timings,
+            path=db_path,
+        )
+        return False
+
+    try:
+        with sqlite_db.session(db_path) as conn:
+            activation = activate_source_result(
+                conn,
+                pdf=pdf,
+                institution_code=prepared.task.institution_code,
+                parser_name=str(prepared.parser_name),
+                parser_version=str(prepared.parser_version),
+                result=prepared.result,
+                timings=prepared.timings,
+            )
+    except Exception as exc:
+        logger.exception("activation failed for %s: %s", pdf.relpath, exc)
+        _record_attempt(
+            pdf,
+            parser_name=prepared.parser_name,
+            parser_version=prepared.parser_version,
+            status="failed",
+            error_summary=f"activation failed: {type(exc).__name__}: {exc}"[:1000],
+            timings=prepared.timings,
+            path=db_path,
+        )
+        return False
+    logger.info(
+        "Activated %s run=%s hash=%s resolutions=%s wall_ms=%.1f",
+        pdf.relpath,
+        activation["ingestion_run_id"],
+        str(activation["content_hash"])[:12],
+        activation["resolution_counts"],
+        sum(spent["wall_ms"] for spent in activation["timings"].values()),
+    )
+    touched.extend(activation["reconcile_scopes"])
+    return True
+
+
+def _stat_fingerprint(path: Path) -> tuple[int, int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _planning_session(db_path: Path | str, *, record: bool):
+    """Open the write session for real runs, the read-only one for plans."""
+    return sqlite_db.session(db_path) if record else sqlite_db.read_session(db_path)
+
+
+def _source_hashes(
+    tasks: list[_SourceTask],
+    *,
+    db_path: Path | str,
+    verify_hashes: bool,
+    logger: logging.Logger,
+    hash_files: Callable[[list[Path]], Iterable[tuple[str, StageTimings]]] | None = None,
+    record: bool = True,
+) -> tuple[list[str], dict[int, StageTimings]]:
+    """Return each task's SHA-256, rehashing only files whose stat changed.
+
+    ``source_fingerprints`` maps ``relpath`` to the ``(size, mtime_ns, inode)``
+    seen when the file was last hashed.  ``verify_hashes`` hashes everything
+    and reports fingerprints that would have hidden a content change.  The
+    hash timings of rehashed tasks are returned by task index.  With
+    ``record=False`` the ledger is only read and refreshed hashes stay in memory.
+    """
+    fingerprints = [_stat_fingerprint(task.path) for task in tasks]
+    known: dict[str, tuple[tuple[int, int, int], str]] = {}
+    if record or Path(db_path).exists():
+        with _planning_session(db_path, record=record) as conn:
+            # A read-only plan skips init_db, so a ledger from before stat
+            # fingerprints existed simply has none yet.
+            if record or conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'source_fingerprints'"
+            ).fetchone() is not None:
+                known = {
+                    row["relpath"]: (
+                        (row["size_bytes"], row["mtime_ns"], row["inode"]),
+                        row["sha256"],
+                    )
+                    for row in conn.execute(
+                        """
+                        SELECT relpath, size_bytes, mtime_ns, inode, sha256
+                          FROM source_fingerprints
+                        """
                     )
-            except Exception as exc:
-                active_log.exception("activation failed for %s: %s", pdf.relpath, exc)
-                _record_attempt(
-                    pdf,
-                    parser_name=parser.NAME,
-                    parser_version=parser.VERSION,
-                    status="failed",
-                    error_summary=f"activation failed: {type(exc).__name__}: {exc}"[:1000],
-                    path=db_path,
+                }
+    hashes: list[str | None] = [None] * len(tasks)
+    if not verify_hashes:
+        for index, task in enumerate(tasks):
+            stored = known.get(task.relpath)
+            if stored is not None and stored[0] == fingerprints[index]:
+                hashes[index] = stored[1]
+    stale = [index for index, sha256 in enumerate(hashes) if sha256 is None]
+    hash_files = hash_files or (lambda paths: map(_timed_sha256, paths))
+    fresh = hash_files([tasks[index].path for index in stale])
+    hash_timings: dict[int, StageTimings] = {}
+    for index, (sha256, timings) in zip(stale, fresh, strict=True):
+        hashes[index] = sha256
+        hash_timings[index] = timings
+        stored = known.get(tasks[index].relpath)
+        if stored is not None and stored[0] == fingerprints[index] and stored[1] != sha256:
+            logger.warning(
+                "Content of %s changed without a size/mtime/inode change", tasks[index].relpath
+            )
+    if stale and record:
+        recorded_at = utc_now_text()
+        with sqlite_db.session(db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO source_fingerprints(
+                    relpath, size_bytes, mtime_ns, inode, sha256, recorded_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(relpath) DO UPDATE SET
+                    size_bytes = excluded.size_bytes, mtime_ns = excluded.mtime_ns,
+                    inode = excluded.inode, sha256 = excluded.sha256,
+                    recorded_at = excluded.recorded_at
+                """,
+                [
+                    (tasks[index].relpath, *fingerprints[index], hashes[index], recorded_at)
+                    for index in stale
+                ],
+            )
+    logger.info(
+        "Hashed %d of %d source PDFs; %d reused by stat fingerprint",
+        len(stale),
+        len(tasks),
+        len(tasks) - len(stale),
+    )
+    return [str(sha256) for sha256 in hashes], hash_timings
+
+
+@dataclass
+class _IngestPlan:
+    """Hashes and cache states for a whole statement tree, loaded up front.
+
+    Only a source's own activation changes its cache state, but any
+    activation may change resolver inputs; ``mark_written`` makes the next
+    ``reason`` re-read the memoized resolver version before deciding.
+    """
+
+    tasks: list[_SourceTask]
+    hashes: list[str]
+    states: dict[str, _CacheState]
+    resolver_version: str
+    force: bool
+    db_path: Path | str
+    hash_timings: dict[int, StageTimings] = field(default_factory=dict)
+    _resolver_stale: bool = False
+
+    def reason(self, index: int) -> str | None:
+        if self.force:
+            return "forced"
+        if self._resolver_stale:
+            with sqlite_db.session(self.db_path) as conn:
+                self.resolver_version = resolver_cache_version(conn)
+            self._resolver_stale = False
+        return _stale_reason(
+            self.states.get(self.tasks[index].relpath),
+            sha256=self.hashes[index],
+            resolver_version=self.resolver_version,
+        )
+
+    def mark_written(self) -> None:
+        self._resolver_stale = True
+
+
+def _plan_sources(
+    tasks: list[_SourceTask],
+    *,
+    db_path: Path | str,
+    force: bool,
+    verify_hashes: bool,
+    logger: logging.Logger,
+    hash_files: Callable[[list[Path]], Iterable[tuple[str, StageTimings]]] | None = None,
+    record: bool = True,
+) -> _IngestPlan:
+    hashes, hash_timings = _source_hashes(
+        tasks,
+        db_path=db_path,
+        verify_hashes=verify_hashes,
+        logger=logger,
+        hash_files=hash_files,
+        record=record,
+    )
+    states: dict[str, _CacheState] = {}
+    resolver_version = ""
+    if record or Path(db_path).exists():
+        # Read-only plans still get the right resolver version, just unmemoized.
+        with _planning_session(db_path, record=record) as conn:
+            states = _cache_states(conn)
+            resolver_version = resolver_cache_version(conn)
+    plan = _IngestPlan(tasks, hashes, states, resolver_version, force, db_path, hash_timings)
+    reasons = Counter(plan.reason(index) for index in range(len(tasks)))
+    cached = reasons.pop(None, 0)
+    logger.info(
+        "Ingest plan: %d of %d sources to parse, %d current%s",
+        len(tasks) - cached,
+        len(tasks),
+        cached,
+        "".join(f"; {reason}: {count}" for reason, count in sorted(reasons.items())),
+    )
+    return plan
+
+
+def _ingest_serial(
+    tasks: list[_SourceTask],
+    *,
+    db_path: Path | str,
+    force: bool,
+    verify_hashes: bool,
+    text_cache_dir: Path | None,
+    logger: logging.Logger,
+    touched: list[ReconcileScope],
+) -> int:
+    activated = 0
+    plan = _plan_sources(
+        tasks, db_path=db_path, force=force, verify_hashes=verify_hashes, logger=logger
+    )
+    for index, task in enumerate(tasks):
+        reason = plan.reason(index)
+        if reason is None:
+            logger.info("Skipping current active extraction %s/%s", task.folder_name, task.path.name)
+            continue
+        logger.info("Reading %s/%s (%s)", task.folder_name, task.path.name, reason)
+        activated += _apply_prepared(
+            _prepare_source(
+                task, plan.hashes[index], text_cache_dir, plan.hash_timings.get(index)
+            ),
+            db_path=db_path,
+            logger=logger,
+            touched=touched,
+        )
+        plan.mark_written()
+    return activated
+
+
+def _ingest_parallel(
+    tasks: list[_SourceTask],
+    *,
+    db_path: Path | str,
+    force: bool,
+    jobs: int,
+    verify_hashes: bool,
+    text_cache_dir: Path | None,
+    logger: logging.Logger,
+    touched: list[ReconcileScope],
+) -> int:
+    """Prepare sources in ``jobs`` worker processes; write them in path order.
+
+    Workers only hash, extract, parse, and validate.  This process remains the
+    single writer and re-checks the cache for every source exactly where the
+    serial loop would, so resolver changes made by earlier activations are
+    honoured and the resulting ledger matches a serial build.
+    """
+    activated = 0
+    # Spawned workers start clean: forking would copy this process's open
+    # SQLite/DuckDB handles, pooled readers, and logging locks mid-use.
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        plan = _plan_sources(
+            tasks,
+            db_path=db_path,
+            force=force,
+            verify_hashes=verify_hashes,
+            logger=logger,
+            hash_files=lambda paths: pool.map(_timed_sha256, paths, chunksize=8),
+        )
+        wanted = [index for index in range(len(tasks)) if plan.reason(index) is not None]
+        futures: dict[int, Future] = {}
+        queued = iter(wanted)
+        # Bound finished-but-unwritten results held in memory.
+        window = jobs * 2
+
+        def top_up(current: int) -> None:
+            while sum(1 for index in futures if index >= current) < window:
+                index = next(queued, None)
+                if index is None:
+                    return
+                futures[index] = pool.submit(
+                    _prepare_source,
+                    tasks[index],
+                    plan.hashes[index],
+                    text_cache_dir,
+                    plan.hash_timings.get(index),
                 )
+
+        for index, task in enumerate(tasks):
+            top_up(index)
+            future = futures.pop(index, None)
+            reason = plan.reason(index)
+            if reason is None:
+                if future is not None:
+                    future.cancel()
+                logger.info("Skipping current active extraction %s/%s", task.folder_name, task.path.name)
                 continue
-            activated += 1
-            active_log.info(
-                "Activated %s run=%s hash=%s resolutions=%s",
-                pdf.relpath,
-                activation["ingestion_run_id"],
-                str(activation["content_hash"])[:12],
-                activation["resolution_counts"],
+            logger.info("Reading %s/%s (%s)", task.folder_name, task.path.name, reason)
+            if future is None:
+                future = pool.submit(
+                    _prepare_source,
+                    task,
+                    plan.hashes[index],
+                    text_cache_dir,
+                    plan.hash_timings.get(index),
+                )
+            prepared = future.result()
+            activated += _apply_prepared(
+                prepared, db_path=db_path, logger=logger, touched=touched
             )
-        if stopped:
-            break
+            plan.mark_written()
+    return activated
 
-    audit_log_summary = export_active_ingestion_logs(path=db_path, log_dir=log_dir)
-    from .reconcile import reconcile_after_ingest
 
-    reconcile_summary = reconcile_after_ingest(db_path)
-    active_log.info("Reconciliation after ingest: %s", reconcile_summary)
+def plan_ingest(
+    *,
+    institution: str | None = None,
+    limit: int | None = None,
+    force: bool = False,
+    verify_hashes: bool = False,
+    path: Path | str | None = None,
+    statements_dir: Path | None = None,
+    repo_root: Path | None = None,
+    logger: logging.Logger | None = None,
+) -> dict[str, object]:
+    """Report which sources ``run_ingest`` would parse and why, without parsing.
+
+    Planning hashes changed files but only reads the ledger: refreshed stat
+    fingerprints and the resolver version are kept in memory, and a missing
+    ledger is planned as empty rather than created.  Reasons reflect the
+    resolver inputs at plan time; activations during a real run can still make
+    a later cached source stale.
+    """
+    db_path = path if path is not None else sqlite_db.SQLITE_PATH
+    tasks, stopped = _source_tasks(
+        statements_dir or config.STATEMENTS_DIR,
+        repo_root or config.ROOT,
+        institution=institution,
+        limit=limit,
+    )
+    plan = _plan_sources(
+        tasks,
+        db_path=db_path,
+        force=force,
+        verify_hashes=verify_hashes,
+        logger=logger or log,
+        record=False,
+    )
+    sources = [
+        {"relpath": task.relpath, "sha256": plan.hashes[index], "reason": plan.reason(index)}
+        for index, task in enumerate(tasks)
+    ]
+    return {
+        "scanned": len(tasks),
+        "limited": stopped,
+        "to_parse": sum(1 for source in sources if source["reason"] is not None),
+        "sources": sources,
+    }
+
+
+def ingest_profile(
+    *,
+    path: Path | str | None = None,
+    limit: int = 10,
+) -> dict[str, object]:
+    """Summarize recorded stage timings from each source's newest timed run.
+
+    ``files`` lists the ``limit`` slowest sources by total wall time.
+    ``parsers`` aggregates every stage per parser and parser version, slowest
+    first; attempts that never selected a parser are grouped under ``None``.
+    """
+    db_path = path if path is not None else sqlite_db.SQLITE_PATH
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT sf.relpath, ir.ingestion_run_id, ir.parser_name,
+                   ir.parser_version, ir.status, ir.timings_json
+              FROM ingestion_runs ir
+              JOIN source_files sf ON sf.source_file_id = ir.source_file_id
+             WHERE ir.ingestion_run_id = (
+                    SELECT MAX(newest.ingestion_run_id)
+                      FROM ingestion_runs newest
+                     WHERE newest.source_file_id = ir.source_file_id
+                       AND newest.timings_json IS NOT NULL
+                   )
+             ORDER BY sf.relpath
+            """
+        ).fetchall()
+
+    files: list[dict[str, object]] = []
+    parsers: dict[tuple[str | None, str | None], dict[str, object]] = {}
+    for row in rows:
+        timings: StageTimings = json.loads(row["timings_json"])
+        wall_ms = round(sum(spent["wall_ms"] for spent in timings.values()), 3)
+        cpu_ms = round(sum(spent["cpu_ms"] for spent in timings.values()), 3)
+        files.append(
+            {
+                "relpath": row["relpath"],
+                "ingestion_run_id": row["ingestion_run_id"],
+                "parser_name": row["parser_name"],
+                "parser_version": row["parser_version"],
+                "status": row["status"],
+                "wall_ms": wall_ms,
+                "cpu_ms": cpu_ms,
+                "stages": timings,
+            }
+        )
+        group = parsers.setdefault(
+            (row["parser_name"], row["parser_version"]),
+            {
+                "parser_name": row["parser_name"],
+                "parser_version": row["parser_version"],
+                "files": 0,
+                "wall_ms": 0.0,
+                "cpu_ms": 0.0,
+                "stages": {},
+            },
+        )
+        group["files"] += 1
+        group["wall_ms"] = round(group["wall_ms"] + wall_ms, 3)
+        group["cpu_ms"] = round(group["cpu_ms"] + cpu_ms, 3)
+        for stage, spent in timings.items():
+            total = group["stages"].setdefault(stage, {"wall_ms": 0.0, "cpu_ms": 0.0})
+            total["wall_ms"] = round(total["wall_ms"] + spent["wall_ms"], 3)
+            total["cpu_ms"] = round(total["cpu_ms"] + spent["cpu_ms"], 3)
+
+    files.sort(key=lambda item: (-item["wall_ms"], item["relpath"]))
+    return {
+        "profiled": len(files),
+        "files": files[:limit],
+        "parsers": sorted(
+            parsers.values(),
+            key=lambda item: (-item["wall_ms"], str(item["parser_name"]), str(item["parser_version"])),
+        ),
+    }
+
+
+def run_ingest(
+    *,
+    institution: str | None = None,
+    limit: int | None = None,
+    force: bool = False,
+    jobs: int = 1,
+    verify_hashes: bool = False,
+    full_reconcile: bool = False,
+    text_cache_dir: Path | None = None,
+    path: Path | str | None = None,
+    statements_dir: Path | None = None,
+    log_dir: Path | None = None,
+    repo_root: Path | None = None,
+    logger: logging.Logger | None = None,
+) -> dict[str, object]:
+    """Ingest one statement tree into the supplied ledger database.
+
+    The optional paths make an isolated shadow rebuild possible without
+    changing process-global configuration or touching the live ledger. Existing
+    CLI callers keep their current profile-derived defaults.  ``jobs > 1``
+    prepares PDFs in a process pool while this process activates them in the
+    same order, producing the same ledger as ``jobs=1``.  Files whose stat
+    fingerprint is unchanged reuse their recorded hash unless
+    ``verify_hashes`` is set.  Extracted text is cached under
+    ``text_cache_dir``, by default a ``pdf_text_cache`` directory beside the
+    database, so a parser-only change re-parses without re-extracting.
+    Reconciliation afterwards covers only the account/currency scopes that
+    activations touched unless ``full_reconcile`` is set; a full pass builds
+    its results in ``jobs`` processes too.
+    """
+    db_path = path if path is not None else sqlite_db.SQLITE_PATH
+    input_root = statements_dir or config.STATEMENTS_DIR
+    source_root = repo_root or config.ROOT
+    cache_dir = text_cache_dir or Path(db_path).parent / config.PDF_TEXT_CACHE_DIRNAME
+    active_log = logger or log
+    sqlite_db.init_db(db_path)
+    tasks, stopped = _source_tasks(
+        input_root, source_root, institution=institution, limit=limit
+    )
+    touched: list[ReconcileScope] = []
+    if jobs > 1 and len(tasks) > 1:
+        activated = _ingest_parallel(
+            tasks,
+            db_path=db_path,
+            force=force,
+            jobs=jobs,
+            verify_hashes=verify_hashes,
+            text_cache_dir=cache_dir,
+            logger=active_log,
+            touched=touched,
+        )
+    else:
+        activated = _ingest_serial(
+            tasks,
+            db_path=db_path,
+            force=force,
+            verify_hashes=verify_hashes,
+            text_cache_dir=cache_dir,
+            logger=active_log,
+            touched=touched,
+        )
+    seen = len(tasks)
+
+    audit_log_summary = export_active_ingestion_logs(path=db_path, log_dir=log_dir)
+    run_timings: StageTimings = {}
+    with _stage(run_timings, "reconcile"):
+        reconcile_summary = reconcile_after_ingest(
+            db_path, scopes=None if full_reconcile else touched, jobs=jobs
+        )
+    active_log.info(
+        "Reconciliation after ingest (%.1f ms wall, %.1f ms CPU): %s",
+        run_timings["reconcile"]["wall_ms"],
+        run_timings["reconcile"]["cpu_ms"],
+        reconcile_summary,
+    )
     active_log.info(
         "Ingest finished. %d PDFs scanned, %d sources activated, %s audit rows exported%s.",
         seen,
@@ -1268,4 +1967,5 @@ def run_ingest(
         "limited": stopped,
         "audit_logs": audit_log_summary,
         "reconciliation": reconcile_summary,
+        "timings": run_timings,
     }
@@ -1,11 +1,16 @@
 """Transfer pairing, movement attribution, and checkpoint reconciliation."""
 from __future__ import annotations
 
+import multiprocessing
 import re
 import sqlite3
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import partial
 from pathlib import Path
 
 from ..db import sqlite as sqlite_db
@@ -91,6 +96,39 @@ class _NameObservation:
     words: tuple[str, ...]
 
 
+class _NameIndex:
+    """Name observations by instrument, with an inverted index over their words.
+
+    ``_name_similarity`` is zero unless two names share a word, so a query is
+    scored only against observations reached through one of its own words.
+    """
+
+    def __init__(self) -> None:
+        self.observations: dict[int, list[_NameObservation]] = {}
+        self._seen: set[_NameObservation] = set()
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+
+    def add(self, observation: _NameObservation) -> None:
+        if observation in self._seen:
+            return
+        self._seen.add(observation)
+        observations = self.observations.setdefault(observation.instrument_id, [])
+        position = (observation.instrument_id, len(observations))
+        observations.append(observation)
+        for word in observation.words:
+            self._postings[word].append(position)
+
+    def candidates(self, query: tuple[str, ...]) -> dict[int, list[_NameObservation]]:
+        """Observations sharing a word with ``query``, in insertion order per instrument."""
+        positions: set[tuple[int, int]] = set()
+        for word in query:
+            positions.update(self._postings.get(word, ()))
+        grouped: dict[int, list[_NameObservation]] = {}
+        for instrument_id, index in sorted(positions):
+            grouped.setdefault(instrument_id, []).append(self.observations[instrument_id][index])
+        return grouped
+
+
 @dataclass(frozen=True)
 class _NameMatch:
     instrument_id: int
@@ -99,6 +137,88 @@ class _NameMatch:
     words: tuple[str, ...]
 
 
+@dataclass(frozen=True, order=True)
+class ReconcileScope:
+    """An inclusive ISO date span of one account and currency whose rows changed."""
+
+    account_id: int
+    currency: str
+    start: str
+    end: str
+
+
+class _ScopeSelection:
+    """Answer whether a checkpoint interval touches any changed scope."""
+
+    def __init__(self, scopes: Iterable[ReconcileScope]) -> None:
+        self.spans: dict[tuple[int, str], list[tuple[str, str]]] = defaultdict(list)
+        for scope in scopes:
+            self.spans[(scope.account_id, scope.currency)].append((scope.start, scope.end))
+        self.account_ids = sorted({account_id for account_id, _currency in self.spans})
+
+    def overlaps(self, account_id: int, currency: str, low: str | None, high: str) -> bool:
+        """Whether ``[low, high]`` meets a span; ``low=None`` is unbounded."""
+        return any(
+            start <= high and (low is None or end >= low)
+            for start, end in self.spans.get((int(account_id), str(currency)), ())
+        )
+
+
+def touched_scopes(
+    conn: sqlite3.Connection,
+    ingestion_run_ids: Iterable[int],
+) -> list[ReconcileScope]:
+    """Return the scopes whose reconciliation inputs these runs' statements feed.
+
+    A statement shares canonical selection with every statement for the same
+    account, period, and type, so those peers' rows are included too: writing
+    or discarding one of them can switch which revision the ledger counts.
+    Each span covers statement periods, trade and cash-effective dates, and
+    snapshot dates.
+    """
+    run_ids = sorted({int(run_id) for run_id in ingestion_run_ids})
+    if not run_ids:
+        return []
+    placeholders = ",".join("?" * len(run_ids))
+    rows = conn.execute(
+        f"""
+        WITH run_statements AS (
+            SELECT DISTINCT peer.statement_id, peer.period_start, peer.period_end
+              FROM statements s
+              JOIN statements peer
+                ON peer.account_id = s.account_id
+               AND peer.period_start = s.period_start
+               AND peer.period_end = s.period_end
+               AND peer.statement_type = s.statement_type
+             WHERE s.ingestion_run_id IN ({placeholders})
+        ),
+        dated AS (
+            SELECT t.statement_id, t.account_id, t.currency,
+                   MIN(t.trade_date, COALESCE(t.cash_effective_date, t.trade_date)) AS first_date,
+                   MAX(t.trade_date, COALESCE(t.cash_effective_date, t.trade_date)) AS last_date
+              FROM transactions t
+             WHERE t.statement_id IN (SELECT statement_id FROM run_statements)
+            UNION ALL
+            SELECT ss.statement_id, ss.account_id, ss.currency, ss.as_of_date, ss.as_of_date
+              FROM snapshot_sets ss
+             WHERE ss.statement_id IN (SELECT statement_id FROM run_statements)
+        )
+        SELECT dated.account_id, dated.currency,
+               MIN(MIN(dated.first_date, run_statements.period_start)) AS start,
+               MAX(MAX(dated.last_date, run_statements.period_end)) AS end
+          FROM dated
+          JOIN run_statements ON run_statements.statement_id = dated.statement_id
+         GROUP BY dated.account_id, dated.currency
+         ORDER BY dated.account_id, dated.currency
+        """,
+        run_ids,
+    ).fetchall()
+    return [
+        ReconcileScope(int(row["account_id"]), str(row["currency"]), row["start"], row["end"])
+        for row in rows
+    ]
+
+
 def _parse_date(value: str | None) -> date | None:
     if not value:
         return None
@@ -172,12 +292,13 @@ def _observation_distance(observation: _NameObservation, trade_date: str) -> int
 
 def _choose_name_match(
     query: tuple[str, ...],
-    observations: dict[int, list[_NameObservation]],
+    index: _NameIndex | None,
     *,
     trade_date: str,
     portfolio_wide: bool,
 ) -> tuple[_NameMatch | None, bool]:
     """Return one defensible candidate and whether any plausible match existed."""
+    observations = index.candidates(query) if index is not None else {}
     matches: list[_NameMatch] = []
     for instrument_id, instrument_observations in observations.items():
         scored = [
@@ -224,8 +345,8 @@ def _choose_name_match(
 
 
 def _add_name_observation(
-    catalog: dict[tuple[int, str], dict[int, list[_NameObservation]]],
-    portfolio_catalog: dict[str, dict[int, list[_NameObservation]]],
+    catalog: dict[tuple[int, str], _NameIndex],
+    portfolio_catalog: dict[str, _NameIndex],
     row: sqlite3.Row,
     value: str | None,
 ) -> None:
@@ -239,16 +360,8 @@ def _add_name_observation(
         words=words,
     )
     account_key = (int(row["account_id"]), str(row["currency"]))
-    account_observations = catalog.setdefault(account_key, {}).setdefault(
-        observation.instrument_id, []
-    )
-    if observation not in account_observations:
-        account_observations.append(observation)
-    portfolio_observations = portfolio_catalog.setdefault(
-        str(row["currency"]), {}
-    ).setdefault(observation.instrument_id, [])
-    if observation not in portfolio_observations:
-        portfolio_observations.append(observation)
+    catalog[account_key].add(observation)
+    portfolio_catalog[str(row["currency"])].add(observation)
 
 
 def resolve_trade_instruments_from_holdings(
@@ -264,97 +377,128 @@ def resolve_trade_instruments_from_holdings(
     db_path = path if path is not None else sqlite_db.SQLITE_PATH
     sqlite_db.init_db(db_path)
     with sqlite_db.session(db_path) as conn:
-        method_placeholders = ",".join("?" for _ in AUTOMATIC_NAME_METHODS)
-        reset = int(
-            conn.execute(
-                f"""
-                UPDATE transactions
-                   SET instrument_id = NULL,
-                       resolution_method = 'unresolved_printed_identity',
-                       resolution_confidence = 0.0,
-                       resolution_evidence_id = evidence_id
-                 WHERE txn_type IN ('buy', 'sell')
-                   AND resolution_method IN ({method_placeholders})
-                """,
-                sorted(AUTOMATIC_NAME_METHODS),
-            ).rowcount
-            or 0
-        )
+        metrics, _changed = _resolve_trade_instruments(conn)
+        return metrics
 
-        catalog: dict[tuple[int, str], dict[int, list[_NameObservation]]] = {}
-        portfolio_catalog: dict[str, dict[int, list[_NameObservation]]] = {}
-        position_rows = conn.execute(
-            f"""
-            SELECT ps.account_id, ps.currency, ps.instrument_id, ps.evidence_id,
-                   ps.as_of_date, ps.raw_line, i.name
-              FROM position_snapshots ps
-              JOIN instruments i ON i.instrument_id = ps.instrument_id
-             WHERE i.asset_type IN ('equity', 'etf')
-               AND {canonical_statement_clause('ps.statement_id')}
-             ORDER BY ps.account_id, ps.currency, ps.as_of_date, ps.snapshot_id
-            """
-        ).fetchall()
-        for row in position_rows:
-            _add_name_observation(catalog, portfolio_catalog, row, row["name"])
-            _add_name_observation(catalog, portfolio_catalog, row, row["raw_line"])
 
-        transactions = conn.execute(
+def _resolve_trade_instruments(
+    conn: sqlite3.Connection,
+) -> tuple[dict[str, int], list[ReconcileScope]]:
+    """Re-run holdings-name resolution; also return trades whose instrument changed."""
+    method_placeholders = ",".join("?" for _ in AUTOMATIC_NAME_METHODS)
+    before = {
+        int(row["transaction_id"]): row
+        for row in conn.execute(
             f"""
-            SELECT transaction_id, account_id, trade_date, currency, description
+            SELECT transaction_id, account_id, currency, trade_date, instrument_id
               FROM transactions
              WHERE txn_type IN ('buy', 'sell')
-               AND instrument_id IS NULL
-               AND resolution_method = 'unresolved_printed_identity'
-               AND {canonical_statement_clause('statement_id')}
-             ORDER BY trade_date, transaction_id
-            """
-        ).fetchall()
-        metrics: Counter[str] = Counter(reset=reset, scanned=len(transactions))
-        for transaction in transactions:
-            query = _security_name_words(transaction["description"])
-            if not query:
-                metrics["unmatched"] += 1
-                continue
-            account_key = (int(transaction["account_id"]), str(transaction["currency"]))
+               AND resolution_method IN ({method_placeholders})
+            """,
+            sorted(AUTOMATIC_NAME_METHODS),
+        )
+    }
+    reset = int(
+        conn.execute(
+            f"""
+            UPDATE transactions
+               SET instrument_id = NULL,
+                   resolution_method = 'unresolved_printed_identity',
+                   resolution_confidence = 0.0,
+                   resolution_evidence_id = evidence_id
+             WHERE txn_type IN ('buy', 'sell')
+               AND resolution_method IN ({method_placeholders})
+            """,
+            sorted(AUTOMATIC_NAME_METHODS),
+        ).rowcount
+        or 0
+    )
+
+    catalog: dict[tuple[int, str], _NameIndex] = defaultdict(_NameIndex)
+    portfolio_catalog: dict[str, _NameIndex] = defaultdict(_NameIndex)
+    position_rows = conn.execute(
+        f"""
+        SELECT ps.account_id, ps.currency, ps.instrument_id, ps.evidence_id,
+               ps.as_of_date, ps.raw_line, i.name
+          FROM position_snapshots ps
+          JOIN instruments i ON i.instrument_id = ps.instrument_id
+         WHERE i.asset_type IN ('equity', 'etf')
+           AND {canonical_statement_clause('ps.statement_id')}
+         ORDER BY ps.account_id, ps.currency, ps.as_of_date, ps.snapshot_id
+        """
+    ).fetchall()
+    for row in position_rows:
+        _add_name_observation(catalog, portfolio_catalog, row, row["name"])
+        _add_name_observation(catalog, portfolio_catalog, row, row["raw_line"])
+
+    transactions = conn.execute(
+        f"""
+        SELECT transaction_id, account_id, trade_date, currency, description
+          FROM transactions
+         WHERE txn_type IN ('buy', 'sell')
+           AND instrument_id IS NULL
+           AND resolution_method = 'unresolved_printed_identity'
+           AND {canonical_statement_clause('statement_id')}
+         ORDER BY trade_date, transaction_id
+        """
+    ).fetchall()
+    metrics: Counter[str] = Counter(reset=reset, scanned=len(transactions))
+    after: dict[int, tuple[sqlite3.Row, int]] = {}
+    for transaction in transactions:
+        query = _security_name_words(transaction["description"])
+        if not query:
+            metrics["unmatched"] += 1
+            continue
+        account_key = (int(transaction["account_id"]), str(transaction["currency"]))
+        match, plausible = _choose_name_match(
+            query,
+            catalog.get(account_key),
+            trade_date=str(transaction["trade_date"]),
+            portfolio_wide=False,
+        )
+        method = "account_holding_name"
+        if match is None and not plausible:
             match, plausible = _choose_name_match(
                 query,
-                catalog.get(account_key, {}),
+                portfolio_catalog.get(str(transaction["currency"])),
                 trade_date=str(transaction["trade_date"]),
-                portfolio_wide=False,
-            )
-            method = "account_holding_name"
-            if match is None and not plausible:
-                match, plausible = _choose_name_match(
-                    query,
-                    portfolio_catalog.get(str(transaction["currency"]), {}),
-                    trade_date=str(transaction["trade_date"]),
-                    portfolio_wide=True,
-                )
-                method = "portfolio_holding_name"
-            if match is None:
-                metrics["ambiguous" if plausible else "unmatched"] += 1
-                continue
-            conn.execute(
-                """
-                UPDATE transactions
-                   SET instrument_id = ?, resolution_method = ?,
-                       resolution_confidence = ?, resolution_evidence_id = ?
-                 WHERE transaction_id = ?
-                """,
-                (
-                    match.instrument_id,
-                    method,
-                    match.score,
-                    match.evidence_id,
-                    transaction["transaction_id"],
-                ),
+                portfolio_wide=True,
             )
-            metrics[f"resolved_{method.removesuffix('_holding_name')}"] += 1
-        metrics["resolved"] = (
-            metrics["resolved_account"] + metrics["resolved_portfolio"]
+            method = "portfolio_holding_name"
+        if match is None:
+            metrics["ambiguous" if plausible else "unmatched"] += 1
+            continue
+        conn.execute(
+            """
+            UPDATE transactions
+               SET instrument_id = ?, resolution_method = ?,
+                   resolution_confidence = ?, resolution_evidence_id = ?
+             WHERE transaction_id = ?
+            """,
+            (
+                match.instrument_id,
+                method,
+                match.score,
+                match.evidence_id,
+                transaction["transaction_id"],
+            ),
         )
-        metrics["candidate_positions"] = len(position_rows)
-        return dict(metrics)
+        metrics[f"resolved_{method.removesuffix('_holding_name')}"] += 1
+        after[int(transaction["transaction_id"])] = (transaction, match.instrument_id)
+    metrics["resolved"] = (
+        metrics["resolved_account"] + metrics["resolved_portfolio"]
+    )
+    metrics["candidate_positions"] = len(position_rows)
+    changed: set[ReconcileScope] = set()
+    for transaction_id in before.keys() | after.keys():
+        previous = before.get(transaction_id)
+        row, instrument_id = after.get(transaction_id, (previous, None))
+        if instrument_id != (previous["instrument_id"] if previous is not None else None):
+            trade_date = str(row["trade_date"])
+            changed.add(
+                ReconcileScope(int(row["account_id"]), str(row["currency"]), trade_date, trade_date)
+            )
+    return dict(metrics), sorted(changed)
 
 
 def _clear_auto_transfer_links(conn: sqlite3.Connection) -> int:
@@ -498,6 +642,49 @@ def _journal_compatible(
     return abs(in_quantity - expected) <= 1e-8
 
 
+class _DatedRows:
+    """Transfer rows grouped by a key, each group sorted by trade date.
+
+    A window lookup bisects one group instead of scanning every row that
+    could share a key, so matching stays ``O(log n)`` per outgoing row.
+    """
+
+    def __init__(self) -> None:
+        self._groups: dict[object, list[tuple[int, int, sqlite3.Row]]] = defaultdict(list)
+        self._ordinals: dict[object, list[int]] = {}
+
+    def add(self, key: object, row: sqlite3.Row) -> None:
+        # Rows without a usable date can never fall inside a window.
+        row_date = _parse_date(row["trade_date"])
+        if row_date is not None:
+            self._groups[key].append((row_date.toordinal(), int(row["transaction_id"]), row))
+
+    def freeze(self) -> None:
+        for key, group in self._groups.items():
+            group.sort(key=lambda item: item[:2])
+            self._ordinals[key] = [ordinal for ordinal, _id, _row in group]
+
+    def window(self, key: object, center: date, days: int) -> list[sqlite3.Row]:
+        """Rows under ``key`` dated within ``days`` of ``center``."""
+        ordinals = self._ordinals.get(key)
+        if not ordinals:
+            return []
+        low = bisect_left(ordinals, center.toordinal() - days)
+        high = bisect_right(ordinals, center.toordinal() + days)
+        return [row for _ordinal, _id, row in self._groups[key][low:high]]
+
+
+def _journal_partners(
+    pairs: dict[tuple[int, int], tuple[float, str | None, str | None]],
+) -> dict[int, set[int]]:
+    """Instruments an instrument may journal into, in either pair direction."""
+    partners: dict[int, set[int]] = defaultdict(set)
+    for from_id, to_id in pairs:
+        partners[from_id].add(to_id)
+        partners[to_id].add(from_id)
+    return partners
+
+
 def link_transfers(
     path: Path | str | None = None,
     *,
@@ -522,9 +709,12 @@ def link_transfers(
             """
         ).fetchall()
         journal_pairs = _journal_pair_ratios(conn)
+        journal_partners = _journal_partners(journal_pairs)
 
-        incoming: dict[tuple[str, str, str, float], list[sqlite3.Row]] = {}
-        incoming_security: list[sqlite3.Row] = []
+        # Incoming rows by exact transfer key, and security rows by instrument
+        # for journal-pair lookups; both bisect on trade date.
+        incoming = _DatedRows()
+        incoming_security = _DatedRows()
         outgoing: list[sqlite3.Row] = []
         skipped_missing_key = 0
         for row in rows:
@@ -534,11 +724,13 @@ def link_transfers(
                 skipped_missing_key += 1
                 continue
             if delta > 0:
-                incoming.setdefault(key, []).append(row)
+                incoming.add(key, row)
                 if key[0] == "instrument":
-                    incoming_security.append(row)
+                    incoming_security.add(int(row["instrument_id"]), row)
             else:
                 outgoing.append(row)
+        incoming.freeze()
+        incoming_security.freeze()
 
         matched_incoming_ids: set[int] = set()
         matched = 0
@@ -549,16 +741,20 @@ def link_transfers(
             if out_date is None or key is None:
                 skipped_missing_key += 1
                 continue
-            candidate_rows = list(incoming.get(key, []))
+            candidate_rows = {
+                int(row["transaction_id"]): row
+                for row in incoming.window(key, out_date, date_window_days)
+            }
             if key[0] == "instrument":
-                candidate_rows.extend(
-                    row
-                    for row in incoming_security
-                    if row not in candidate_rows
-                    and _journal_compatible(out_row, row, journal_pairs)
-                )
+                for partner_id in sorted(journal_partners.get(int(out_row["instrument_id"]), ())):
+                    for row in incoming_security.window(partner_id, out_date, date_window_days):
+                        row_id = int(row["transaction_id"])
+                        if row_id not in candidate_rows and _journal_compatible(
+                            out_row, row, journal_pairs
+                        ):
+                            candidate_rows[row_id] = row
             candidates: list[tuple[int, sqlite3.Row]] = []
-            for in_row in candidate_rows:
+            for in_row in candidate_rows.values():
                 in_id = int(in_row["transaction_id"])
                 if in_id in matched_incoming_ids or in_row["account_id"] == out_row["account_id"]:
                     continue
@@ -618,12 +814,37 @@ def link_transfers(
     }
 
 
-def rebuild_position_transaction_links(path: Path | str | None = None) -> dict:
-    """Rebuild monthly snapshot movement attribution from transaction rows."""
+def rebuild_position_transaction_links(
+    path: Path | str | None = None,
+    *,
+    account_ids: Collection[int] | None = None,
+) -> dict:
+    """Rebuild monthly snapshot movement attribution from transaction rows.
+
+    Attribution never crosses accounts, so ``account_ids`` rebuilds only those
+    accounts' links; ``None`` rebuilds every account.
+    """
     db_path = path if path is not None else sqlite_db.SQLITE_PATH
     sqlite_db.init_db(db_path)
+    account_clause = ""
+    account_params: list[int] = []
+    if account_ids is not None:
+        account_params = sorted({int(account_id) for account_id in account_ids})
+        account_clause = f"AND ps.account_id IN ({','.join('?' * len(account_params))})"
     with sqlite_db.session(db_path) as conn:
-        conn.execute("DELETE FROM position_transaction_links")
+        if account_ids is None:
+            conn.execute("DELETE FROM position_transaction_links")
+        else:
+            conn.execute(
+                f"""
+                DELETE FROM position_transaction_links
+                 WHERE snapshot_id IN (
+                        SELECT snapshot_id FROM position_snapshots
+                         WHERE account_id IN ({','.join('?' * len(account_params))})
+                       )
+                """,
+                account_params,
+            )
         snapshots = conn.execute(
             f"""
             SELECT ps.snapshot_id, ps.account_id, ps.instrument_id, ps.as_of_date,
@@ -634,9 +855,11 @@ def rebuild_position_transaction_links(path: Path | str | None = None) -> dict:
              WHERE ss.section_type = 'positions'
                AND ss.completeness = 'complete'
                AND {canonical_statement_clause("ps.statement_id")}
+               {account_clause}
              ORDER BY ps.account_id, i.instrument_key, ps.currency,
                       ps.as_of_date, ps.statement_id, ps.snapshot_id
-            """
+            """,
+            account_params,
         ).fetchall()
         previous_snapshot_date: dict[tuple[int, str, str], str] = {}
         linked = 0
@@ -807,6 +1030,40 @@ def _write_reconciliation_result(
     return reconciliation_id
 
 
+# Receives one result's ``_write_reconciliation_result`` keyword arguments.
+_ResultWriter = Callable[..., object]
+
+
+def _buffered_writer(results: list[dict[str, object]]) -> _ResultWriter:
+    """Collect results for another process to write instead of inserting them."""
+
+    def write(**fields: object) -> None:
+        results.append(fields)
+
+    return write
+
+
+def _account_clause(column: str, account_ids: Collection[int] | None) -> tuple[str, list[int]]:
+    if account_ids is None:
+        return "", []
+    params = sorted({int(account_id) for account_id in account_ids})
+    return f"AND {column} IN ({','.join('?' * len(params))})", params
+
+
+def _clear_scope_results(conn: sqlite3.Connection, snapshot_set_id: int, kind: str) -> int:
+    """Delete one scope's generated results of ``kind`` before recomputing them."""
+    return int(
+        conn.execute(
+            """
+            DELETE FROM reconciliation_results
+             WHERE snapshot_set_id = ? AND kind = ? AND reconciliation_key LIKE ?
+            """,
+            (snapshot_set_id, kind, f"{RECONCILIATION_KEY_PREFIX}%"),
+        ).rowcount
+        or 0
+    )
+
+
 def _position_rows_by_key(
     conn: sqlite3.Connection,
     snapshot_set_id: int,
@@ -826,24 +1083,35 @@ def _position_rows_by_key(
     }
 
 
-def _position_interval_replay(
+class _TransactionStream:
+    """One account/currency's canonical transactions, sorted by one date.
+
+    Checkpoint intervals are contiguous slices of the stream, so each
+    (account, currency) is read once instead of once per interval.
+    """
+
+    def __init__(self, rows: list[sqlite3.Row], date_column: str) -> None:
+        self.rows = rows
+        self.dates = [str(row[date_column]) for row in rows]
+
+    def after(self, low: str, high: str) -> list[sqlite3.Row]:
+        """Rows dated in ``(low, high]``."""
+        return self.rows[bisect_right(self.dates, low):bisect_right(self.dates, high)]
+
+    def within(self, low: str, high: str) -> list[sqlite3.Row]:
+        """Rows dated in ``[low, high]``."""
+        return self.rows[bisect_left(self.dates, low):bisect_right(self.dates, high)]
+
+
+def _position_stream(
     conn: sqlite3.Connection,
     *,
     account_id: int,
     currency: str,
-    prior_checkpoint: str,
-    current_checkpoint: str,
-    prior_rows: dict[str, tuple[int, float]],
-) -> tuple[
-    dict[str, float],
-    dict[str, list[tuple[int, float]]],
-    dict[str, int],
-    dict[str, int],
-]:
-    """Replay one checkpoint interval, including whole-position ticker moves."""
+) -> _TransactionStream:
     rows = conn.execute(
         f"""
-        SELECT t.transaction_id, t.txn_type, t.quantity, t.position_delta,
+        SELECT t.transaction_id, t.trade_date, t.txn_type, t.quantity, t.position_delta,
                i.instrument_id, i.instrument_key,
                tc.conversion_ratio,
                successor.instrument_key AS successor_key,
@@ -858,13 +1126,25 @@ def _position_interval_replay(
                  ON successor.instrument_id = tc.to_instrument_id
          WHERE t.account_id = ?
            AND t.currency = ?
-           AND t.trade_date > ?
-           AND t.trade_date <= ?
            AND {canonical_statement_clause("t.statement_id")}
          ORDER BY t.trade_date, t.transaction_id
         """,
-        (account_id, currency, prior_checkpoint, current_checkpoint),
+        (account_id, currency),
     ).fetchall()
+    return _TransactionStream(rows, "trade_date")
+
+
+def _position_interval_replay(
+    rows: list[sqlite3.Row],
+    *,
+    prior_rows: dict[str, tuple[int, float]],
+) -> tuple[
+    dict[str, float],
+    dict[str, list[tuple[int, float]]],
+    dict[str, int],
+    dict[str, int],
+]:
+    """Replay one checkpoint interval, including whole-position ticker moves."""
     balances = {key: value for key, (_instrument_id, value) in prior_rows.items()}
     instrument_ids = {key: iid for key, (iid, _value) in prior_rows.items()}
     components: dict[str, list[tuple[int, float]]] = defaultdict(list)
@@ -907,39 +1187,23 @@ def _position_interval_replay(
     return balances, components, missing, instrument_ids
 
 
-def _unresolved_position_effect_count(
-    conn: sqlite3.Connection,
-    *,
-    account_id: int,
-    currency: str,
-    prior_checkpoint: str,
-    current_checkpoint: str,
-) -> int:
-    placeholders = ",".join("?" * len(POSITION_EFFECT_TYPES))
-    row = conn.execute(
-        f"""
-        SELECT COUNT(*)
-          FROM transactions t
-         WHERE t.account_id = ?
-           AND t.currency = ?
-           AND t.instrument_id IS NULL
-           AND t.trade_date > ?
-           AND t.trade_date <= ?
-           AND t.txn_type IN ({placeholders})
-           AND {canonical_statement_clause("t.statement_id")}
-        """,
-        (
-            account_id,
-            currency,
-            prior_checkpoint,
-            current_checkpoint,
-            *sorted(POSITION_EFFECT_TYPES),
-        ),
-    ).fetchone()
-    return int(row[0]) if row else 0
+def _unresolved_position_effect_count(rows: list[sqlite3.Row]) -> int:
+    return sum(
+        1
+        for row in rows
+        if row["instrument_id"] is None and row["txn_type"] in POSITION_EFFECT_TYPES
+    )
 
 
-def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
+def _reconcile_position_scopes(
+    conn: sqlite3.Connection,
+    selection: _ScopeSelection | None = None,
+    *,
+    account_ids: Collection[int] | None = None,
+    write: _ResultWriter | None = None,
+) -> dict[str, int]:
+    write = write or partial(_write_reconciliation_result, conn)
+    account_clause, account_params = _account_clause("ss.account_id", account_ids)
     scopes = conn.execute(
         f"""
         SELECT ss.snapshot_set_id, ss.statement_id, ss.account_id, ss.as_of_date,
@@ -949,12 +1213,17 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
           JOIN statements s ON s.statement_id = ss.statement_id
          WHERE ss.section_type = 'positions'
            AND {canonical_statement_clause("ss.statement_id")}
+           {account_clause}
          ORDER BY ss.account_id, ss.currency, ss.scope_key, ss.as_of_date,
                   ss.statement_id, ss.snapshot_set_id
-        """
+        """,
+        account_params,
     ).fetchall()
     previous: dict[tuple[int, str, str], sqlite3.Row] = {}
     metrics: Counter[str] = Counter()
+    # Scopes arrive grouped by (account, currency), so one stream is live.
+    stream_key: tuple[int, str] | None = None
+    stream: _TransactionStream | None = None
 
     for scope in scopes:
         scope_key = (
@@ -963,6 +1232,20 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
             str(scope["scope_key"]),
         )
         prior = previous.get(scope_key)
+        if selection is not None:
+            # A result depends only on its own checkpoint, its prior
+            # checkpoint, and the movements between them.
+            if not selection.overlaps(
+                scope["account_id"],
+                scope["currency"],
+                prior["as_of_date"] if prior is not None else None,
+                scope["as_of_date"],
+            ):
+                previous[scope_key] = scope
+                continue
+            metrics["cleared"] += _clear_scope_results(
+                conn, int(scope["snapshot_set_id"]), "position"
+            )
         current_rows = _position_rows_by_key(conn, int(scope["snapshot_set_id"]))
         prior_rows = (
             _position_rows_by_key(conn, int(prior["snapshot_set_id"]))
@@ -973,20 +1256,18 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
         interval_components: dict[str, list[tuple[int, float]]] = {}
         interval_missing: dict[str, int] = {}
         interval_ids: dict[str, int] = {}
+        interval_rows: list[sqlite3.Row] = []
         if prior is not None:
+            if stream_key != scope_key[:2]:
+                stream_key = scope_key[:2]
+                stream = _position_stream(conn, account_id=stream_key[0], currency=stream_key[1])
+            interval_rows = stream.after(str(prior["as_of_date"]), str(scope["as_of_date"]))
             (
                 interval_balances,
                 interval_components,
                 interval_missing,
                 interval_ids,
-            ) = _position_interval_replay(
-                conn,
-                account_id=int(scope["account_id"]),
-                currency=str(scope["currency"]),
-                prior_checkpoint=str(prior["as_of_date"]),
-                current_checkpoint=str(scope["as_of_date"]),
-                prior_rows=prior_rows,
-            )
+            ) = _position_interval_replay(interval_rows, prior_rows=prior_rows)
         instrument_keys = sorted(
             set(prior_rows) | set(current_rows) | set(interval_balances)
         )
@@ -1005,13 +1286,7 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
                 status = "incomplete_input"
                 reason = "position checkpoint interval has an unobserved statement period"
             else:
-                unresolved_effects = _unresolved_position_effect_count(
-                    conn,
-                    account_id=scope["account_id"],
-                    currency=scope["currency"],
-                    prior_checkpoint=prior["as_of_date"],
-                    current_checkpoint=scope["as_of_date"],
-                )
+                unresolved_effects = _unresolved_position_effect_count(interval_rows)
                 if unresolved_effects:
                     status = "incomplete_input"
                     reason = (
@@ -1023,8 +1298,7 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
                     reason = (
                         "complete position scope has no positions in either checkpoint"
                     )
-            _write_reconciliation_result(
-                conn,
+            write(
                 reconciliation_key=f"{RECONCILIATION_KEY_PREFIX}position:{scope['snapshot_set_id']}:scope",
                 ingestion_run_id=scope["ingestion_run_id"],
                 kind="position",
@@ -1050,15 +1324,7 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
             previous[scope_key] = scope
             continue
 
-        unresolved_effects = 0
-        if prior is not None:
-            unresolved_effects = _unresolved_position_effect_count(
-                conn,
-                account_id=scope["account_id"],
-                currency=scope["currency"],
-                prior_checkpoint=prior["as_of_date"],
-                current_checkpoint=scope["as_of_date"],
-            )
+        unresolved_effects = _unresolved_position_effect_count(interval_rows)
 
         for instrument_key in instrument_keys:
             current_value = current_rows.get(instrument_key)
@@ -1112,8 +1378,7 @@ def _reconcile_position_scopes(conn: sqlite3.Connection) -> dict[str, int]:
                     status = _result_status(residual, POSITION_TOLERANCE)
                     reason = _residual_reason(residual, POSITION_TOLERANCE)
 
-            _write_reconciliation_result(
-                conn,
+            write(
                 reconciliation_key=(
                     f"{RECONCILIATION_KEY_PREFIX}position:"
                     f"{scope['snapshot_set_id']}:{instrument_id}"
@@ -1158,15 +1423,13 @@ def _cash_balance_for_scope(
     ).fetchone()
 
 
-def _cash_components(
+def _cash_stream(
     conn: sqlite3.Connection,
     *,
     account_id: int,
     currency: str,
-    period_start: str,
-    period_end: str,
-) -> tuple[list[tuple[int, float]], int]:
-    """Return cash movements that take effect in one statement's cash period.
+) -> _TransactionStream:
+    """Return cash movements ordered by the date they take effect.
 
     A trade may be reported in the prior statement while settling in this one,
     so statement ownership is not a safe cash interval.  ``cash_effective_date``
@@ -1175,17 +1438,21 @@ def _cash_components(
     """
     rows = conn.execute(
         f"""
-        SELECT t.transaction_id, t.txn_type, t.cash_delta, t.net_amount
+        SELECT t.transaction_id, t.txn_type, t.cash_delta, t.net_amount,
+               COALESCE(t.cash_effective_date, t.trade_date) AS effective_date
           FROM transactions t
          WHERE t.account_id = ?
            AND t.currency = ?
-           AND COALESCE(t.cash_effective_date, t.trade_date) >= ?
-           AND COALESCE(t.cash_effective_date, t.trade_date) <= ?
            AND {canonical_statement_clause("t.statement_id")}
          ORDER BY COALESCE(t.cash_effective_date, t.trade_date), t.transaction_id
         """,
-        (account_id, currency, period_start, period_end),
+        (account_id, currency),
     ).fetchall()
+    return _TransactionStream(rows, "effective_date")
+
+
+def _cash_components(rows: list[sqlite3.Row]) -> tuple[list[tuple[int, float]], int]:
+    """Return one statement period's cash components and unvalued movements."""
     components: list[tuple[int, float]] = []
     missing_effects = 0
     for row in rows:
@@ -1199,7 +1466,15 @@ def _cash_components(
     return components, missing_effects
 
 
-def _reconcile_cash_scopes(conn: sqlite3.Connection) -> dict[str, int]:
+def _reconcile_cash_scopes(
+    conn: sqlite3.Connection,
+    selection: _ScopeSelection | None = None,
+    *,
+    account_ids: Collection[int] | None = None,
+    write: _ResultWriter | None = None,
+) -> dict[str, int]:
+    write = write or partial(_write_reconciliation_result, conn)
+    account_clause, account_params = _account_clause("ss.account_id", account_ids)
     scopes = conn.execute(
         f"""
         SELECT ss.snapshot_set_id, ss.statement_id, ss.account_id, ss.as_of_date,
@@ -1209,12 +1484,16 @@ def _reconcile_cash_scopes(conn: sqlite3.Connection) -> dict[str, int]:
           JOIN statements s ON s.statement_id = ss.statement_id
          WHERE ss.section_type = 'cash'
            AND {canonical_statement_clause("ss.statement_id")}
+           {account_clause}
          ORDER BY ss.account_id, ss.currency, ss.scope_key, ss.as_of_date,
                   ss.statement_id, ss.snapshot_set_id
-        """
+        """,
+        account_params,
     ).fetchall()
     previous: dict[tuple[int, str, str], sqlite3.Row] = {}
     metrics: Counter[str] = Counter()
+    stream_key: tuple[int, str] | None = None
+    stream: _TransactionStream | None = None
 
     for scope in scopes:
         scope_key = (
@@ -1223,13 +1502,26 @@ def _reconcile_cash_scopes(conn: sqlite3.Connection) -> dict[str, int]:
             str(scope["scope_key"]),
         )
         prior = previous.get(scope_key)
+        if selection is not None:
+            # Activity reads this statement's period; continuity reads the
+            # prior checkpoint's close and period.
+            if not selection.overlaps(
+                scope["account_id"],
+                scope["currency"],
+                min(scope["period_start"], prior["as_of_date"], prior["period_end"])
+                if prior is not None
+                else None,
+                max(scope["period_end"], scope["as_of_date"]),
+            ):
+                previous[scope_key] = scope
+                continue
+            metrics["cleared"] += _clear_scope_results(conn, int(scope["snapshot_set_id"]), "cash")
         balance = _cash_balance_for_scope(conn, int(scope["snapshot_set_id"]))
+        if stream_key != scope_key[:2]:
+            stream_key = scope_key[:2]
+            stream = _cash_stream(conn, account_id=stream_key[0], currency=stream_key[1])
         components, missing_effects = _cash_components(
-            conn,
-            account_id=scope["account_id"],
-            currency=scope["currency"],
-            period_start=scope["period_start"],
-            period_end=scope["period_end"],
+            stream.within(str(scope["period_start"]), str(scope["period_end"]))
         )
         opening_value = float(balance["opening_balance"]) if balance and balance["opening_balance"] is not None else None
         reported_close = float(balance["closing_balance"]) if balance else None
@@ -1255,8 +1547,7 @@ def _reconcile_cash_scopes(conn: sqlite3.Connection) -> dict[str, int]:
             status = _result_status(residual, CASH_TOLERANCE)
             reason = _residual_reason(residual, CASH_TOLERANCE)
 
-        _write_reconciliation_result(
-            conn,
+        write(
             reconciliation_key=f"{RECONCILIATION_KEY_PREFIX}cash:statement:{scope['snapshot_set_id']}",
             ingestion_run_id=scope["ingestion_run_id"],
             kind="cash",
@@ -1316,8 +1607,7 @@ def _reconcile_cash_scopes(conn: sqlite3.Connection) -> dict[str, int]:
                 CASH_TOLERANCE,
             )
 
-        _write_reconciliation_result(
-            conn,
+        write(
             reconciliation_key=f"{RECONCILIATION_KEY_PREFIX}cash:continuity:{scope['snapshot_set_id']}",
             ingestion_run_id=scope["ingestion_run_id"],
             kind="cash",
@@ -1344,7 +1634,15 @@ def _reconcile_cash_scopes(conn: sqlite3.Connection) -> dict[str, int]:
     return dict(metrics)
 
 
-def _reconcile_statement_totals(conn: sqlite3.Connection) -> dict[str, int]:
+def _reconcile_statement_totals(
+    conn: sqlite3.Connection,
+    selection: _ScopeSelection | None = None,
+    *,
+    account_ids: Collection[int] | None = None,
+    write: _ResultWriter | None = None,
+) -> dict[str, int]:
+    write = write or partial(_write_reconciliation_result, conn)
+    account_clause, account_params = _account_clause("ss.account_id", account_ids)
     scopes = conn.execute(
         f"""
         SELECT ss.snapshot_set_id, ss.statement_id, ss.account_id, ss.as_of_date,
@@ -1355,12 +1653,22 @@ def _reconcile_statement_totals(conn: sqlite3.Connection) -> dict[str, int]:
           JOIN statements s ON s.statement_id = ss.statement_id
          WHERE ss.reported_total IS NOT NULL
            AND {canonical_statement_clause("ss.statement_id")}
+           {account_clause}
          ORDER BY ss.statement_id, ss.snapshot_set_id
-        """
+        """,
+        account_params,
     ).fetchall()
     metrics: Counter[str] = Counter()
 
     for scope in scopes:
+        if selection is not None:
+            if not selection.overlaps(
+                scope["account_id"], scope["currency"], scope["as_of_date"], scope["as_of_date"]
+            ):
+                continue
+            metrics["cleared"] += _clear_scope_results(
+                conn, int(scope["snapshot_set_id"]), "statement_total"
+            )
         expected_close: float | None = None
         reason: str | None = None
         if scope["completeness"] != "complete":
@@ -1464,8 +1772,7 @@ def _reconcile_statement_totals(conn: sqlite3.Connection) -> dict[str, int]:
         residual = reported_close - expected_close if expected_close is not None else None
         if residual is not None and reason is None:
             reason = _residual_reason(residual, CASH_TOLERANCE)
-        _write_reconciliation_result(
-            conn,
+        write(
             reconciliation_key=f"{RECONCILIATION_KEY_PREFIX}total:{scope['snapshot_set_id']}",
             ingestion_run_id=scope["ingestion_run_id"],
             kind="statement_total",
@@ -1503,8 +1810,7 @@ def _reconcile_statement_totals(conn: sqlite3.Connection) -> dict[str, int]:
             expected_from_change = opening + change
             change_residual = reported_close - expected_from_change
             change_status = _result_status(change_residual, CASH_TOLERANCE)
-            _write_reconciliation_result(
-                conn,
+            write(
                 reconciliation_key=(
                     f"{RECONCILIATION_KEY_PREFIX}statement-change:"
                     f"{scope['snapshot_set_id']}"
@@ -1533,31 +1839,158 @@ def _reconcile_statement_totals(conn: sqlite3.Connection) -> dict[str, int]:
     return dict(metrics)
 
 
-def rebuild_reconciliation_results(path: Path | str | None = None) -> dict[str, object]:
-    """Rebuild generated equations without changing ledger facts or balances."""
+_EQUATION_SECTIONS = (
+    ("positions", _reconcile_position_scopes),
+    ("cash", _reconcile_cash_scopes),
+    ("statement_totals", _reconcile_statement_totals),
+)
+
+
+def _account_equations(
+    path: Path | str,
+    account_id: int,
+) -> dict[str, tuple[list[dict[str, object]], dict[str, int]]]:
+    """Build one account's results on a read-only connection, without writing."""
+    conn = sqlite_db.connect_readonly(path)
+    try:
+        built = {}
+        for section, build in _EQUATION_SECTIONS:
+            results: list[dict[str, object]] = []
+            metrics = build(conn, account_ids=[account_id], write=_buffered_writer(results))
+            built[section] = (results, metrics)
+        return built
+    finally:
+        conn.close()
+
+
+def _parallel_equations(
+    path: Path | str,
+    jobs: int,
+) -> dict[str, tuple[list[dict[str, object]], Counter[str]]]:
+    """Build every account's results in a process pool, in serial write order.
+
+    Accounts only interact through transfer links, which are already stored,
+    so each account's equations are independent.  Position and cash results
+    are ordered by account first and concatenate in account order; statement
+    totals are re-sorted into the serial pass's statement order.
+    """
+    conn = sqlite_db.connect_readonly(path)
+    try:
+        account_ids = [
+            int(row[0])
+            for row in conn.execute(
+                "SELECT DISTINCT account_id FROM snapshot_sets ORDER BY account_id"
+            )
+        ]
+    finally:
+        conn.close()
+    built = {section: ([], Counter()) for section, _build in _EQUATION_SECTIONS}
+    if not account_ids:
+        return built
+    # Spawn rather than fork so workers never inherit the caller's open
+    # connections; _account_equations opens its own read-only one.
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(account_ids)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        for account in pool.map(_account_equations, [path] * len(account_ids), account_ids):
+            for section, (results, metrics) in account.items():
+                built[section][0].extend(results)
+                built[section][1].update(metrics)
+    built["statement_totals"][0].sort(
+        key=lambda fields: (fields["statement_id"], fields["snapshot_set_id"])
+    )
+    return built
+
+
+def rebuild_reconciliation_results(
+    path: Path | str | None = None,
+    *,
+    scopes: Iterable[ReconcileScope] | None = None,
+    jobs: int = 1,
+) -> dict[str, object]:
+    """Rebuild generated equations without changing ledger facts or balances.
+
+    ``scopes`` recomputes only the checkpoints whose inputs meet a changed
+    scope, including the interval after each changed checkpoint, and drops
+    results left on those accounts' non-canonical statements.  The outcome
+    matches a full rebuild; ``None`` clears and recomputes every result.
+    ``jobs > 1`` builds a full rebuild's equations per account in worker
+    processes on read-only connections.  This process then writes them in the
+    serial order, so the ledger matches ``jobs=1``.  Scoped rebuilds are
+    always serial.
+    """
     db_path = path if path is not None else sqlite_db.SQLITE_PATH
     sqlite_db.init_db(db_path)
+    built = _parallel_equations(db_path, jobs) if scopes is None and jobs > 1 else None
     with sqlite_db.session(db_path) as conn:
-        cleared = int(
-            conn.execute(
-                "DELETE FROM reconciliation_results WHERE reconciliation_key LIKE ?",
-                (f"{RECONCILIATION_KEY_PREFIX}%",),
-            ).rowcount
-            or 0
-        )
-        return {
-            "cleared": cleared,
-            "positions": _reconcile_position_scopes(conn),
-            "cash": _reconcile_cash_scopes(conn),
-            "statement_totals": _reconcile_statement_totals(conn),
-        }
+        if scopes is None:
+            selection = None
+            cleared = int(
+                conn.execute(
+                    "DELETE FROM reconciliation_results WHERE reconciliation_key LIKE ?",
+                    (f"{RECONCILIATION_KEY_PREFIX}%",),
+                ).rowcount
+                or 0
+            )
+        else:
+            selection = _ScopeSelection(scopes)
+            cleared = int(
+                conn.execute(
+                    f"""
+                    DELETE FROM reconciliation_results
+                     WHERE reconciliation_key LIKE ?
+                       AND account_id IN ({','.join('?' * len(selection.account_ids))})
+                       AND statement_id NOT IN (SELECT statement_id FROM canonical_statements)
+                    """,
+                    (f"{RECONCILIATION_KEY_PREFIX}%", *selection.account_ids),
+                ).rowcount
+                or 0
+            )
+        if built is None:
+            sections = {section: build(conn, selection) for section, build in _EQUATION_SECTIONS}
+        else:
+            sections = {}
+            for section, (results, metrics) in built.items():
+                for fields in results:
+                    _write_reconciliation_result(conn, **fields)
+                sections[section] = dict(metrics)
+        for metrics in sections.values():
+            cleared += metrics.pop("cleared", 0)
+        return {"cleared": cleared, **sections}
+
 
+def reconcile_after_ingest(
+    path: Path | str | None = None,
+    *,
+    scopes: Iterable[ReconcileScope] | None = None,
+    jobs: int = 1,
+) -> dict:
+    """Run all automatic reconciliation passes.
 
-def reconcile_after_ingest(path: Path | str | None = None) -> dict:
-    """Run all automatic reconciliation passes."""
+    ``scopes`` limits movement attribution and reconciliation results to the
+    changed account/currency date spans, widened by any trade whose
+    holdings-name resolution changed in this pass.  Name resolution and
+    transfer pairing always span the ledger.  ``None`` rebuilds everything,
+    building results in ``jobs`` processes.
+    """
+    if scopes is None:
+        return {
+            "instrument_names": resolve_trade_instruments_from_holdings(path),
+            "transfers": link_transfers(path),
+            "positions": rebuild_position_transaction_links(path),
+            "results": rebuild_reconciliation_results(path, jobs=jobs),
+        }
+    db_path = path if path is not None else sqlite_db.SQLITE_PATH
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        instrument_names, renamed = _resolve_trade_instruments(conn)
+    changed = sorted({*scopes, *renamed})
     return {
-        "instrument_names": resolve_trade_instruments_from_holdings(path),
+        "instrument_names": instrument_names,
         "transfers": link_transfers(path),
-        "positions": rebuild_position_transaction_links(path),
-        "results": rebuild_reconciliation_results(path),
+        "positions": rebuild_position_transaction_links(
+            path, account_ids={scope.account_id for scope in changed}
+        ),
+        "results": {**rebuild_reconciliation_results(path, scopes=changed), "scopes": len(changed)},
     }
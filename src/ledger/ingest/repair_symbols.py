@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 import sqlite3
 from datetime import date
+from functools import lru_cache
 
 from ..db import sqlite as sqlite_db
 from ..parsers.name_resolver import resolve_ticker, strip_leading_verbs
@@ -111,11 +112,19 @@ def _clean_name(text: str | None) -> str:
     return cleaned
 
 
-def _words(text: str | None) -> set[str]:
-    return {
-        token for token in re.findall(r"[A-Z][A-Z0-9]{1,}", _clean_name(text))
+@lru_cache(maxsize=8192)
+def _name_features(text: str) -> tuple[frozenset[str], str]:
+    """Return the match words and cleaned form of one printed name.
+
+    Holdings names repeat on every statement and each transaction is scored
+    against all of its statement's holdings, so both sides are memoized.
+    """
+    cleaned = _clean_name(text)
+    words = frozenset(
+        token for token in re.findall(r"[A-Z][A-Z0-9]{1,}", cleaned)
         if token not in _STOP_WORDS
-    }
+    )
+    return words, cleaned
 
 
 def _shares_from_description(description: str | None) -> float | None:
@@ -139,14 +148,12 @@ def _resolved_instrument_id(conn, description: str, currency: str, fallback_name
 def _position_match_score(transaction, snapshot) -> int:
     description = transaction["description"] or ""
     candidate_name = snapshot["name"] or snapshot["raw_line"] or ""
-    description_words = _words(description)
-    candidate_words = _words(candidate_name)
+    description_words, cleaned_description = _name_features(description)
+    candidate_words, cleaned_candidate = _name_features(candidate_name)
     if not description_words or not candidate_words:
         return 0
 
     score = len(description_words & candidate_words) * 6
-    cleaned_description = _clean_name(description)
-    cleaned_candidate = _clean_name(candidate_name)
     if len(candidate_words) >= 2 and candidate_words.issubset(description_words):
         score += 35
     if cleaned_candidate and cleaned_candidate in cleaned_description:
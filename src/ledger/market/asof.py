@@ -0,0 +1,162 @@
+"""As-of market price and FX lookups over a whole (key x date) grid.
+
+Each grid is answered by one DuckDB ``ASOF JOIN`` over ``daily_prices`` or
+``fx_rates`` and returned as NumPy arrays, so a time series costs one
+cursor on the shared market reader and one join rather than one window
+query per date.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import duckdb
+import numpy as np
+
+from ..config import DUCKDB_PATH
+from ..db import duckdb_store
+
+_PRICE_QUOTES = """
+    SELECT symbol AS key, trade_date AS observed, COALESCE(close, adj_close) AS value
+      FROM daily_prices
+     WHERE COALESCE(close, adj_close) IS NOT NULL
+"""
+
+_FX_QUOTES = """
+    SELECT base || '/' || quote AS key, rate_date AS observed, rate AS value
+      FROM fx_rates
+"""
+
+
+@dataclass
+class AsOfGrid:
+    """Latest value on or before each date; ``NaN``/``NaT`` where none exists.
+
+    ``values`` and ``observed`` have shape ``(len(keys), len(dates))``.
+    """
+
+    keys: tuple[str, ...]
+    dates: tuple[str, ...]
+    values: np.ndarray
+    observed: np.ndarray
+    _key_index: dict[str, int] = field(init=False, repr=False)
+    _date_index: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._key_index = {key: index for index, key in enumerate(self.keys)}
+        self._date_index = {as_of: index for index, as_of in enumerate(self.dates)}
+
+    def get(self, key: str, as_of: str) -> tuple[float, str] | None:
+        """Return ``(value, observed_date)`` for one cell, or ``None``."""
+        row = self._key_index.get(key)
+        column = self._date_index.get(as_of)
+        if row is None or column is None or np.isnan(self.values[row, column]):
+            return None
+        return float(self.values[row, column]), str(self.observed[row, column])
+
+
+def _empty_grid(keys: tuple[str, ...], dates: tuple[str, ...]) -> AsOfGrid:
+    shape = (len(keys), len(dates))
+    return AsOfGrid(
+        keys=keys,
+        dates=dates,
+        values=np.full(shape, np.nan),
+        observed=np.full(shape, np.datetime64("NaT", "D"), dtype="datetime64[D]"),
+    )
+
+
+def _asof_grid(
+    quotes_sql: str,
+    keys: Iterable[str],
+    dates: Iterable[str],
+    *,
+    market_path: Path | str | None,
+) -> AsOfGrid:
+    grid = _empty_grid(tuple(sorted(set(keys))), tuple(sorted(set(dates))))
+    if not grid.keys or not grid.dates:
+        return grid
+    path = market_path if market_path is not None else DUCKDB_PATH
+    try:
+        with duckdb_store.read_cursor(path) as con:
+            found = con.execute(
+                f"""
+                WITH keys AS (
+                    SELECT unnest($keys) AS key,
+                           generate_subscripts($keys, 1) - 1 AS key_index
+                ),
+                dates AS (
+                    SELECT CAST(unnest($dates) AS DATE) AS as_of,
+                           generate_subscripts($dates, 1) - 1 AS date_index
+                ),
+                quotes AS (
+                    SELECT * FROM ({quotes_sql})
+                     WHERE key IN (SELECT key FROM keys)
+                )
+                SELECT grid.key_index, grid.date_index, quotes.value,
+                       CAST(quotes.observed AS DATE) AS observed
+                  FROM (SELECT * FROM keys CROSS JOIN dates) grid
+                  ASOF JOIN quotes
+                    ON quotes.key = grid.key AND quotes.observed <= grid.as_of
+                """,
+                {"keys": list(grid.keys), "dates": list(grid.dates)},
+            ).fetchnumpy()
+    except duckdb.Error:
+        # A missing market store or table prices nothing rather than failing callers.
+        return grid
+    rows = np.asarray(found["key_index"], dtype=np.int64)
+    columns = np.asarray(found["date_index"], dtype=np.int64)
+    grid.values[rows, columns] = np.asarray(found["value"], dtype=np.float64)
+    grid.observed[rows, columns] = np.asarray(found["observed"]).astype("datetime64[D]")
+    return grid
+
+
+def price_grid(
+    symbols: Iterable[str],
+    dates: Iterable[str],
+    *,
+    market_path: Path | str | None = None,
+) -> AsOfGrid:
+    """Latest ``COALESCE(close, adj_close)`` per symbol on or before each date."""
+    return _asof_grid(_PRICE_QUOTES, symbols, dates, market_path=market_path)
+
+
+def fx_grid(
+    pairs: Sequence[tuple[str, str]],
+    dates: Iterable[str],
+    *,
+    market_path: Path | str | None = None,
+) -> AsOfGrid:
+    """Latest ``base -> quote`` rate per pair, keyed ``"BASE/QUOTE"``.
+
+    A pair with no direct rate on file falls back to the reciprocal of the
+    stored inverse rate; an identity pair is always ``1.0`` on the date itself.
+    """
+    keys = tuple(sorted({f"{base}/{quote}" for base, quote in pairs}))
+    wanted_dates = tuple(sorted(set(dates)))
+    lookups = {
+        f"{side}/{other}"
+        for base, quote in pairs
+        if base != quote
+        for side, other in ((base, quote), (quote, base))
+    }
+    quotes = _asof_grid(_FX_QUOTES, lookups, wanted_dates, market_path=market_path)
+    grid = _empty_grid(keys, wanted_dates)
+    for row, key in enumerate(keys):
+        base, quote = key.split("/")
+        if base == quote:
+            grid.values[row, :] = 1.0
+            grid.observed[row, :] = np.array(wanted_dates, dtype="datetime64[D]")
+            continue
+        direct = quotes._key_index.get(key)
+        inverse = quotes._key_index.get(f"{quote}/{base}")
+        if inverse is not None:
+            rates = quotes.values[inverse]
+            usable = ~np.isnan(rates) & (rates != 0)
+            grid.values[row, usable] = 1.0 / rates[usable]
+            grid.observed[row, usable] = quotes.observed[inverse, usable]
+        if direct is not None:
+            present = ~np.isnan(quotes.values[direct])
+            grid.values[row, present] = quotes.values[direct, present]
+            grid.observed[row, present] = quotes.observed[direct, present]
+    return grid
@@ -11,7 +11,6 @@ import time
 from datetime import date, datetime, timedelta
 from functools import lru_cache
 
-import duckdb
 import pandas as pd
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -37,7 +36,7 @@ def _audit(jsonl, **row) -> None:
 # --------------------------------------------------------------- profiles
 def refresh_profiles(*, sleep_s: float = 1.0) -> None:
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     try:
         for target in _held_symbols():
@@ -74,7 +73,7 @@ def refresh_profiles(*, sleep_s: float = 1.0) -> None:
 # --------------------------------------------------------------- dividends
 def refresh_dividends(*, sleep_s: float = 1.5) -> None:
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     try:
         for target in _held_symbols():
@@ -114,7 +113,7 @@ def refresh_dividends(*, sleep_s: float = 1.5) -> None:
 # ----------------------------------------------------------------- splits
 def refresh_splits(*, sleep_s: float = 1.5) -> None:
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     try:
         for target in _held_symbols():
@@ -291,7 +290,7 @@ def _merge_financial_frames(yf_df: pd.DataFrame, sec_df: pd.DataFrame) -> pd.Dat
 
 def refresh_financials(*, sleep_s: float = 2.0) -> None:
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     try:
         for target in _held_symbols():
@@ -347,7 +346,7 @@ def refresh_financials(*, sleep_s: float = 2.0) -> None:
 # --------------------------------------------------------------- earnings
 def refresh_earnings(*, sleep_s: float = 1.5) -> None:
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     try:
         for target in _held_symbols():
@@ -397,7 +396,7 @@ def refresh_fx(*, lookback_years: int = 15, sleep_s: float = 1.5) -> None:
     """Daily USD/CAD rates (and inverse)."""
     import yfinance as yf
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     start = (datetime.utcnow() - timedelta(days=365 * lookback_years)).date().isoformat()
     try:
@@ -11,7 +11,6 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import duckdb
 import pandas as pd
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -91,7 +90,7 @@ def refresh_market_data(*, symbols: list[str] | None = None,
                         lookback_years: int = 15,
                         sleep_s: float = 1.5) -> None:
     duckdb_store.init_db()
-    con = duckdb.connect(str(DUCKDB_PATH))
+    con = duckdb_store.connect(DUCKDB_PATH)
     jsonl = jsonl_path("market_scrape").open("a", encoding="utf-8")
     try:
         targets: list[MarketTarget]
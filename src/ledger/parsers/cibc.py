@@ -177,6 +177,13 @@ def _extract_account_number(text: str, relpath: str) -> str | None:
     return None
 
 
+_TAX_DOC_SKIP_REASON = "tax document; no brokerage statement extraction"
+
+
+def _is_disclosure_page(_page_number: int, page: str) -> bool:
+    return "Disclosures" in page and "Account Activity" not in page and "Portfolio Assets" not in page
+
+
 def _is_tax_doc(text: str, relpath: str) -> bool:
     if "Tax-Document" in relpath or "tax-document" in relpath.lower():
         return True
@@ -742,6 +749,12 @@ class CIBCParser:
         return ("Imperial Investor Service" in head
                 or "Investor's Edge" in head)
 
+    def should_skip(self, first_page_text: str, relpath: str) -> str | None:
+        # parse() tests the first 3000 characters of the kept pages, which
+        # start with page 1 unless it is a disclosure page.
+        head = "" if _is_disclosure_page(1, first_page_text) else first_page_text
+        return _TAX_DOC_SKIP_REASON if _is_tax_doc(head, relpath) else None
+
     def parse(self, pdf: PdfText) -> ParseResult:
         result = ParseResult(parser_name=self.NAME, parser_version=self.VERSION)
         # Normalize pdfplumber font-fallback artifacts: 'ð' is its standard
@@ -751,17 +764,13 @@ class CIBCParser:
             transform=lambda value: value.replace("\u00f0", "\u2014").replace(
                 "\u00d0", "\u2014"
             ),
-            include_page=lambda _number, page: not (
-                "Disclosures" in page
-                and "Account Activity" not in page
-                and "Portfolio Assets" not in page
-            ),
+            include_page=lambda number, page: not _is_disclosure_page(number, page),
         )
         text = page_index.text
 
         if _is_tax_doc(text, pdf.relpath):
             result.status = "skipped"
-            result.skip_reason = "tax document; no brokerage statement extraction"
+            result.skip_reason = _TAX_DOC_SKIP_REASON
             return result
 
         period = _parse_period(text)
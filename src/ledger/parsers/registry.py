@@ -5,6 +5,14 @@ Each parser exposes:
     VERSION: str
     can_handle(folder_name: str, first_page_text: str) -> bool
     parse(pdf: PdfText) -> ParseResult
+
+and may expose:
+    should_skip(first_page_text: str, relpath: str) -> str | None
+
+``should_skip`` returns the skip reason ``parse`` would report when page 1
+alone proves the source holds no statement, so ingest can skip it without
+extracting the remaining pages.  It must never return a reason for a source
+``parse`` would not skip.
 """
 from __future__ import annotations
 
@@ -48,3 +56,15 @@ def select_parser(folder_name: str, pdf: PdfText) -> Parser | None:
             log.warning("%s.can_handle failed for %s: %s", p.NAME, pdf.relpath, exc, exc_info=True)
             continue
     return None
+
+
+def first_page_skip_reason(parser: Parser, first_page_text: str, relpath: str) -> str | None:
+    should_skip = getattr(parser, "should_skip", None)
+    if should_skip is None:
+        return None
+    try:
+        return should_skip(first_page_text, relpath)
+    except Exception as exc:
+        # A failed shortcut only costs the full extraction parse() would do anyway.
+        log.warning("%s.should_skip failed for %s: %s", parser.NAME, relpath, exc, exc_info=True)
+        return None
@@ -16,8 +16,10 @@ from ..identity import canonical_instrument_key
 from ..quantity import POSITION_AFFECTING_TYPES
 from .types import (
     ParsedInstrument,
+    ParsedPosition,
     ParsedQuarantine,
     ParsedStatement,
+    ParsedTxn,
     ParseResult,
     SourceSpan,
     TxnType,
@@ -338,10 +340,340 @@ def _instrument(
             )
 
 
+# Identity resolution (and ticker-change enrichment) rewrites the instrument,
+# related instrument, corporate-action ratio, and resolution fields in place.
+# Everything else on a transaction or position row is parser-owned and fixed
+# once the parser returns.
+_TRANSACTION_ROW_NUMERICS = (
+    "quantity", "price", "gross_amount", "commission", "other_fees",
+    "net_amount", "tax_rate", "parser_confidence", "position_delta",
+    "cash_delta",
+)
+_POSITION_NUMERICS = (
+    "quantity", "avg_cost", "book_value", "market_price",
+    "market_value", "unrealized_pnl",
+)
+
+
+class ValidationMemo:
+    """Validation work already done for one ``ParseResult`` in this process.
+
+    Ingest validates a result after parsing, again before activation, and
+    again after identity resolution.  Checks of parser-owned row fields (dates,
+    amounts, raw lines, spans) are recorded per row object and replayed while
+    the row keeps its statement and row position.  The cheaper checks of the
+    identity fields that resolution rewrites in place, and all
+    statement-level checks, always run.
+
+    Replaying assumes parser-owned row fields are not edited after the first
+    validation; code that edits them must validate without a memo.  A pickled
+    or copied memo starts empty, because rows are tracked by object identity.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[tuple[int, int, int], tuple[object, list[ValidationIssue]]] = {}
+
+    def __reduce__(self):
+        return (ValidationMemo, ())
+
+    @classmethod
+    def of(cls, result: ParseResult) -> ValidationMemo:
+        """Return the memo attached to ``result``, attaching a new one if needed."""
+        memo = result.__dict__.get("_validation_memo")
+        if memo is None:
+            # An instance attribute, not a dataclass field, so asdict() content
+            # hashes and parser-output equality never see it.
+            memo = result.__dict__["_validation_memo"] = cls()
+        return memo
+
+    def replay(
+        self,
+        report: ValidationReport,
+        row: object,
+        statement_index: int,
+        row_index: int,
+    ) -> bool:
+        entry = self._rows.get((id(row), statement_index, row_index))
+        if entry is None or entry[0] is not row:
+            return False
+        report.issues.extend(entry[1])
+        return True
+
+    def record(
+        self,
+        row: object,
+        statement_index: int,
+        row_index: int,
+        issues: list[ValidationIssue],
+    ) -> None:
+        # Holding the row keeps its id from being reused by another object.
+        self._rows[(id(row), statement_index, row_index)] = (row, issues)
+
+
+def _transaction_row(
+    report: ValidationReport,
+    transaction: ParsedTxn,
+    statement: ParsedStatement,
+    *,
+    statement_index: int,
+    row_index: int,
+    period_start: date | None,
+    period_end: date | None,
+) -> None:
+    row_kind = "transaction"
+    trade_date = _iso_date(
+        report,
+        transaction.trade_date,
+        code="invalid_transaction_date",
+        statement_index=statement_index,
+        row_kind=row_kind,
+        row_index=row_index,
+    )
+    if (
+        trade_date
+        and period_start
+        and period_end
+        and not (period_start <= trade_date <= period_end)
+    ):
+        _issue(
+            report,
+            "transaction_date_outside_period",
+            (
+                f"transaction date {transaction.trade_date} is outside "
+                f"{statement.period_start}..{statement.period_end}"
+            ),
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    if transaction.settle_date:
+        _iso_date(
+            report,
+            transaction.settle_date,
+            code="invalid_settlement_date",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    if transaction.cash_effective_date:
+        _iso_date(
+            report,
+            transaction.cash_effective_date,
+            code="invalid_cash_effective_date",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    if transaction.txn_type not in VALID_TXN_TYPES:
+        _issue(
+            report,
+            "invalid_transaction_type",
+            f"unsupported transaction type: {transaction.txn_type!r}",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    _currency(
+        report,
+        transaction.currency,
+        statement_index=statement_index,
+        row_kind=row_kind,
+        row_index=row_index,
+    )
+    for field_name in _TRANSACTION_ROW_NUMERICS:
+        _finite(
+            report,
+            getattr(transaction, field_name),
+            field_name=field_name,
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    if not transaction.raw_line.strip():
+        _issue(
+            report,
+            "missing_raw_line",
+            "transaction has no source raw line",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    _source_span(
+        report,
+        transaction.source_span,
+        statement_index=statement_index,
+        row_kind=row_kind,
+        row_index=row_index,
+    )
+
+
+def _transaction_identity(
+    report: ValidationReport,
+    transaction: ParsedTxn,
+    *,
+    statement_index: int,
+    row_index: int,
+) -> None:
+    """Check the fields identity resolution rewrites on a transaction."""
+    row_kind = "transaction"
+    if (
+        transaction.txn_type in POSITION_AFFECTING_TYPES
+        and transaction.quantity is not None
+        and transaction.instrument is None
+        and transaction.resolution_method != "unresolved_printed_identity"
+    ):
+        _issue(
+            report,
+            "position_movement_without_instrument",
+            "position-affecting transaction has quantity but no instrument",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    if transaction.instrument is not None:
+        _instrument(
+            report,
+            transaction.instrument,
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+            row_currency=transaction.currency,
+        )
+    if transaction.related_instrument is not None:
+        _instrument(
+            report,
+            transaction.related_instrument,
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+            row_currency=transaction.currency,
+        )
+        if transaction.txn_type != "name_change":
+            _issue(
+                report,
+                "unexpected_related_instrument",
+                "related_instrument is supported only for a ticker/name change",
+                statement_index=statement_index,
+                row_kind=row_kind,
+                row_index=row_index,
+            )
+        if transaction.instrument is None:
+            _issue(
+                report,
+                "ticker_change_without_old_instrument",
+                "ticker change has a new instrument but no old instrument",
+                statement_index=statement_index,
+                row_kind=row_kind,
+                row_index=row_index,
+            )
+        elif (
+            transaction.instrument.asset_type
+            != transaction.related_instrument.asset_type
+            or transaction.instrument.currency
+            != transaction.related_instrument.currency
+            or transaction.instrument.symbol
+            == transaction.related_instrument.symbol
+        ):
+            _issue(
+                report,
+                "invalid_ticker_change_pair",
+                "ticker change requires different symbols with the same asset type and currency",
+                statement_index=statement_index,
+                row_kind=row_kind,
+                row_index=row_index,
+            )
+    if transaction.txn_type == "name_change" and transaction.related_instrument is not None:
+        ratio = transaction.corporate_action_ratio
+        if ratio is None or not isinstance(ratio, (int, float)) or ratio <= 0:
+            _issue(
+                report,
+                "invalid_ticker_change_ratio",
+                "ticker change requires a positive corporate_action_ratio",
+                statement_index=statement_index,
+                row_kind=row_kind,
+                row_index=row_index,
+            )
+    for field_name in ("resolution_confidence", "corporate_action_ratio"):
+        _finite(
+            report,
+            getattr(transaction, field_name),
+            field_name=field_name,
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    if (
+        isinstance(transaction.resolution_confidence, (int, float))
+        and not isinstance(transaction.resolution_confidence, bool)
+        and math.isfinite(transaction.resolution_confidence)
+        and not 0 <= transaction.resolution_confidence <= 1
+    ):
+        _issue(
+            report,
+            "invalid_resolution_confidence",
+            "resolution_confidence must be between zero and one",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    _source_span(
+        report,
+        transaction.resolution_evidence,
+        statement_index=statement_index,
+        row_kind="transaction_resolution",
+        row_index=row_index,
+    )
+
+
+def _position_row(
+    report: ValidationReport,
+    position: ParsedPosition,
+    *,
+    statement_index: int,
+    row_index: int,
+) -> None:
+    row_kind = "position"
+    _currency(
+        report,
+        position.currency,
+        statement_index=statement_index,
+        row_kind=row_kind,
+        row_index=row_index,
+    )
+    for field_name in _POSITION_NUMERICS:
+        _finite(
+            report,
+            getattr(position, field_name),
+            field_name=field_name,
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+            required=field_name == "quantity",
+        )
+    if not (position.raw_line or "").strip():
+        _issue(
+            report,
+            "missing_position_raw_line",
+            "position has no source raw line",
+            severity="warning",
+            statement_index=statement_index,
+            row_kind=row_kind,
+            row_index=row_index,
+        )
+    _source_span(
+        report,
+        position.source_span,
+        statement_index=statement_index,
+        row_kind=row_kind,
+        row_index=row_index,
+    )
+
+
 def _validate_statement(
     report: ValidationReport,
     statement: ParsedStatement,
     statement_index: int,
+    memo: ValidationMemo,
     *,
     page_count: int | None = None,
     require_pages: bool = False,
@@ -425,241 +757,43 @@ def _validate_statement(
         )
 
     for row_index, transaction in enumerate(statement.transactions):
-        row_kind = "transaction"
-        trade_date = _iso_date(
-            report,
-            transaction.trade_date,
-            code="invalid_transaction_date",
-            statement_index=statement_index,
-            row_kind=row_kind,
-            row_index=row_index,
-        )
-        if (
-            trade_date
-            and period_start
-            and period_end
-            and not (period_start <= trade_date <= period_end)
-        ):
-            _issue(
+        if not memo.replay(report, transaction, statement_index, row_index):
+            start = len(report.issues)
+            _transaction_row(
                 report,
-                "transaction_date_outside_period",
-                (
-                    f"transaction date {transaction.trade_date} is outside "
-                    f"{statement.period_start}..{statement.period_end}"
-                ),
+                transaction,
+                statement,
                 statement_index=statement_index,
-                row_kind=row_kind,
                 row_index=row_index,
+                period_start=period_start,
+                period_end=period_end,
             )
-        if transaction.settle_date:
-            _iso_date(
-                report,
-                transaction.settle_date,
-                code="invalid_settlement_date",
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        if transaction.cash_effective_date:
-            _iso_date(
-                report,
-                transaction.cash_effective_date,
-                code="invalid_cash_effective_date",
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        if transaction.txn_type not in VALID_TXN_TYPES:
-            _issue(
-                report,
-                "invalid_transaction_type",
-                f"unsupported transaction type: {transaction.txn_type!r}",
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        _currency(
+            memo.record(transaction, statement_index, row_index, report.issues[start:])
+        _transaction_identity(
             report,
-            transaction.currency,
+            transaction,
             statement_index=statement_index,
-            row_kind=row_kind,
             row_index=row_index,
         )
-        if (
-            transaction.txn_type in POSITION_AFFECTING_TYPES
-            and transaction.quantity is not None
-            and transaction.instrument is None
-            and transaction.resolution_method != "unresolved_printed_identity"
-        ):
-            _issue(
-                report,
-                "position_movement_without_instrument",
-                "position-affecting transaction has quantity but no instrument",
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        if transaction.instrument is not None:
-            _instrument(
-                report,
-                transaction.instrument,
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-                row_currency=transaction.currency,
-            )
-        if transaction.related_instrument is not None:
-            _instrument(
-                report,
-                transaction.related_instrument,
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-                row_currency=transaction.currency,
-            )
-            if transaction.txn_type != "name_change":
-                _issue(
-                    report,
-                    "unexpected_related_instrument",
-                    "related_instrument is supported only for a ticker/name change",
-                    statement_index=statement_index,
-                    row_kind=row_kind,
-                    row_index=row_index,
-                )
-            if transaction.instrument is None:
-                _issue(
-                    report,
-                    "ticker_change_without_old_instrument",
-                    "ticker change has a new instrument but no old instrument",
-                    statement_index=statement_index,
-                    row_kind=row_kind,
-                    row_index=row_index,
-                )
-            elif (
-                transaction.instrument.asset_type
-                != transaction.related_instrument.asset_type
-                or transaction.instrument.currency
-                != transaction.related_instrument.currency
-                or transaction.instrument.symbol
-                == transaction.related_instrument.symbol
-            ):
-                _issue(
-                    report,
-                    "invalid_ticker_change_pair",
-                    "ticker change requires different symbols with the same asset type and currency",
-                    statement_index=statement_index,
-                    row_kind=row_kind,
-                    row_index=row_index,
-                )
-        if transaction.txn_type == "name_change" and transaction.related_instrument is not None:
-            ratio = transaction.corporate_action_ratio
-            if ratio is None or not isinstance(ratio, (int, float)) or ratio <= 0:
-                _issue(
-                    report,
-                    "invalid_ticker_change_ratio",
-                    "ticker change requires a positive corporate_action_ratio",
-                    statement_index=statement_index,
-                    row_kind=row_kind,
-                    row_index=row_index,
-                )
-        for field_name in (
-            "quantity", "price", "gross_amount", "commission", "other_fees",
-            "net_amount", "tax_rate", "parser_confidence", "position_delta",
-            "cash_delta", "resolution_confidence", "corporate_action_ratio",
-        ):
-            _finite(
-                report,
-                getattr(transaction, field_name),
-                field_name=field_name,
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        if (
-            isinstance(transaction.resolution_confidence, (int, float))
-            and not isinstance(transaction.resolution_confidence, bool)
-            and math.isfinite(transaction.resolution_confidence)
-            and not 0 <= transaction.resolution_confidence <= 1
-        ):
-            _issue(
-                report,
-                "invalid_resolution_confidence",
-                "resolution_confidence must be between zero and one",
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        if not transaction.raw_line.strip():
-            _issue(
+
+    for row_index, position in enumerate(statement.positions):
+        if not memo.replay(report, position, statement_index, row_index):
+            start = len(report.issues)
+            _position_row(
                 report,
-                "missing_raw_line",
-                "transaction has no source raw line",
+                position,
                 statement_index=statement_index,
-                row_kind=row_kind,
                 row_index=row_index,
             )
-        _source_span(
-            report,
-            transaction.source_span,
-            statement_index=statement_index,
-            row_kind=row_kind,
-            row_index=row_index,
-        )
-        _source_span(
-            report,
-            transaction.resolution_evidence,
-            statement_index=statement_index,
-            row_kind="transaction_resolution",
-            row_index=row_index,
-        )
-
-    for row_index, position in enumerate(statement.positions):
-        row_kind = "position"
-        _currency(
-            report,
-            position.currency,
-            statement_index=statement_index,
-            row_kind=row_kind,
-            row_index=row_index,
-        )
+            memo.record(position, statement_index, row_index, report.issues[start:])
         _instrument(
             report,
             position.instrument,
             statement_index=statement_index,
-            row_kind=row_kind,
+            row_kind="position",
             row_index=row_index,
             row_currency=position.currency,
         )
-        for field_name in (
-            "quantity", "avg_cost", "book_value", "market_price",
-            "market_value", "unrealized_pnl",
-        ):
-            _finite(
-                report,
-                getattr(position, field_name),
-                field_name=field_name,
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-                required=field_name == "quantity",
-            )
-        if not (position.raw_line or "").strip():
-            _issue(
-                report,
-                "missing_position_raw_line",
-                "position has no source raw line",
-                severity="warning",
-                statement_index=statement_index,
-                row_kind=row_kind,
-                row_index=row_index,
-            )
-        _source_span(
-            report,
-            position.source_span,
-            statement_index=statement_index,
-            row_kind=row_kind,
-            row_index=row_index,
-        )
 
     cash_currencies: set[str] = set()
     for row_index, cash in enumerate(statement.cash_balances):
@@ -998,8 +1132,14 @@ def validate_parse_result(
     result: ParseResult,
     *,
     page_count: int | None = None,
+    memo: ValidationMemo | None = None,
 ) -> ValidationReport:
-    """Validate one complete parser result before persistence."""
+    """Validate one complete parser result before persistence.
+
+    Pass ``ValidationMemo.of(result)`` when the same result is validated more
+    than once; without a memo every check runs.
+    """
+    memo = memo if memo is not None else ValidationMemo()
     report = ValidationReport()
     if not result.parser_name.strip():
         _issue(report, "missing_parser_name", "ParseResult.parser_name is empty")
@@ -1024,6 +1164,7 @@ def validate_parse_result(
             report,
             statement,
             statement_index,
+            memo,
             page_count=page_count,
             require_pages=page_count is not None,
         )
@@ -2,16 +2,30 @@
 
 Primary path: pdfplumber. Fallback: pypdf. If both yield empty text the file
 is flagged image-only and skipped.
+
+Extraction output can be cached on disk, content-addressed by the PDF's
+SHA-256, :data:`EXTRACTOR_VERSION`, the installed extractor libraries, and
+whether word layout was requested.  A parser-only change then re-parses
+cached text instead of reopening every PDF.
 """
 from __future__ import annotations
 
+import gzip
 import hashlib
+import json
+import os
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import pdfplumber
+import pypdf
+from pdfplumber.utils.text import WordExtractor
 from pypdf import PdfReader
 
+# Bump when extract_pdf's output changes for the same bytes and libraries.
+EXTRACTOR_VERSION = "2"
+
 
 @dataclass(frozen=True)
 class PdfWord:
@@ -115,25 +129,106 @@ def sha256_of(path: Path) -> str:
     return h.hexdigest()
 
 
-def _page_layout(page, page_number: int) -> tuple[list[PdfWord], list[PdfLine]]:
-    """Extract words and reconstruct visual lines without altering raw text."""
+def _extractor_key() -> str:
+    return f"{EXTRACTOR_VERSION}-pdfplumber{pdfplumber.__version__}-pypdf{pypdf.__version__}"
+
+
+def text_cache_path(cache_dir: Path, sha256: str, *, include_layout: bool) -> Path:
+    """Location of the cached extraction for one PDF content hash."""
+    kind = "layout" if include_layout else "text"
+    return cache_dir / sha256[:2] / f"{sha256}.{_extractor_key()}.{kind}.json.gz"
+
+
+def _words_payload(words) -> list[list[object]]:
+    return [[word.text, word.x0, word.top, word.x1, word.bottom] for word in words]
+
+
+def _words_from_payload(rows) -> tuple[PdfWord, ...]:
+    return tuple(PdfWord(str(text), x0, top, x1, bottom) for text, x0, top, x1, bottom in rows)
+
+
+def _write_text_cache(target: Path, pdf: PdfText) -> None:
+    payload = {
+        "page_count": pdf.page_count,
+        "pages": pdf.pages,
+        "page_sizes": [list(size) if size is not None else None for size in pdf.page_sizes],
+        "page_words": [_words_payload(words) for words in pdf.page_words],
+        "page_lines": [
+            [
+                [line.line_number, line.text, line.x0, line.top, line.x1, line.bottom,
+                 _words_payload(line.words)]
+                for line in lines
+            ]
+            for lines in pdf.page_lines
+        ],
+    }
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Concurrent ingest workers may extract the same bytes; the rename is atomic.
+    staged = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+    with gzip.open(staged, "wt", encoding="utf-8") as handle:
+        json.dump(payload, handle, separators=(",", ":"))
+    os.replace(staged, target)
+
+
+def _read_text_cache(
+    source: Path, *, relpath: str, sha256: str, size_bytes: int
+) -> PdfText | None:
     try:
-        extracted_words = page.extract_words(
-            use_text_flow=True,
-            keep_blank_chars=False,
-        ) or []
-    except Exception:
-        return [], []
+        with gzip.open(source, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        return PdfText(
+            relpath=relpath,
+            page_count=int(payload["page_count"]),
+            pages=list(payload["pages"]),
+            sha256=sha256,
+            size_bytes=size_bytes,
+            page_words=[list(_words_from_payload(words)) for words in payload["page_words"]],
+            page_lines=[
+                [
+                    PdfLine(page_number, line_number, text, x0, top, x1, bottom,
+                            _words_from_payload(words))
+                    for line_number, text, x0, top, x1, bottom, words in lines
+                ]
+                for page_number, lines in enumerate(payload["page_lines"], start=1)
+            ],
+            page_sizes=[tuple(size) if size is not None else None for size in payload["page_sizes"]],
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        # A truncated or foreign file is only a cache miss; extraction rewrites it.
+        return None
+
+
+def _page_text_and_layout(
+    page, page_number: int, *, include_layout: bool
+) -> tuple[str, list[PdfWord], list[PdfLine]]:
+    """Extract page text and, optionally, words and lines from one char pass.
+
+    ``page.extract_text()`` groups the page's chars into words and renders
+    them through a text map.  Building that word map once here yields the
+    identical text, and the same words feed the layout model instead of a
+    second ``extract_words`` traversal.
+    """
+    wordmap = WordExtractor().extract_wordmap(page.chars)
+    text = wordmap.to_textmap(
+        layout_bbox=page.bbox,
+        layout_width=page.width,
+        layout_height=page.height,
+        presorted=True,
+    ).as_string
+    if not include_layout:
+        return text, [], []
 
     words: list[PdfWord] = []
-    for raw in extracted_words:
-        text = str(raw.get("text", "")).strip()
-        if not text:
+    for raw, _chars in wordmap.tuples:
+        word_text = str(raw.get("text", "")).strip()
+        if not word_text:
             continue
         try:
             words.append(
                 PdfWord(
-                    text=text,
+                    text=word_text,
                     x0=float(raw["x0"]),
                     top=float(raw["top"]),
                     x1=float(raw["x1"]),
@@ -143,7 +238,7 @@ def _page_layout(page, page_number: int) -> tuple[list[PdfWord], list[PdfLine]]:
         except (KeyError, TypeError, ValueError):
             continue
     if not words:
-        return [], []
+        return text, [], []
 
     # pdfplumber's `top` can differ by a fraction of a point across words in
     # the same visual line. Two points leaves normal font variation intact but
@@ -170,7 +265,7 @@ def _page_layout(page, page_number: int) -> tuple[list[PdfWord], list[PdfLine]]:
                 words=ordered,
             )
         )
-    return words, lines
+    return text, words, lines
 
 
 def extract_pdf(
@@ -178,7 +273,31 @@ def extract_pdf(
     *,
     repo_root: Path,
     include_layout: bool = False,
+    sha256: str | None = None,
+    cache_dir: Path | None = None,
+    head: PdfText | None = None,
 ) -> PdfText:
+    """Extract page text (and optionally word layout) from one PDF.
+
+    Pass ``sha256`` when the caller has already hashed the file so it is not
+    read a second time.  With ``cache_dir`` the result is read from, or written
+    to, the content-addressed text cache.  ``head`` is an incomplete
+    :func:`extract_first_page` result for the same file and ``include_layout``;
+    its page 1 is reused so only pages 2..N are extracted here.
+    """
+    rel = str(path.resolve().relative_to(repo_root.resolve())).replace("\\", "/")
+    digest = sha256 or sha256_of(path)
+    size_bytes = path.stat().st_size
+    cached_path = (
+        text_cache_path(cache_dir, digest, include_layout=include_layout)
+        if cache_dir is not None
+        else None
+    )
+    if cached_path is not None:
+        cached = _read_text_cache(cached_path, relpath=rel, sha256=digest, size_bytes=size_bytes)
+        if cached is not None:
+            return cached
+
     pages: list[str] = []
     page_words: list[list[PdfWord]] = []
     page_lines: list[list[PdfLine]] = []
@@ -187,9 +306,17 @@ def extract_pdf(
     try:
         with pdfplumber.open(str(path)) as pdf:
             page_count = len(pdf.pages)
-            for page_number, p in enumerate(pdf.pages, start=1):
-                t = p.extract_text() or ""
-                words, lines = _page_layout(p, page_number) if include_layout else ([], [])
+            first = 1
+            if head is not None and len(head.pages) == 1 and head.page_count == page_count:
+                pages = list(head.pages)
+                page_words = list(head.page_words)
+                page_lines = list(head.page_lines)
+                page_sizes = list(head.page_sizes)
+                first = 2
+            for page_number, p in enumerate(pdf.pages[first - 1:], start=first):
+                t, words, lines = _page_text_and_layout(
+                    p, page_number, include_layout=include_layout
+                )
                 pages.append(t or "\n".join(line.text for line in lines))
                 page_words.append(words)
                 page_lines.append(lines)
@@ -213,15 +340,76 @@ def extract_pdf(
             ]
         except Exception:
             pages = pages or []
+            # Both extractors failed; do not pin a possibly transient failure.
+            cached_path = None
 
-    rel = str(path.resolve().relative_to(repo_root.resolve())).replace("\\", "/")
-    return PdfText(
+    extracted = PdfText(
         relpath=rel,
         page_count=page_count,
         pages=pages,
-        sha256=sha256_of(path),
-        size_bytes=path.stat().st_size,
+        sha256=digest,
+        size_bytes=size_bytes,
         page_words=page_words,
         page_lines=page_lines,
         page_sizes=page_sizes,
     )
+    if cached_path is not None:
+        try:
+            _write_text_cache(cached_path, extracted)
+        except OSError:
+            pass
+    return extracted
+
+
+def extract_first_page(
+    path: Path,
+    *,
+    repo_root: Path,
+    include_layout: bool = False,
+    sha256: str | None = None,
+    cache_dir: Path | None = None,
+) -> tuple[PdfText, bool]:
+    """Extract page 1 and the page count, enough to choose or skip a parser.
+
+    Returns ``(pdf, complete)``.  ``complete`` means ``pdf`` equals what
+    :func:`extract_pdf` would return: a cached full extraction, or a one-page
+    PDF whose page has text.  Otherwise ``pdf`` holds at most page 1; an
+    unreadable first page yields no pages rather than raising, leaving the
+    caller to fall back to full extraction.
+    """
+    rel = str(path.resolve().relative_to(repo_root.resolve())).replace("\\", "/")
+    digest = sha256 or sha256_of(path)
+    size_bytes = path.stat().st_size
+    cached_path = (
+        text_cache_path(cache_dir, digest, include_layout=include_layout)
+        if cache_dir is not None
+        else None
+    )
+    if cached_path is not None:
+        cached = _read_text_cache(cached_path, relpath=rel, sha256=digest, size_bytes=size_bytes)
+        if cached is not None:
+            return cached, True
+
+    head = PdfText(relpath=rel, page_count=0, pages=[], sha256=digest, size_bytes=size_bytes)
+    try:
+        with pdfplumber.open(str(path)) as pdf:
+            if not pdf.pages:
+                return head, False
+            first = pdf.pages[0]
+            text, words, lines = _page_text_and_layout(first, 1, include_layout=include_layout)
+            head.page_count = len(pdf.pages)
+            head.pages = [text or "\n".join(line.text for line in lines)]
+            head.page_words = [words]
+            head.page_lines = [lines]
+            head.page_sizes = [(float(first.width), float(first.height))]
+    except Exception:
+        return PdfText(relpath=rel, page_count=0, pages=[], sha256=digest, size_bytes=size_bytes), False
+    # extract_pdf falls back to pypdf only when every page is empty, so a
+    # one-page PDF with text is already its full extraction.
+    complete = head.page_count == 1 and bool(head.pages[0].strip())
+    if complete and cached_path is not None:
+        try:
+            _write_text_cache(cached_path, head)
+        except OSError:
+            pass
+    return head, complete
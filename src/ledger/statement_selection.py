@@ -3,7 +3,8 @@
 Every physical PDF remains available for verification. When more than one
 active source describes the same account, period, and statement type, derived
 views use the most recently persisted statement as the canonical revision so
-movements are never counted twice.
+movements are never counted twice. Schema triggers materialize that choice in
+``canonical_statements`` whenever a statement is written or removed.
 """
 from __future__ import annotations
 
@@ -18,9 +19,6 @@ def canonical_statement_clause(column: str) -> str:
         raise ValueError(f"unsafe SQL column: {column!r}")
     return f"""
         ({column} IS NULL OR {column} IN (
-            SELECT MAX(canonical.statement_id)
-              FROM statements canonical
-             GROUP BY canonical.account_id, canonical.period_start,
-                      canonical.period_end, canonical.statement_type
+            SELECT canonical.statement_id FROM canonical_statements canonical
         ))
     """
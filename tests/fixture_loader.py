@@ -26,3 +26,45 @@ def load_fixture(relpath: str) -> PdfText:
         sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
         size_bytes=len(text.encode("utf-8")),
     )
+
+
+def write_text_pdf(path: Path, pages: list[str]) -> Path:
+    """Write a minimal Courier PDF whose extracted text is one line per input line.
+
+    Lets ingest tests run real pdfplumber extraction over committed text
+    fixtures without shipping binary statements.
+    """
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>",
+    ]
+    kids: list[str] = []
+    for page in pages:
+        operators = ["BT", "/F1 8 Tf", "10 TL", "20 770 Td"]
+        for line in page.splitlines():
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            operators.append(f"({escaped}) Tj T*")
+        operators.append("ET")
+        stream = "\n".join(operators).encode("latin-1", "replace").decode("latin-1")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    body = b"%PDF-1.4\n"
+    offsets: list[int] = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    ).encode()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+    return path
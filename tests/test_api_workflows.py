@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import csv
 import json
 
 import duckdb
+import pytest
+from click.testing import CliRunner
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
 
+from ledger.api.app import app
 from ledger.api.routes import config as config_route
 from ledger.api.routes import monthly as monthly_route
 from ledger.api.routes import transactions as transactions_route
 from ledger.api.routes.monthly import _holdings_at
 from ledger.api.routes.performance import _total_rows
+from ledger.cli import main
 from ledger.db import sqlite as sqlite_db
 from ledger.ingest.pipeline import _record_source_file, _unchanged_source_file_id, _write_statement
 from ledger.parsers.td import TDParser
@@ -81,8 +88,8 @@ def test_transactions_include_opening_positions_without_fake_source_links(
         conn.execute(
             """
             INSERT INTO source_evidence_geometry(
-                evidence_id, extractor_version, source_sha256, status
-            ) VALUES (?, 'fixture', ?, 'exact')
+                evidence_id, extractor_version, source_sha256, status, page_numbers
+            ) VALUES (?, 'fixture', ?, 'exact', '1')
             """,
             (evidence_id, source["sha256"]),
         )
@@ -125,6 +132,106 @@ def test_transactions_include_opening_positions_without_fake_source_links(
     assert initial["source_ref"] is None
 
 
+def _seed_paged_ledger(db_path) -> None:
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        account_id, source_id = _seed_account(conn)
+        statement_id = _seed_statement(conn, account_id, source_id, "2024-01-31")
+        instrument_id = sqlite_db.upsert_instrument(
+            conn, asset_type="equity", symbol="ABC", currency="CAD"
+        )
+        conn.execute(
+            "INSERT INTO initial_positions(account_id, as_of_date, instrument_id, quantity, currency) "
+            "VALUES (?, '2024-01-10', ?, 5, 'CAD')",
+            (account_id, instrument_id),
+        )
+        for trade_date in ["2024-01-10", "2024-01-10", "2024-01-12", "2024-01-15", "2024-01-15"]:
+            conn.execute(
+                "INSERT INTO transactions(account_id, statement_id, trade_date, txn_type, "
+                "instrument_id, quantity, currency) VALUES (?, ?, ?, 'buy', ?, 1, 'CAD')",
+                (account_id, statement_id, trade_date, instrument_id),
+            )
+
+
+def test_transactions_keyset_pages_cover_every_row_once(tmp_path, monkeypatch):
+    db_path = tmp_path / "ledger.sqlite"
+    _seed_paged_ledger(db_path)
+    monkeypatch.setattr(transactions_route.sqlite_db, "SQLITE_PATH", db_path)
+    filters = dict(
+        start=None, end=None, institution=None, account_id=None,
+        symbol=None, txn_type=None, min_abs_amount=None,
+    )
+
+    everything = transactions_route.list_transactions(**filters, limit=100)
+    pages = []
+    cursor = None
+    while True:
+        page = transactions_route.list_transactions(
+            **filters, limit=2, cursor=cursor, include_total=cursor is None
+        )
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert everything["total_count"] == 6
+    assert everything["has_more"] is False
+    assert [row["row_id"] for page in pages for row in page["rows"]] == [
+        row["row_id"] for row in everything["rows"]
+    ]
+    assert [page["count"] for page in pages] == [2, 2, 2]
+    assert [page["has_more"] for page in pages] == [True, True, False]
+    assert [page["total_count"] for page in pages] == [6, None, None]
+    with pytest.raises(HTTPException) as malformed:
+        transactions_route.list_transactions(**filters, limit=2, cursor="not-a-cursor")
+    assert malformed.value.status_code == 400
+
+
+def test_transactions_export_streams_ndjson_and_csv_with_list_filters(tmp_path, monkeypatch):
+    db_path = tmp_path / "ledger.sqlite"
+    _seed_paged_ledger(db_path)
+    monkeypatch.setattr(transactions_route.sqlite_db, "SQLITE_PATH", db_path)
+    monkeypatch.setattr(transactions_route, "EXPORT_BATCH_ROWS", 2)
+    listed = transactions_route.list_transactions(
+        start=None, end=None, institution=None, account_id=None,
+        symbol=None, txn_type="buy", min_abs_amount=None, limit=100,
+    )
+
+    response = TestClient(app).get(
+        "/transactions/export", params={"format": "ndjson", "txn_type": "buy"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == listed["rows"]
+
+    output = tmp_path / "transactions.csv"
+    result = CliRunner().invoke(
+        main,
+        ["export", "transactions", "--format", "csv", "--start", "2024-01-12",
+         "--output", str(output)],
+    )
+    assert result.exit_code == 0, result.output
+    with output.open(encoding="utf-8", newline="") as handle:
+        exported = list(csv.DictReader(handle))
+    assert [row["trade_date"] for row in exported] == ["2024-01-15", "2024-01-15", "2024-01-12"]
+    assert "source_ref" not in exported[0]
+    assert "geometry_status" not in exported[0]
+
+    # The newest-first sort may spill to temp files instead of holding every row in RAM.
+    connect_readonly = transactions_route.sqlite_db.connect_readonly
+    temp_stores = []
+
+    def recording_connect(*args, **kwargs):
+        conn = connect_readonly(*args, **kwargs)
+        temp_stores.append(lambda: conn.execute("PRAGMA temp_store").fetchone()[0])
+        return conn
+
+    monkeypatch.setattr(transactions_route.sqlite_db, "connect_readonly", recording_connect)
+    _columns, rows = transactions_route.open_transaction_export(path=db_path)
+    assert [store() for store in temp_stores] == [1]
+    assert list(rows)
+
+
 def _seed_account(conn, *, source_relpath: str = "Statements/Test/sample.pdf"):
     institution_id = sqlite_db.upsert_institution(conn, "TST", "Test Broker")
     account_id = sqlite_db.upsert_account(
@@ -120,6 +120,20 @@ def test_cibc_tax_documents_are_explicitly_skipped_not_invalid():
     assert result.skip_reason == "tax document; no brokerage statement extraction"
     assert result.errors == []
     assert result.statements == []
+    assert CIBCParser().should_skip(pdf.pages[0], pdf.relpath) == result.skip_reason
+
+
+def test_cibc_first_page_skip_agrees_with_parse():
+    parser = CIBCParser()
+    for name in ("monthly_dual_currency", "tfsa_option"):
+        pdf = load_fixture(f"cibc/{name}.txt")
+        assert parser.should_skip(pdf.pages[0], pdf.relpath) is None
+        assert parser.parse(pdf).status == "parsed"
+
+    summary = "Trading Summary\nTax Year 2023\nRealized gains and losses"
+    assert parser.should_skip(summary, "cibc_2023.pdf") == "tax document; no brokerage statement extraction"
+    disclosure = "Disclosures\nTrading Summary\nTax Year 2023"
+    assert parser.should_skip(disclosure, "cibc_2023.pdf") is None
 
 
 def test_cibc_disclosure_only_page_is_not_part_of_statement():
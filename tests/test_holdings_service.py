@@ -9,6 +9,7 @@ from ledger import holdings as holdings_service
 from ledger.api.routes import monthly as monthly_route
 from ledger.api.routes.performance import _total_rows
 from ledger.api.routes.viz import _held_symbols_at
+from ledger.db import duckdb_store
 from ledger.db import sqlite as sqlite_db
 from ledger.holdings import holdings_at
 
@@ -632,3 +633,283 @@ def test_monthly_diff_preserves_cad_usd_identity_and_consumers_share_holdings(tm
             if row["currency"] == "USD"
         ),
     }
+
+
+def test_holdings_series_matches_point_in_time_replay_across_checkpoints(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        account_id = _account(conn)
+        other_account = _account(conn, "A-2")
+        jan = _statement(conn, account_id, "2024-01")
+        feb = _statement(conn, account_id, "2024-02")
+        instrument_id = sqlite_db.upsert_instrument(
+            conn,
+            asset_type="equity",
+            symbol="ABC",
+            currency="CAD",
+        )
+        seed_position(
+            conn,
+            statement_id=jan,
+            instrument_id=instrument_id,
+            quantity=10,
+            market_value=100,
+            currency="CAD",
+        )
+        seed_cash(conn, statement_id=jan, currency="CAD", closing_balance=500)
+        seed_position(
+            conn,
+            statement_id=feb,
+            instrument_id=instrument_id,
+            quantity=15,
+            market_value=150,
+            currency="CAD",
+        )
+        seed_cash(conn, statement_id=feb, currency="CAD", closing_balance=400)
+        conn.execute(
+            """
+            INSERT INTO initial_cash(account_id, as_of_date, currency, balance)
+            VALUES (?, '2023-12-31', 'USD', 25)
+            """,
+            (other_account,),
+        )
+        # Traded before a checkpoint but settled after it: a later-dated cash
+        # movement becomes eligible out of trade order.
+        for trade_date, cash_effective_date, quantity, cash_delta in (
+            ("2024-02-20", "2024-03-02", 5, -50),
+            ("2024-02-26", "2024-02-26", None, 3),
+            ("2024-03-05", "2024-03-07", 2, -20),
+        ):
+            _transaction(
+                conn,
+                account_id=account_id,
+                statement_id=feb,
+                trade_date=trade_date,
+                txn_type="buy" if quantity else "dividend",
+                instrument_id=instrument_id if quantity else None,
+                quantity=quantity,
+                position_delta=quantity,
+                cash_delta=cash_delta,
+                cash_effective_date=cash_effective_date,
+                currency="CAD",
+            )
+
+    dates = ["2024-01-28", "2024-02-15", "2024-02-28", "2024-03-01", "2024-03-03", "2024-03-31"]
+    series = dict(holdings_service.holdings_series(reversed(dates), path=db_path))
+
+    assert list(series) == dates
+    assert series == {as_of: holdings_at(as_of, path=db_path) for as_of in dates}
+    cash = {
+        as_of: next(
+            row["quantity"]
+            for row in rows
+            if row["account_id"] == account_id and row["asset_type"] == "cash"
+        )
+        for as_of, rows in series.items()
+    }
+    assert cash["2024-02-28"] == 400.0
+    assert cash["2024-03-03"] == 350.0
+    assert cash["2024-03-31"] == 330.0
+    assert all(
+        any(row["account_id"] == other_account for row in rows) for rows in series.values()
+    )
+
+
+def _seed_cached_ledger(db_path) -> tuple[int, int]:
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        account_id = _account(conn)
+        jan = _statement(conn, account_id, "2024-01")
+        instrument_id = sqlite_db.upsert_instrument(
+            conn,
+            asset_type="equity",
+            symbol="ABC",
+            currency="CAD",
+        )
+        seed_position(
+            conn,
+            statement_id=jan,
+            instrument_id=instrument_id,
+            quantity=10,
+            market_value=100,
+            currency="CAD",
+        )
+        seed_cash(conn, statement_id=jan, currency="CAD", closing_balance=500)
+        _transaction(
+            conn,
+            account_id=account_id,
+            statement_id=jan,
+            trade_date="2024-02-05",
+            txn_type="buy",
+            instrument_id=instrument_id,
+            quantity=2,
+            position_delta=2,
+            cash_delta=-20,
+            cash_effective_date="2024-02-06",
+            currency="CAD",
+        )
+    return account_id, jan
+
+
+def _cached_scopes(db_path) -> list[tuple[str, str]]:
+    with sqlite_db.session(db_path) as conn:
+        return [
+            (row["as_of_date"], row["account_scope"])
+            for row in conn.execute(
+                """
+                SELECT as_of_date, account_scope FROM holdings_cache
+                 WHERE account_scope <> '#generation' ORDER BY 1, 2
+                """
+            )
+        ]
+
+
+def test_holdings_cache_serves_repeat_reads_and_prices_on_read(tmp_path, monkeypatch):
+    db_path = tmp_path / "ledger.sqlite"
+    market_path = tmp_path / "market.duckdb"
+    account_id, _ = _seed_cached_ledger(db_path)
+
+    first = holdings_at("2024-02-15", path=db_path, market_path=market_path)
+    # The first miss after a ledger write only plants the generation marker.
+    assert _cached_scopes(db_path) == []
+    assert holdings_at("2024-02-15", path=db_path, market_path=market_path) == first
+    scoped = holdings_at("2024-02-15", [account_id], path=db_path, market_path=market_path)
+    assert _cached_scopes(db_path) == [("2024-02-15", "*"), ("2024-02-15", str(account_id))]
+
+    def no_replay(*_args, **_kwargs):
+        raise AssertionError("cached dates must not be replayed")
+
+    monkeypatch.setattr(holdings_service, "_replay_records", no_replay)
+    assert holdings_at("2024-02-15", path=db_path, market_path=market_path) == first
+    assert holdings_at("2024-02-15", [account_id], path=db_path, market_path=market_path) == scoped
+
+    con = duckdb.connect(str(market_path))
+    try:
+        con.execute(
+            "CREATE TABLE daily_prices(symbol VARCHAR, close DOUBLE, adj_close DOUBLE, trade_date DATE)"
+        )
+        con.execute("INSERT INTO daily_prices VALUES ('ABC', 12, 12, '2024-02-10')")
+    finally:
+        con.close()
+    security = next(
+        row
+        for row in holdings_at("2024-02-15", path=db_path, market_path=market_path)
+        if row["asset_type"] == "equity"
+    )
+    assert security["price_status"] == "market"
+    assert security["market_value"] == 144.0
+
+
+def test_holdings_cache_is_cleared_by_every_input_writer(tmp_path):
+    from ledger.ingest.initials import infer_initials
+    from ledger.ingest.reconcile import rebuild_reconciliation_results
+
+    db_path = tmp_path / "ledger.sqlite"
+    _, jan = _seed_cached_ledger(db_path)
+
+    def warm() -> list[dict]:
+        rows = holdings_at("2024-02-15", path=db_path)
+        assert holdings_at("2024-02-15", path=db_path) == rows
+        assert _cached_scopes(db_path) == [("2024-02-15", "*")]
+        return rows
+
+    rows = warm()
+    try:
+        with sqlite_db.session(db_path) as conn:
+            conn.execute("DELETE FROM transactions")
+            raise RuntimeError("abort the write")
+    except RuntimeError:
+        pass
+    assert _cached_scopes(db_path) == [("2024-02-15", "*")]
+    assert holdings_at("2024-02-15", path=db_path) == rows
+
+    infer_initials(db_path)
+    assert _cached_scopes(db_path) == []
+    warm()
+    rebuild_reconciliation_results(db_path)
+    assert _cached_scopes(db_path) == []
+    warm()
+    with sqlite_db.session(db_path) as conn:
+        run_id = conn.execute(
+            "SELECT ingestion_run_id FROM statements WHERE statement_id = ?", (jan,)
+        ).fetchone()[0]
+        sqlite_db.discard_derived_ingestion_run(conn, run_id)
+    assert _cached_scopes(db_path) == []
+    assert all(
+        row["checkpoint_statement_id"] != jan for row in holdings_at("2024-02-15", path=db_path)
+    )
+
+
+def test_holdings_cache_store_is_best_effort_guarded_and_bounded(tmp_path, monkeypatch):
+    db_path = tmp_path / "ledger.sqlite"
+    account_id, _ = _seed_cached_ledger(db_path)
+    expected = holdings_at("2024-02-15", path=db_path)
+
+    blocker = sqlite_db.connect(db_path)
+    try:
+        blocker.execute("BEGIN IMMEDIATE")
+        assert holdings_at("2024-02-15", path=db_path) == expected
+        assert _cached_scopes(db_path) == []
+    finally:
+        blocker.rollback()
+        blocker.close()
+
+    replay = holdings_service._replay_records
+
+    def replay_then_write(conn, dates, account_ids):
+        records = list(replay(conn, dates, account_ids))
+        with sqlite_db.session(db_path) as writer:
+            writer.execute("UPDATE accounts SET nickname = 'renamed'")
+        yield from records
+
+    monkeypatch.setattr(holdings_service, "_replay_records", replay_then_write)
+    holdings_at("2024-02-15", path=db_path)
+    assert _cached_scopes(db_path) == []
+
+    monkeypatch.setattr(holdings_service, "_replay_records", replay)
+    monkeypatch.setattr(holdings_service, "HOLDINGS_CACHE_MAX_ROWS", 2)
+    holdings_at("2024-02-15", path=db_path)
+    holdings_service.holdings_at_many(["2024-02-15", "2024-03-15"], [account_id], path=db_path)
+    holdings_at("2024-03-15", path=db_path)
+    assert len(_cached_scopes(db_path)) == 2
+
+
+def test_holdings_at_many_shares_one_fetch_and_market_connection(tmp_path, monkeypatch):
+    db_path = tmp_path / "ledger.sqlite"
+    market_path = tmp_path / "market.duckdb"
+    _seed_cached_ledger(db_path)
+    con = duckdb.connect(str(market_path))
+    try:
+        con.execute(
+            "CREATE TABLE daily_prices(symbol VARCHAR, close DOUBLE, adj_close DOUBLE, trade_date DATE)"
+        )
+        con.execute(
+            "INSERT INTO daily_prices VALUES ('ABC', 11, 11, '2024-02-01'), ('ABC', 12, 12, '2024-03-01')"
+        )
+    finally:
+        con.close()
+    dates = ["2024-02-15", "2024-03-15"]
+    expected = {as_of: holdings_at(as_of, path=db_path, market_path=market_path) for as_of in dates}
+    with sqlite_db.session(db_path) as conn:
+        conn.execute("DELETE FROM holdings_cache")
+
+    calls = {"history": 0}
+    fetch_history = holdings_service._fetch_history
+
+    def counted_history(*args, **kwargs):
+        calls["history"] += 1
+        return fetch_history(*args, **kwargs)
+
+    monkeypatch.setattr(holdings_service, "_fetch_history", counted_history)
+    before = duckdb_store.reader_stats()
+    many = holdings_service.holdings_at_many(dates, path=db_path, market_path=market_path)
+    after = duckdb_store.reader_stats()
+
+    assert many == expected
+    assert calls == {"history": 1}
+    assert after["opens"] + after["reuses"] == before["opens"] + before["reuses"] + 1
+    assert [
+        next(row["market_price"] for row in many[as_of] if row["asset_type"] == "equity")
+        for as_of in dates
+    ] == [11.0, 12.0]
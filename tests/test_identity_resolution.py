@@ -1,5 +1,8 @@
+import pytest
+
 from ledger.db import sqlite as sqlite_db
-from ledger.ingest.identity_resolution import resolve_parse_result
+from ledger.ingest import identity_resolution
+from ledger.ingest.identity_resolution import resolve_parse_result, resolver_cache_version
 from ledger.parsers.types import (
     ParsedAccount,
     ParsedInstrument,
@@ -188,3 +191,62 @@ def test_option_contract_is_not_collapsed_to_underlying_listing(tmp_path):
     assert option.option_expiry == "2024-09-20"
     assert option.option_strike == 75
     assert option.option_type == "PUT"
+
+
+def test_resolver_cache_version_is_memoized_until_a_hashed_input_changes(tmp_path, monkeypatch):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    computed = []
+    compute = identity_resolution._compute_resolver_cache_version
+
+    def counting_compute(conn):
+        computed.append(1)
+        return compute(conn)
+
+    monkeypatch.setattr(identity_resolution, "_compute_resolver_cache_version", counting_compute)
+    with sqlite_db.session(db_path) as conn:
+        institution_id = sqlite_db.upsert_institution(conn, "TST", "Test")
+        instrument_id = sqlite_db.upsert_instrument(
+            conn, asset_type="equity", symbol="CANON", currency="CAD"
+        )
+        initial = resolver_cache_version(conn)
+        assert resolver_cache_version(conn) == initial
+        # A new pending candidate is not part of the fingerprint.
+        conn.execute(
+            """
+            INSERT INTO instrument_resolution_candidates(
+                institution_id, normalized_text, display_text, asset_type, currency
+            ) VALUES (?, 'CANON CORP', 'Canon Corp', 'equity', 'CAD')
+            """,
+            (institution_id,),
+        )
+        assert resolver_cache_version(conn) == initial
+        assert len(computed) == 1
+
+        conn.execute(
+            "UPDATE instrument_resolution_candidates SET status = 'resolved', "
+            "resolved_instrument_id = ?",
+            (instrument_id,),
+        )
+        resolved = resolver_cache_version(conn)
+        assert resolved != initial
+        assert len(computed) == 2
+
+    with pytest.raises(RuntimeError), sqlite_db.session(db_path) as conn:
+        conn.execute(
+            "INSERT INTO instrument_aliases(instrument_id, alias, institution_id) VALUES (?, ?, ?)",
+            (instrument_id, "Reviewed Alias", institution_id),
+        )
+        assert resolver_cache_version(conn) not in {initial, resolved}
+        raise RuntimeError("roll back")
+
+    with sqlite_db.session(db_path) as conn:
+        assert resolver_cache_version(conn) == resolved
+        assert resolver_cache_version(conn) == compute(conn)
+    assert len(computed) == 3
+
+    # Re-running init_db over existing triggers is not a resolver input write.
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        assert resolver_cache_version(conn) == resolved
+    assert len(computed) == 3
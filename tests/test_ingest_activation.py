@@ -1,6 +1,8 @@
 """Regression coverage for the Phase 3 staged source activation contract."""
 from __future__ import annotations
 
+import json
+import logging
 from copy import deepcopy
 
 import pytest
@@ -12,6 +14,7 @@ from ledger.ingest.pipeline import (
     activate_source_result,
     export_active_ingestion_logs,
 )
+from ledger.ingest.reconcile import reconcile_after_ingest
 from ledger.parsers.td import TDParser
 from ledger.parsers.types import (
     ParsedAccount,
@@ -26,6 +29,9 @@ from ledger.parsers.types import (
     SourceSpan,
 )
 from ledger.pdf_text import PdfText
+from ledger.shadow import _content_hash
+
+from .fixture_loader import FIXTURES, load_fixture, write_text_pdf
 
 
 def _pdf(*, sha256: str = "a" * 64) -> PdfText:
@@ -409,3 +415,355 @@ def test_reviewed_alias_is_recorded_and_quarantine_log_is_an_idempotent_index(tm
     assert "PRIVATE UNPARSED DETAIL" not in attempts_content
     assert '"ingestion_run_id"' in first_content
     assert '"evidence_id"' in first_content
+
+
+def _write_statement_tree(root):
+    statements = root / "Statements"
+    for folder, fixture_dir in (("TD Webbroker", "td"), ("HSBC direct invest", "hsbc")):
+        for fixture in sorted((FIXTURES / fixture_dir).iterdir()):
+            write_text_pdf(
+                statements / folder / f"{fixture.stem}.pdf",
+                load_fixture(f"{fixture_dir}/{fixture.name}").pages,
+            )
+    write_text_pdf(statements / "TD Webbroker" / "zz_image_only.pdf", [""])
+    return statements
+
+
+def test_parallel_ingest_activates_in_path_order_and_matches_serial_build(tmp_path):
+    statements = _write_statement_tree(tmp_path)
+    logger = logging.getLogger("test.parallel_ingest")
+    summaries = {}
+    for jobs in (1, 3):
+        summaries[jobs] = pipeline.run_ingest(
+            path=tmp_path / f"jobs{jobs}.sqlite",
+            statements_dir=statements,
+            repo_root=tmp_path,
+            log_dir=tmp_path / f"logs{jobs}",
+            jobs=jobs,
+            logger=logger,
+        )
+
+    assert summaries[1]["scanned"] == summaries[3]["scanned"] == 10
+    assert summaries[1]["activated"] == summaries[3]["activated"] == 9
+    assert _content_hash(tmp_path / "jobs1.sqlite") == _content_hash(tmp_path / "jobs3.sqlite")
+    runs = {}
+    for jobs in (1, 3):
+        with sqlite_db.session(tmp_path / f"jobs{jobs}.sqlite") as conn:
+            runs[jobs] = [
+                tuple(row)
+                for row in conn.execute(
+                    "SELECT sf.relpath, ir.status FROM ingestion_runs ir "
+                    "JOIN source_files sf ON sf.source_file_id = ir.source_file_id "
+                    "ORDER BY ir.ingestion_run_id"
+                )
+            ]
+    assert runs[1] == runs[3]
+    assert [relpath for relpath, _ in runs[3]] == sorted(relpath for relpath, _ in runs[3])
+    assert runs[3][-1] == ("Statements/TD Webbroker/zz_image_only.pdf", "skipped")
+
+
+def test_batched_instrument_upserts_keep_sequential_ids_and_content_hash(tmp_path, monkeypatch):
+    statements = _write_statement_tree(tmp_path)
+    logger = logging.getLogger("test.instrument_ids")
+
+    def ingest(name: str) -> dict[str, int]:
+        db_path = tmp_path / f"{name}.sqlite"
+        pipeline.run_ingest(
+            path=db_path,
+            statements_dir=statements,
+            repo_root=tmp_path,
+            log_dir=tmp_path / f"logs-{name}",
+            logger=logger,
+        )
+        with sqlite_db.session(db_path) as conn:
+            return {
+                row["symbol"]: row["instrument_id"]
+                for row in conn.execute("SELECT symbol, instrument_id FROM instruments")
+            }
+
+    batched = ingest("batched")
+
+    def sequential(conn, specs):
+        ids = []
+        for spec in specs:
+            ids.append(sqlite_db.upsert_instrument(conn, **spec))
+        return ids
+
+    monkeypatch.setattr(sqlite_db, "upsert_instruments", sequential)
+    # Every repeated spec still burns an AUTOINCREMENT value, as the
+    # row-by-row writer did; these IDs feed reconciliation keys.
+    assert batched == ingest("sequential") == {
+        "GGG": 1, "AAA": 2, "BBB": 3, "CASH": 4, "VELO": 20, "SHRT": 23,
+    }
+    assert _content_hash(tmp_path / "batched.sqlite") == _content_hash(
+        tmp_path / "sequential.sqlite"
+    )
+
+
+def test_unchanged_stat_fingerprints_skip_rehashing_and_extraction_reuses_hash(
+    tmp_path, monkeypatch
+):
+    statements = _write_statement_tree(tmp_path)
+    hashed: list[str] = []
+    real_sha256 = pipeline._sha256_file
+
+    def counting_sha256(path):
+        hashed.append(path.name)
+        return real_sha256(path)
+
+    def no_second_hash(path):
+        raise AssertionError(f"extract_pdf rehashed {path}")
+
+    monkeypatch.setattr(pipeline, "_sha256_file", counting_sha256)
+    monkeypatch.setattr("ledger.pdf_text.sha256_of", no_second_hash)
+
+    def ingest(**kwargs):
+        hashed.clear()
+        return pipeline.run_ingest(
+            path=tmp_path / "ledger.sqlite",
+            statements_dir=statements,
+            repo_root=tmp_path,
+            log_dir=tmp_path / "logs",
+            logger=logging.getLogger("test.fingerprints"),
+            **kwargs,
+        )
+
+    ingest()
+    assert len(hashed) == 10
+    ingest()
+    assert hashed == []
+
+    touched = statements / "TD Webbroker" / "zz_image_only.pdf"
+    write_text_pdf(touched, ["", ""])
+    ingest()
+    assert hashed == ["zz_image_only.pdf"]
+
+    ingest(verify_hashes=True)
+    assert len(hashed) == 10
+    with sqlite_db.session(tmp_path / "ledger.sqlite") as conn:
+        stored = conn.execute(
+            "SELECT sha256 FROM source_fingerprints WHERE relpath = ?",
+            ("Statements/TD Webbroker/zz_image_only.pdf",),
+        ).fetchone()["sha256"]
+    assert stored == real_sha256(touched)
+
+
+def test_ingest_plan_explains_reparses_without_writing_ledger_rows(tmp_path):
+    statements = _write_statement_tree(tmp_path)
+    options = {"path": tmp_path / "ledger.sqlite", "statements_dir": statements, "repo_root": tmp_path}
+    logger = logging.getLogger("test.ingest_plan")
+
+    fresh = pipeline.plan_ingest(logger=logger, **options)
+    assert fresh["scanned"] == fresh["to_parse"] == 10
+    assert {source["reason"] for source in fresh["sources"]} == {"new source"}
+    assert not (tmp_path / "ledger.sqlite").exists()
+
+    # Later activations can change resolver inputs for earlier sources; the
+    # plan must predict exactly what the next run parses.
+    for _ in range(3):
+        planned = pipeline.plan_ingest(logger=logger, **options)
+        summary = pipeline.run_ingest(log_dir=tmp_path / "logs", logger=logger, **options)
+        assert summary["activated"] == sum(
+            1 for source in planned["sources"]
+            if source["reason"] is not None and not source["relpath"].endswith("zz_image_only.pdf")
+        )
+    assert pipeline.plan_ingest(logger=logger, **options)["to_parse"] == 0
+
+    def ledger_meta() -> list[tuple]:
+        with sqlite_db.session(tmp_path / "ledger.sqlite") as conn:
+            return [
+                tuple(row)
+                for row in conn.execute(
+                    """
+                    SELECT 'fingerprint', relpath, sha256, mtime_ns FROM source_fingerprints
+                    UNION ALL SELECT 'meta', key, value, NULL FROM schema_meta
+                     ORDER BY 1, 2
+                    """
+                )
+            ]
+
+    changed = sorted((statements / "HSBC direct invest").glob("*.pdf"))[0]
+    write_text_pdf(changed, load_fixture(f"hsbc/{changed.stem}.txt").pages + ["Appendix"])
+    with sqlite_db.session(tmp_path / "ledger.sqlite") as conn:
+        conn.execute("DELETE FROM schema_meta WHERE key = 'resolver_cache_version'")
+    before = ledger_meta()
+    reasons = {
+        source["relpath"]: source["reason"]
+        for source in pipeline.plan_ingest(logger=logger, **options)["sources"]
+        if source["reason"] is not None
+    }
+    assert reasons == {changed.relative_to(tmp_path).as_posix(): "content changed"}
+    forced = pipeline.plan_ingest(force=True, logger=logger, **options)
+    assert {source["reason"] for source in forced["sources"]} == {"forced"}
+    # Refreshed fingerprints and the resolver memo stay in memory.
+    assert ledger_meta() == before
+
+
+def test_ingest_plan_reads_a_ledger_from_before_stat_fingerprints(tmp_path):
+    statements = _write_statement_tree(tmp_path)
+    options = {"path": tmp_path / "ledger.sqlite", "statements_dir": statements, "repo_root": tmp_path}
+    logger = logging.getLogger("test.ingest_plan_upgrade")
+    pipeline.run_ingest(log_dir=tmp_path / "logs", logger=logger, **options)
+    current = pipeline.plan_ingest(logger=logger, **options)
+    with sqlite_db.session(tmp_path / "ledger.sqlite") as conn:
+        # Roll the ledger back to the pre-fingerprint, pre-generation schema.
+        conn.execute("DROP TABLE source_fingerprints")
+        for (trigger,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            " AND name LIKE 'bump_resolver_generation_%'"
+        ).fetchall():
+            conn.execute(f"DROP TRIGGER {trigger}")
+        conn.execute(
+            "DELETE FROM schema_meta WHERE key IN (?, 'resolver_cache_version')",
+            (sqlite_db.RESOLVER_GENERATION_KEY,),
+        )
+
+    assert pipeline.plan_ingest(logger=logger, **options) == current
+    with sqlite_db.session(tmp_path / "ledger.sqlite") as conn:
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'source_fingerprints'"
+        ).fetchone() is None
+
+
+def test_first_page_decides_unclaimed_and_skipped_sources_without_full_extraction(
+    tmp_path, monkeypatch
+):
+    statements = tmp_path / "Statements"
+    filler = "Trading Summary for Tax Year 2023 prepared for the account holder"
+    write_text_pdf(
+        statements / "CIBC Invest Direct" / "cibc_2023_annual.pdf",
+        [filler, "Page two detail", "Page three detail"],
+    )
+    write_text_pdf(
+        statements / "Unknown Broker" / "statement.pdf",
+        ["Quarterly statement for an unsupported broker", "Holdings detail"],
+    )
+
+    def no_full_extraction(path, **_kwargs):
+        raise AssertionError(f"{path.name} was fully extracted")
+
+    monkeypatch.setattr(pipeline, "extract_pdf", no_full_extraction)
+    summary = pipeline.run_ingest(
+        path=tmp_path / "ledger.sqlite",
+        statements_dir=statements,
+        repo_root=tmp_path,
+        log_dir=tmp_path / "logs",
+        logger=logging.getLogger("test.first_page"),
+    )
+
+    assert summary["scanned"] == 2
+    assert summary["activated"] == 0
+    with sqlite_db.session(tmp_path / "ledger.sqlite") as conn:
+        attempts = [
+            tuple(row)
+            for row in conn.execute(
+                "SELECT sf.relpath, sf.page_count, sf.is_image_only, ir.status, ir.parser_name, "
+                "ir.error_summary FROM ingestion_runs ir "
+                "JOIN source_files sf ON sf.source_file_id = ir.source_file_id "
+                "ORDER BY sf.relpath"
+            )
+        ]
+    assert attempts == [
+        (
+            "Statements/CIBC Invest Direct/cibc_2023_annual.pdf",
+            3,
+            0,
+            "skipped",
+            "cibc",
+            "tax document; no brokerage statement extraction",
+        ),
+        (
+            "Statements/Unknown Broker/statement.pdf",
+            2,
+            0,
+            "failed",
+            None,
+            "no registered parser claimed source",
+        ),
+    ]
+
+
+def test_ingest_records_stage_timings_and_profiles_them_per_parser_version(tmp_path):
+    statements = _write_statement_tree(tmp_path)
+    db_path = tmp_path / "ledger.sqlite"
+    summary = pipeline.run_ingest(
+        path=db_path,
+        statements_dir=statements,
+        repo_root=tmp_path,
+        log_dir=tmp_path / "logs",
+        logger=logging.getLogger("test.timings"),
+    )
+
+    assert set(summary["timings"]) == {"reconcile"}
+    with sqlite_db.session(db_path) as conn:
+        runs = {
+            row["relpath"]: (row["status"], json.loads(row["timings_json"]))
+            for row in conn.execute(
+                "SELECT sf.relpath, ir.status, ir.timings_json FROM ingestion_runs ir "
+                "JOIN source_files sf ON sf.source_file_id = ir.source_file_id"
+            )
+        }
+    assert len(runs) == 10
+    for relpath, (status, timings) in runs.items():
+        expected = {"hash", "extract"}
+        if status == "active":
+            expected |= {"select", "parse", "validate", "resolve", "write"}
+        assert set(timings) == expected, relpath
+        assert all(spent["wall_ms"] >= 0 and spent["cpu_ms"] >= 0 for spent in timings.values())
+
+    exported = [
+        json.loads(line)
+        for line in (tmp_path / "logs" / "ingestion_attempts.jsonl").read_text().splitlines()
+    ]
+    assert all(json.loads(row["timings_json"]) == runs[row["relpath"]][1] for row in exported)
+
+    profile = pipeline.ingest_profile(path=db_path, limit=3)
+    assert profile["profiled"] == 10
+    assert len(profile["files"]) == 3
+    walls = [item["wall_ms"] for item in profile["files"]]
+    assert walls == sorted(walls, reverse=True)
+    groups = {(group["parser_name"], group["parser_version"]): group for group in profile["parsers"]}
+    assert {name for name, _ in groups} == {"td", "hsbc", None}
+    assert sum(group["files"] for group in groups.values()) == 10
+    td = next(group for (name, _), group in groups.items() if name == "td")
+    td_parse = [
+        timings["parse"]["wall_ms"]
+        for relpath, (_, timings) in runs.items()
+        if "/TD Webbroker/" in relpath and "parse" in timings
+    ]
+    assert td["stages"]["parse"]["wall_ms"] == pytest.approx(sum(td_parse), abs=0.01)
+
+
+def test_scoped_reconciliation_after_ingest_matches_a_full_rebuild(tmp_path):
+    statements = _write_statement_tree(tmp_path)
+    db_path = tmp_path / "ledger.sqlite"
+    options = {
+        "path": db_path,
+        "statements_dir": statements,
+        "repo_root": tmp_path,
+        "log_dir": tmp_path / "logs",
+        "logger": logging.getLogger("test.scoped_reconcile"),
+    }
+
+    def assert_matches_full_rebuild() -> None:
+        scoped = _content_hash(db_path)
+        reconcile_after_ingest(db_path)
+        assert _content_hash(db_path) == scoped
+
+    first = pipeline.run_ingest(limit=4, **options)
+    assert first["reconciliation"]["results"]["scopes"] > 0
+    assert_matches_full_rebuild()
+    pipeline.run_ingest(**options)
+    assert_matches_full_rebuild()
+
+    changed = sorted((statements / "TD Webbroker").glob("*.pdf"))[0]
+    write_text_pdf(changed, load_fixture(f"td/{changed.stem}.txt").pages + ["Appendix"])
+    replaced = pipeline.run_ingest(**options)
+    assert replaced["activated"] == 1
+    assert_matches_full_rebuild()
+
+    idle = pipeline.run_ingest(**options)
+    assert idle["reconciliation"]["results"]["scopes"] == 0
+    assert "scopes" not in pipeline.run_ingest(full_reconcile=True, **options)["reconciliation"][
+        "results"
+    ]
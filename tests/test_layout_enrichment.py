@@ -134,7 +134,21 @@ def test_layout_enrichment_uses_persisted_hints_and_verify_uses_stored_boxes(tmp
             evidence_rows=evidence_rows,
         )
 
+    def persisted_page_numbers() -> list[str]:
+        with sqlite_db.session(db_path) as conn:
+            return [
+                row[0]
+                for row in conn.execute(
+                    "SELECT page_numbers FROM source_evidence_geometry ORDER BY evidence_id"
+                )
+            ]
+
     assert metrics["exact"] == 2
+    assert persisted_page_numbers() == ["1", "1"]
+    with sqlite_db.session(db_path) as conn:
+        conn.execute("ALTER TABLE source_evidence_geometry DROP COLUMN page_numbers")
+    sqlite_db.init_db(db_path)
+    assert persisted_page_numbers() == ["1", "1"]
     pages = _persisted_boxes(
         Path("unused-because-page-metadata-is-persisted.pdf"),
         source_file_id=source_id,
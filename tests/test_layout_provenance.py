@@ -1,8 +1,20 @@
 """Shared PDF layout/provenance model regression tests."""
 from __future__ import annotations
 
+import pytest
+
+from ledger import pdf_text
 from ledger.parsers.layout import SourceLocator, normalize_layout_text
-from ledger.pdf_text import PdfLine, PdfText, PdfWord
+from ledger.pdf_text import (
+    PdfLine,
+    PdfText,
+    PdfWord,
+    extract_first_page,
+    extract_pdf,
+    text_cache_path,
+)
+
+from .fixture_loader import write_text_pdf
 
 
 def test_source_locator_preserves_coordinate_bearing_word_evidence():
@@ -61,3 +73,90 @@ def test_layout_lines_keeps_page_line_fallback_when_only_some_pages_have_words()
         (1, 1, "Coordinate row"),
         (2, 1, "Fallback row"),
     ]
+
+
+@pytest.mark.parametrize("include_layout", [False, True])
+def test_text_cache_round_trips_extraction_without_reopening_the_pdf(
+    tmp_path, monkeypatch, include_layout
+):
+    source = tmp_path / "Statements" / "statement.pdf"
+    write_text_pdf(source, ["Account 123\nBuy AAA 10 12.50", "Closing balance 125.00"])
+    cache_dir = tmp_path / "cache"
+    extracted = extract_pdf(
+        source, repo_root=tmp_path, include_layout=include_layout, cache_dir=cache_dir
+    )
+    assert text_cache_path(cache_dir, extracted.sha256, include_layout=include_layout).exists()
+
+    def unavailable(*_args, **_kwargs):
+        raise AssertionError("cached extraction reopened the PDF")
+
+    monkeypatch.setattr(pdf_text.pdfplumber, "open", unavailable)
+    monkeypatch.setattr(pdf_text, "PdfReader", unavailable)
+    renamed = tmp_path / "Statements" / "copy.pdf"
+    source.rename(renamed)
+    cached = extract_pdf(
+        renamed,
+        repo_root=tmp_path,
+        include_layout=include_layout,
+        sha256=extracted.sha256,
+        cache_dir=cache_dir,
+    )
+
+    assert cached.relpath == "Statements/copy.pdf"
+    assert (cached.pages, cached.page_sizes, cached.page_words, cached.page_lines) == (
+        extracted.pages,
+        extracted.page_sizes,
+        extracted.page_words,
+        extracted.page_lines,
+    )
+    assert bool(cached.page_words[0]) is include_layout
+
+
+def test_single_pass_extraction_matches_pdfplumber_text_and_builds_layout(tmp_path):
+    source = tmp_path / "statement.pdf"
+    pages = [
+        "Account 123\nBuy AAA 10 12.50 125.00\nSell BBB 5 20.00 100.00",
+        "Closing balance 125.00",
+    ]
+    write_text_pdf(source, pages)
+
+    text_only = extract_pdf(source, repo_root=tmp_path)
+    with_layout = extract_pdf(source, repo_root=tmp_path, include_layout=True)
+    with pdf_text.pdfplumber.open(str(source)) as document:
+        expected = [page.extract_text() for page in document.pages]
+
+    assert text_only.pages == with_layout.pages == expected
+    assert text_only.page_lines == [[], []]
+    assert [[line.text for line in lines] for lines in with_layout.page_lines] == [
+        page.splitlines() for page in pages
+    ]
+    first = with_layout.page_lines[0][1]
+    assert [word.text for word in first.words] == ["Buy", "AAA", "10", "12.50", "125.00"]
+    assert first.bbox is not None
+
+
+def test_full_extraction_reuses_the_first_page_head(tmp_path, monkeypatch):
+    source = tmp_path / "statement.pdf"
+    write_text_pdf(source, ["Account 123\nBuy AAA 10 12.50", "Closing balance 125.00"])
+    expected = extract_pdf(source, repo_root=tmp_path, include_layout=True)
+    head, complete = extract_first_page(source, repo_root=tmp_path, include_layout=True)
+    assert not complete
+
+    extracted_pages = []
+    page_text_and_layout = pdf_text._page_text_and_layout
+
+    def counted(page, page_number, **kwargs):
+        extracted_pages.append(page_number)
+        return page_text_and_layout(page, page_number, **kwargs)
+
+    monkeypatch.setattr(pdf_text, "_page_text_and_layout", counted)
+    full = extract_pdf(source, repo_root=tmp_path, include_layout=True, head=head)
+
+    assert extracted_pages == [2]
+    assert (full.page_count, full.pages, full.page_sizes, full.page_words, full.page_lines) == (
+        expected.page_count,
+        expected.pages,
+        expected.page_sizes,
+        expected.page_words,
+        expected.page_lines,
+    )
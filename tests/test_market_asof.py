@@ -0,0 +1,153 @@
+"""As-of price/FX grid lookups over the DuckDB market store."""
+from __future__ import annotations
+
+import duckdb
+import numpy as np
+import pytest
+
+from ledger.db import duckdb_store
+from ledger.market.asof import fx_grid, price_grid
+
+
+def _market(path) -> None:
+    con = duckdb.connect(str(path))
+    try:
+        con.execute(
+            "CREATE TABLE daily_prices(symbol VARCHAR, close DOUBLE, adj_close DOUBLE, trade_date DATE)"
+        )
+        con.execute(
+            """
+            INSERT INTO daily_prices VALUES
+                ('ABC', 10, 10, '2024-01-02'),
+                ('ABC', NULL, 11, '2024-01-05'),
+                ('ABC', NULL, NULL, '2024-01-08'),
+                ('XYZ', 5, 5, '2024-01-06')
+            """
+        )
+        con.execute("CREATE TABLE fx_rates(base VARCHAR, quote VARCHAR, rate_date DATE, rate DOUBLE)")
+        con.execute(
+            """
+            INSERT INTO fx_rates VALUES
+                ('USD', 'CAD', '2024-01-03', 1.25),
+                ('CAD', 'USD', '2024-01-01', 0.5),
+                ('CAD', 'USD', '2024-01-04', 0.0)
+            """
+        )
+    finally:
+        con.close()
+
+
+def test_price_grid_answers_every_symbol_and_date_as_of(tmp_path):
+    market_path = tmp_path / "market.duckdb"
+    _market(market_path)
+
+    grid = price_grid(
+        ["XYZ", "ABC", "NONE"],
+        ["2024-01-09", "2024-01-01", "2024-01-05"],
+        market_path=market_path,
+    )
+
+    assert grid.keys == ("ABC", "NONE", "XYZ")
+    assert grid.dates == ("2024-01-01", "2024-01-05", "2024-01-09")
+    np.testing.assert_array_equal(
+        grid.values,
+        [[np.nan, 11.0, 11.0], [np.nan, np.nan, np.nan], [np.nan, np.nan, 5.0]],
+    )
+    assert grid.get("ABC", "2024-01-09") == (11.0, "2024-01-05")
+    assert grid.get("ABC", "2024-01-01") is None
+    assert grid.get("XYZ", "2024-01-05") is None
+    assert price_grid(["ABC"], ["2024-01-09"], market_path=tmp_path / "missing.duckdb").get(
+        "ABC", "2024-01-09"
+    ) is None
+
+
+def test_fx_grid_prefers_direct_rates_and_falls_back_to_nonzero_inverse(tmp_path):
+    market_path = tmp_path / "market.duckdb"
+    _market(market_path)
+
+    grid = fx_grid(
+        [("USD", "CAD"), ("CAD", "USD"), ("CAD", "CAD")],
+        ["2024-01-02", "2024-01-04"],
+        market_path=market_path,
+    )
+
+    assert grid.get("USD/CAD", "2024-01-02") == (2.0, "2024-01-01")
+    assert grid.get("USD/CAD", "2024-01-04") == (1.25, "2024-01-03")
+    assert grid.get("CAD/USD", "2024-01-02") == (0.5, "2024-01-01")
+    assert grid.get("CAD/USD", "2024-01-04") == (0.0, "2024-01-04")
+    assert grid.get("CAD/CAD", "2024-01-04") == (1.0, "2024-01-04")
+
+
+def test_shared_reader_reuses_one_connection_and_reopens_replaced_store(tmp_path):
+    market_path = tmp_path / "market.duckdb"
+    _market(market_path)
+    refreshed = tmp_path / "refreshed.duckdb"
+    _market(refreshed)
+    con = duckdb.connect(str(refreshed))
+    try:
+        con.execute("INSERT INTO daily_prices VALUES ('ABC', 20, 20, '2024-01-09')")
+    finally:
+        con.close()
+    before = duckdb_store.reader_stats()
+
+    try:
+        assert price_grid(["ABC"], ["2024-01-09"], market_path=market_path).get(
+            "ABC", "2024-01-09"
+        ) == (11.0, "2024-01-05")
+        assert price_grid(["XYZ"], ["2024-01-09"], market_path=market_path).get(
+            "XYZ", "2024-01-09"
+        ) == (5.0, "2024-01-06")
+        shared = duckdb_store.reader_stats()
+        refreshed.replace(market_path)
+        assert price_grid(["ABC"], ["2024-01-09"], market_path=market_path).get(
+            "ABC", "2024-01-09"
+        ) == (20.0, "2024-01-09")
+        reopened = duckdb_store.reader_stats()
+
+        # A writer in this process releases the shared reader instead of conflicting with it.
+        writer = duckdb_store.connect(market_path)
+        try:
+            writer.execute("INSERT INTO daily_prices VALUES ('ABC', 30, 30, '2024-01-10')")
+        finally:
+            writer.close()
+        assert price_grid(["ABC"], ["2024-01-10"], market_path=market_path).get(
+            "ABC", "2024-01-10"
+        ) == (30.0, "2024-01-10")
+    finally:
+        duckdb_store.close_readers()
+
+    assert shared["opens"] - before["opens"] == 1
+    assert shared["reuses"] - before["reuses"] == 1
+    assert reopened["reopens"] - shared["reopens"] == 1
+
+
+def test_connect_retries_lock_conflicts_of_any_duckdb_error_type(tmp_path, monkeypatch):
+    path = tmp_path / "market.duckdb"
+    real_connect = duckdb.connect
+    failures = [
+        duckdb.ConnectionException(
+            "Can't open a connection to same database file with a different configuration"
+        ),
+        duckdb.IOException('Could not set lock on file "market.duckdb": Conflicting lock is held'),
+    ]
+
+    def contended(*args, **kwargs):
+        if failures:
+            raise failures.pop(0)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(duckdb_store.connect.retry, "sleep", lambda _seconds: None)
+    monkeypatch.setattr(duckdb, "connect", contended)
+    duckdb_store.connect(path).close()
+    assert failures == []
+
+    attempts = []
+
+    def corrupt(*_args, **_kwargs):
+        attempts.append(1)
+        raise duckdb.IOException("Cannot open file: not a valid DuckDB database file")
+
+    monkeypatch.setattr(duckdb, "connect", corrupt)
+    with pytest.raises(duckdb.IOException):
+        duckdb_store.connect(path)
+    assert attempts == [1]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import cast
 
+from ledger.parsers import validation
 from ledger.parsers.layout import quarantine_unsupported_rows
 from ledger.parsers.types import (
     ParsedAccount,
@@ -17,7 +18,7 @@ from ledger.parsers.types import (
     SourceSpan,
     TxnType,
 )
-from ledger.parsers.validation import validate_parse_result
+from ledger.parsers.validation import ValidationMemo, validate_parse_result
 
 
 def _result() -> ParseResult:
@@ -131,6 +132,27 @@ def test_explicit_staged_unresolved_movement_can_reach_name_reconciliation():
     assert report.is_valid
 
 
+def test_validation_memo_replays_row_checks_but_rechecks_resolved_identity(monkeypatch):
+    result = _result()
+    result.statements[0].transactions[0].trade_date = "2024-02-01"
+    first = validate_parse_result(result, memo=ValidationMemo.of(result))
+    assert "transaction_date_outside_period" in {issue.code for issue in first.errors}
+
+    def row_checks_must_not_rerun(*args, **kwargs):
+        raise AssertionError("unchanged parser-owned row was re-validated")
+
+    monkeypatch.setattr(validation, "_transaction_row", row_checks_must_not_rerun)
+    monkeypatch.setattr(validation, "_position_row", row_checks_must_not_rerun)
+    # Resolution rewrites identity in place; only those checks see the change.
+    result.statements[0].transactions[0].instrument.currency = "USD"
+    memoized = validate_parse_result(result, memo=ValidationMemo.of(result))
+    monkeypatch.undo()
+
+    assert memoized.to_dict() == validate_parse_result(result).to_dict()
+    assert "instrument_currency_mismatch" in {issue.code for issue in memoized.errors}
+    assert ValidationMemo.of(deepcopy(result))._rows == {}
+
+
 def test_option_identity_and_currency_mismatch_are_fatal():
     result = _result()
     transaction = result.statements[0].transactions[0]
@@ -232,6 +232,22 @@ def test_name_resolution_uses_strict_portfolio_wide_fallback(tmp_path):
             quantity=100,
             currency="CAD",
         )
+        # A same-account holding that shares no word is never a candidate,
+        # so it neither matches nor blocks the portfolio-wide fallback.
+        unrelated_id = sqlite_db.upsert_instrument(
+            conn,
+            asset_type="equity",
+            symbol="ABX",
+            currency="CAD",
+            name="BARRICK GOLD CORP",
+        )
+        seed_position(
+            conn,
+            statement_id=source_statement,
+            instrument_id=unrelated_id,
+            quantity=50,
+            currency="CAD",
+        )
         transaction_id = conn.execute(
             """
             INSERT INTO transactions(
@@ -254,3 +270,53 @@ def test_name_resolution_uses_strict_portfolio_wide_fallback(tmp_path):
             (transaction_id,),
         ).fetchone()
     assert tuple(resolved) == (instrument_id, "portfolio_holding_name")
+
+
+def test_transfer_matching_honours_the_date_window_for_keyed_and_journal_candidates(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        from_account_id = _seed_account(conn, "A1")
+        to_account_id = _seed_account(conn, "A2")
+        cad_id = sqlite_db.upsert_instrument(conn, asset_type="equity", symbol="ABC", currency="CAD")
+        usd_id = sqlite_db.upsert_instrument(conn, asset_type="equity", symbol="ABC.U", currency="USD")
+        conn.execute(
+            "INSERT INTO instrument_journal_pairs(from_instrument_id, to_instrument_id) VALUES (?, ?)",
+            (cad_id, usd_id),
+        )
+
+        def transfer(account_id: int, trade_date: str, instrument_id: int, delta: float) -> int:
+            return conn.execute(
+                """
+                INSERT INTO transactions(
+                    account_id, trade_date, txn_type, instrument_id, quantity,
+                    position_delta, currency
+                ) VALUES (?, ?, 'journal', ?, ?, ?, 'CAD')
+                RETURNING transaction_id
+                """,
+                (account_id, trade_date, instrument_id, delta, delta),
+            ).fetchone()[0]
+
+        journal_out = transfer(from_account_id, "2024-01-10", cad_id, -100)
+        transfer(to_account_id, "2024-01-18", cad_id, 100)
+        journal_in = transfer(to_account_id, "2024-01-17", usd_id, 100)
+        keyed_in = transfer(to_account_id, "2024-02-23", cad_id, 50)
+        keyed_out = transfer(from_account_id, "2024-03-01", cad_id, -50)
+
+    assert link_transfers(db_path, date_window_days=7)["matched"] == 2
+    with sqlite_db.session(db_path) as conn:
+        pairs = dict(
+            conn.execute(
+                """
+                SELECT transaction_id, counterpart_txn_id FROM transactions
+                 WHERE counterpart_txn_id IS NOT NULL
+                """
+            ).fetchall()
+        )
+
+    assert pairs == {
+        journal_out: journal_in,
+        journal_in: journal_out,
+        keyed_in: keyed_out,
+        keyed_out: keyed_in,
+    }
@@ -5,7 +5,12 @@ import calendar
 
 from ledger.db import sqlite as sqlite_db
 from ledger.ingest.pipeline import activate_source_result
-from ledger.ingest.reconcile import rebuild_reconciliation_results, reconcile_after_ingest
+from ledger.ingest.reconcile import (
+    ReconcileScope,
+    rebuild_reconciliation_results,
+    reconcile_after_ingest,
+    touched_scopes,
+)
 from ledger.parsers.td import TDParser
 
 from .db_fixtures import (
@@ -718,3 +723,188 @@ def test_td_golden_fixture_persists_only_explained_or_missing_first_checkpoints(
             ).fetchall()
         }
     assert statuses <= {"reconciled", "missing_prior_checkpoint"}
+
+
+def _generated_results(conn) -> dict[str, tuple]:
+    rows = conn.execute(
+        """
+        SELECT r.reconciliation_id, r.reconciliation_key, r.kind, r.check_type,
+               r.reason_code, r.statement_id, r.snapshot_set_id,
+               r.prior_snapshot_set_id, r.instrument_id, r.currency,
+               r.prior_checkpoint, r.current_checkpoint, r.opening_value,
+               r.summed_deltas, r.expected_close, r.reported_close, r.residual,
+               r.status, r.reason,
+               (SELECT GROUP_CONCAT(c.transaction_id || ':' || c.delta, ',')
+                  FROM reconciliation_components c
+                 WHERE c.reconciliation_id = r.reconciliation_id) AS components
+          FROM reconciliation_results r
+         WHERE r.reconciliation_key LIKE 'recon:v1:%'
+        """
+    ).fetchall()
+    return {row["reconciliation_key"]: tuple(row) for row in rows}
+
+
+def test_scoped_rebuild_matches_full_rebuild_and_leaves_other_intervals_alone(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        account_id = _account(conn)
+        other_account = _account(conn, "B-2")
+        instrument_id = sqlite_db.upsert_instrument(
+            conn, asset_type="equity", symbol="ABC", currency="CAD"
+        )
+
+        def month(account: int, label: str, quantity: float, opening: float, closing: float) -> int:
+            statement_id = _statement(conn, account, label)
+            seed_position(
+                conn, statement_id=statement_id, instrument_id=instrument_id,
+                quantity=quantity, currency="CAD",
+            )
+            seed_cash(
+                conn, statement_id=statement_id, currency="CAD",
+                opening_balance=opening, closing_balance=closing,
+            )
+            return statement_id
+
+        jan = month(account_id, "2024-01", 10, 0, 100)
+        mar = month(account_id, "2024-03", 12, 80, 80)
+        other = month(other_account, "2023-12", 5, 0, 0)
+
+    rebuild_reconciliation_results(db_path)
+    with sqlite_db.session(db_path) as conn:
+        before = _generated_results(conn)
+        # February arrives late: its own checkpoint and March's prior change.
+        feb = month(account_id, "2024-02", 12, 100, 80)
+        _transaction(
+            conn, account_id=account_id, statement_id=feb, trade_date="2024-02-10",
+            txn_type="buy", instrument_id=instrument_id, quantity=2, position_delta=2,
+            net_amount=-20, cash_delta=-20,
+        )
+        feb_run = conn.execute(
+            "SELECT ingestion_run_id FROM statements WHERE statement_id = ?", (feb,)
+        ).fetchone()[0]
+        scopes = touched_scopes(conn, [feb_run])
+
+    assert scopes == [ReconcileScope(account_id, "CAD", "2024-02-01", "2024-02-29")]
+    scoped = rebuild_reconciliation_results(db_path, scopes=scopes)
+    with sqlite_db.session(db_path) as conn:
+        after_scoped = _generated_results(conn)
+    rebuild_reconciliation_results(db_path)
+    with sqlite_db.session(db_path) as conn:
+        after_full = _generated_results(conn)
+
+    def semantic(results: dict[str, tuple]) -> dict[str, tuple]:
+        return {key: row[1:] for key, row in results.items()}
+
+    assert semantic(after_scoped) == semantic(after_full)
+    kept = {key: row[0] for key, row in before.items() if row[5] in {jan, other}}
+    assert kept and all(after_scoped[key][0] == result_id for key, result_id in kept.items())
+    recomputed = [row for row in before.values() if row[5] == mar]
+    assert scoped["cleared"] == len(recomputed) > 0
+    assert all(after_scoped[row[1]][0] != row[0] for row in recomputed)
+    assert {row[5] for row in after_scoped.values()} == {jan, feb, mar, other}
+
+
+def test_transactions_on_checkpoint_dates_land_in_exactly_one_interval(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        account_id = _account(conn)
+        instrument_id = sqlite_db.upsert_instrument(
+            conn, asset_type="equity", symbol="ABC", currency="CAD"
+        )
+        statements = {}
+        for label, quantity, opening, closing in (
+            ("2024-01", 10, 0, -50),
+            ("2024-02", 13, -50, -80),
+            ("2024-03", 17, -80, -120),
+        ):
+            statements[label] = _statement(conn, account_id, label)
+            seed_position(
+                conn, statement_id=statements[label], instrument_id=instrument_id,
+                quantity=quantity, currency="CAD",
+            )
+            seed_cash(
+                conn, statement_id=statements[label], currency="CAD",
+                opening_balance=opening, closing_balance=closing,
+            )
+        trades = {}
+        for trade_date, quantity in (
+            ("2024-01-31", 5), ("2024-02-01", 1), ("2024-02-29", 2), ("2024-03-01", 4),
+        ):
+            trades[trade_date] = _transaction(
+                conn, account_id=account_id, statement_id=statements[trade_date[:7]],
+                trade_date=trade_date, txn_type="buy", instrument_id=instrument_id,
+                quantity=quantity, position_delta=quantity,
+                net_amount=-10 * quantity, cash_delta=-10 * quantity,
+            )
+
+    summary = rebuild_reconciliation_results(db_path)
+
+    assert "unexplained_residual" not in summary["positions"]
+    assert "unexplained_residual" not in summary["cash"]
+    with sqlite_db.session(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT r.kind, r.statement_id, c.transaction_id
+              FROM reconciliation_results r
+              JOIN reconciliation_components c ON c.reconciliation_id = r.reconciliation_id
+             WHERE r.reconciliation_key LIKE 'recon:v1:position:%'
+                OR r.reconciliation_key LIKE 'recon:v1:cash:statement:%'
+            """
+        ).fetchall()
+    components: dict[tuple[str, int], set[int]] = {}
+    for row in rows:
+        components.setdefault((row["kind"], row["statement_id"]), set()).add(row["transaction_id"])
+
+    # Positions replay (prior checkpoint, checkpoint]; cash sums [start, end].
+    assert components == {
+        ("position", statements["2024-02"]): {trades["2024-02-01"], trades["2024-02-29"]},
+        ("position", statements["2024-03"]): {trades["2024-03-01"]},
+        ("cash", statements["2024-01"]): {trades["2024-01-31"]},
+        ("cash", statements["2024-02"]): {trades["2024-02-01"], trades["2024-02-29"]},
+        ("cash", statements["2024-03"]): {trades["2024-03-01"]},
+    }
+
+
+def test_parallel_rebuild_writes_serial_results_in_serial_order(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        accounts = {"2024": _account(conn), "2023": _account(conn, "B-2")}
+        instrument_id = sqlite_db.upsert_instrument(
+            conn, asset_type="equity", symbol="ABC", currency="CAD"
+        )
+        # Alternate accounts so statement-ordered totals interleave them.
+        for month, quantity in (("01", 10), ("02", 12), ("03", 11)):
+            for year, account_id in accounts.items():
+                statement_id = _statement(conn, account_id, f"{year}-{month}")
+                seed_position(
+                    conn, statement_id=statement_id, instrument_id=instrument_id,
+                    quantity=quantity, currency="CAD", market_value=quantity * 10,
+                )
+                seed_cash(
+                    conn, statement_id=statement_id, currency="CAD",
+                    opening_balance=100, closing_balance=100 - quantity,
+                )
+                _transaction(
+                    conn, account_id=account_id, statement_id=statement_id,
+                    trade_date=f"{year}-{month}-15", txn_type="buy", instrument_id=instrument_id,
+                    quantity=2, position_delta=2, net_amount=-quantity, cash_delta=-quantity,
+                )
+        conn.execute("UPDATE snapshot_sets SET reported_total = 110")
+
+    def ordered_results() -> list[tuple]:
+        with sqlite_db.session(db_path) as conn:
+            return [row[1:] for row in sorted(_generated_results(conn).values())]
+
+    serial = rebuild_reconciliation_results(db_path)
+    serial_rows = ordered_results()
+    parallel = rebuild_reconciliation_results(db_path, jobs=2)
+
+    assert ordered_results() == serial_rows
+    assert parallel["cleared"] == len(serial_rows)
+    assert {key: parallel[key] for key in serial if key != "cleared"} == {
+        key: value for key, value in serial.items() if key != "cleared"
+    }
+    assert serial["statement_totals"]["results"] == 12
@@ -8,7 +8,18 @@ from ledger.ingest.pipeline import _record_source_file, _write_statement, activa
 from ledger.parsers.cibc import CIBCParser
 from ledger.parsers.rbc import RBCParser
 from ledger.parsers.td import TDParser
-from ledger.parsers.types import ParsedAccount, ParsedStatement, ParseResult
+from ledger.parsers.types import (
+    ParsedAccount,
+    ParsedInstrument,
+    ParsedPosition,
+    ParsedQuarantine,
+    ParsedScopeIssue,
+    ParsedSnapshotSet,
+    ParsedStatement,
+    ParsedTxn,
+    ParseResult,
+    SourceSpan,
+)
 from ledger.pdf_text import PdfText
 
 from .fixture_loader import load_fixture
@@ -68,6 +79,131 @@ def test_rbc_cad_and_usd_children_both_survive_persistence(tmp_path):
     assert currencies == {"CAD", "USD"}
 
 
+def _txn(raw_line, txn_type, instrument, **kwargs):
+    return ParsedTxn(
+        trade_date="2024-01-10", settle_date=None, txn_type=txn_type,
+        instrument=instrument, quantity=kwargs.pop("quantity", 1.0), price=None,
+        gross_amount=None, commission=None, other_fees=None,
+        net_amount=kwargs.pop("net_amount", None), currency="CAD",
+        description=raw_line, raw_line=raw_line, **kwargs,
+    )
+
+
+def test_batched_statement_writer_links_children_like_sequential_writes(tmp_path):
+    old = ParsedInstrument(asset_type="equity", symbol="OLD", currency="CAD", name="Old Co")
+    renamed = ParsedInstrument(asset_type="equity", symbol="OLD", currency="CAD", name="Old Co Ltd")
+    new = ParsedInstrument(asset_type="equity", symbol="NEW", currency="CAD", name="New Co")
+    lost = ParsedQuarantine("Unreadable holding row", "unparsed_position")
+    statement = ParsedStatement(
+        account=ParsedAccount(account_number="A-1", account_type="Margin"),
+        period_start="2024-01-01",
+        period_end="2024-01-31",
+        transactions=[
+            _txn("Bought OLD", "buy", old, net_amount=-10.0),
+            _txn("Bought OLD again", "buy", renamed, net_amount=-10.0),
+            _txn("Sold OLD", "sell", old, quantity=-1.0, net_amount=10.0),
+            _txn(
+                "OLD renamed NEW", "name_change", old,
+                quantity=None, related_instrument=new, corporate_action_ratio=2.0,
+            ),
+        ],
+        positions=[
+            ParsedPosition(new, 2.0, None, None, None, None, None, "CAD", raw_line="NEW 2"),
+        ],
+        quarantine=[lost],
+        snapshot_sets=[
+            ParsedSnapshotSet(
+                currency="CAD",
+                section_type="positions",
+                completeness="partial",
+                issues=[
+                    ParsedScopeIssue("unparsed_row", quarantine=lost),
+                    ParsedScopeIssue(
+                        "printed_total_mismatch",
+                        source_span=SourceSpan(raw_text="Total 99", page_number=1),
+                    ),
+                ],
+            )
+        ],
+    )
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    pdf = PdfText(
+        relpath="Statements/Test/renamed.pdf",
+        page_count=1,
+        pages=["synthetic statement text"],
+        sha256="c" * 64,
+        size_bytes=24,
+    )
+    with sqlite_db.session(db_path) as conn:
+        source_file_id = _record_source_file(
+            conn, pdf, parser_name="synthetic", parser_version="1", parse_status="ok"
+        )
+        for _ in range(2):
+            _write_statement(
+                conn, source_file_id=source_file_id, institution_code="TST", stmt=statement
+            )
+        transactions = conn.execute(
+            """
+            SELECT t.transaction_id, t.raw_line, i.symbol, e.row_kind, e.raw_text
+              FROM transactions t
+              JOIN instruments i ON i.instrument_id = t.instrument_id
+              JOIN source_evidence e ON e.evidence_id = t.evidence_id
+             ORDER BY t.transaction_id
+            """
+        ).fetchall()
+        # The last upsert of a repeated instrument still wins, as it would row by row.
+        name = conn.execute(
+            "SELECT name FROM instruments WHERE symbol = 'OLD'"
+        ).fetchone()[0]
+        change = conn.execute(
+            """
+            SELECT f.symbol, t.symbol, c.conversion_ratio, s.transaction_id, s.evidence_id
+              FROM instrument_ticker_changes c
+              JOIN instruments f ON f.instrument_id = c.from_instrument_id
+              JOIN instruments t ON t.instrument_id = c.to_instrument_id
+              JOIN instrument_ticker_change_sources s
+                ON s.ticker_change_id = c.ticker_change_id
+            """
+        ).fetchone()
+        name_change_evidence = conn.execute(
+            "SELECT evidence_id FROM transactions WHERE txn_type = 'name_change'"
+        ).fetchone()[0]
+        issues = conn.execute(
+            """
+            SELECT si.issue_code, q.raw_line, e.raw_text
+              FROM snapshot_scope_issues si
+              LEFT JOIN quarantine_transactions q ON q.quarantine_id = si.quarantine_id
+              LEFT JOIN source_evidence e ON e.evidence_id = si.evidence_id
+             ORDER BY si.issue_code
+            """
+        ).fetchall()
+        position = conn.execute(
+            """
+            SELECT i.symbol, p.quantity, e.row_kind
+              FROM position_snapshots p
+              JOIN instruments i ON i.instrument_id = p.instrument_id
+              JOIN source_evidence e ON e.evidence_id = p.evidence_id
+            """
+        ).fetchone()
+
+    assert [tuple(row)[1:] for row in transactions] == [
+        ("Bought OLD", "OLD", "transaction", "Bought OLD"),
+        ("Bought OLD again", "OLD", "transaction", "Bought OLD again"),
+        ("Sold OLD", "OLD", "transaction", "Sold OLD"),
+        ("OLD renamed NEW", "OLD", "transaction", "OLD renamed NEW"),
+    ]
+    assert name == "Old Co"
+    assert tuple(change) == (
+        "OLD", "NEW", 2.0, transactions[-1]["transaction_id"], name_change_evidence
+    )
+    assert [tuple(row) for row in issues] == [
+        ("printed_total_mismatch", None, "Total 99"),
+        ("unparsed_row", "Unreadable holding row", "Unreadable holding row"),
+    ]
+    assert tuple(position) == ("NEW", 2.0, "position")
+
+
 def test_td_full_header_bundle_emits_every_month():
     result = TDParser().parse(
         load_fixture("td/full_header_bundle_known_broken.txt")
@@ -421,6 +421,64 @@ def test_statement_pages_and_scope_issues_are_structured_and_cascade(tmp_path):
         assert conn.execute("SELECT COUNT(*) FROM snapshot_scope_issues").fetchone()[0] == 0
 
 
+def test_canonical_statements_track_latest_revision_through_activation_and_discard(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+
+    def canonical(conn) -> list[int]:
+        return [
+            row[0]
+            for row in conn.execute(
+                "SELECT statement_id FROM canonical_statements ORDER BY statement_id"
+            )
+        ]
+
+    with sqlite_db.session(db_path) as conn:
+        institution_id = sqlite_db.upsert_institution(conn, "TST", "Test")
+        account_id = sqlite_db.upsert_account(
+            conn,
+            institution_id=institution_id,
+            account_number="A-1",
+        )
+        statements = [
+            seed_statement(
+                conn,
+                account_id=account_id,
+                source_file_id=seed_source(conn, f"Statements/Test/{name}.pdf"),
+                period_end=period_end,
+            )
+            for name, period_end in (
+                ("jan", "2024-01-31"),
+                ("jan-revised", "2024-01-31"),
+                ("feb", "2024-02-29"),
+            )
+        ]
+        jan, jan_revised, feb = statements
+        assert canonical(conn) == [jan_revised, feb]
+
+        revised_run = conn.execute(
+            "SELECT ingestion_run_id FROM statements WHERE statement_id = ?", (jan_revised,)
+        ).fetchone()[0]
+        conn.execute("SAVEPOINT discard_revision")
+        sqlite_db.discard_derived_ingestion_run(conn, revised_run)
+        assert canonical(conn) == [jan, feb]
+        conn.execute("ROLLBACK TO discard_revision")
+        conn.execute("RELEASE discard_revision")
+        assert canonical(conn) == [jan_revised, feb]
+
+        conn.execute(
+            "UPDATE statements SET period_start = '2024-02-01', period_end = '2024-02-29' "
+            "WHERE statement_id = ?",
+            (jan_revised,),
+        )
+        assert canonical(conn) == [jan, feb]
+
+        conn.execute("DELETE FROM canonical_statements")
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        assert canonical(conn) == [jan, feb]
+
+
 def test_reconciliation_schema_records_residual_without_adjustment(tmp_path):
     db_path = tmp_path / "ledger.sqlite"
     sqlite_db.init_db(db_path)
@@ -621,3 +679,39 @@ def test_failed_attempt_keeps_active_run_pointer(tmp_path):
 
     assert active_after == active_before
     assert statuses == ["active", "failed"]
+
+
+def test_read_session_pools_read_only_connections_and_reopens_replaced_files(tmp_path):
+    db_path = tmp_path / "ledger.sqlite"
+    sqlite_db.init_db(db_path)
+    with sqlite_db.session(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        sqlite_db.upsert_institution(conn, "TST", "Test Broker")
+
+    try:
+        with sqlite_db.read_session(db_path) as first:
+            assert first.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert first.execute("PRAGMA temp_store").fetchone()[0] == 2
+            with pytest.raises(sqlite3.OperationalError):
+                first.execute("DELETE FROM institutions")
+        with sqlite_db.session(db_path) as conn:
+            sqlite_db.upsert_institution(conn, "TWO", "Second Broker")
+        with sqlite_db.read_session(db_path) as second:
+            count = second.execute("SELECT COUNT(*) FROM institutions").fetchone()[0]
+        assert second is first
+        assert count == 2
+
+        replacement = tmp_path / "replacement.sqlite"
+        sqlite_db.init_db(replacement)
+        with sqlite_db.session(db_path) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        for suffix in ("-wal", "-shm"):
+            db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
+        replacement.replace(db_path)
+        with sqlite_db.read_session(db_path) as third:
+            count = third.execute("SELECT COUNT(*) FROM institutions").fetchone()[0]
+        assert third is not first
+        assert count == 0
+    finally:
+        sqlite_db.close_read_pool()